@@ -11,3 +11,9 @@ PageItem = TypeVar("PageItem")  # Generic type for an item from a paginated requ
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_WAIT_SECONDS = 3
 DEFAULT_RETRY_EXCEPTION_CODES = [429, 504]
+
+# keep-alive pool sizing for the underlying requests.Session. requests speaks
+# HTTP/1.1 only, so concurrent requests (e.g. a burst of order submissions from
+# a thread pool) each need their own kept-alive connection to avoid re-handshaking.
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
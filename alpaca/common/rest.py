@@ -1,16 +1,21 @@
 from collections import defaultdict
 from collections.abc import Callable
+import json
 import time
 import base64
+import threading
 from abc import ABC
 from typing import Any, Dict, List, Optional, Type, Union, Tuple, Iterator
 
 from pydantic import BaseModel
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from itertools import chain
 
 from alpaca.common.constants import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_RETRY_WAIT_SECONDS,
     DEFAULT_RETRY_EXCEPTION_CODES,
@@ -22,6 +27,35 @@ from alpaca.common.types import RawData, HTTPResult, Credentials
 from .constants import PageItem
 from .enums import PaginationType, BaseURL
 
+try:
+    # orjson parses large payloads (e.g. long bar histories) several times
+    # faster than the standard library, so use it when it is installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+_shared_session: Optional[Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> Session:
+    """Returns a process-wide session that clients can share.
+
+    Clients built with this session reuse the same pool of kept-alive connections,
+    so creating several clients (or helpers) does not pay a fresh TCP/TLS handshake
+    per client. The session is created lazily on first use.
+
+    Returns:
+        Session: The shared session
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = RESTClient._create_session()
+    return _shared_session
+
 
 class RESTClient(ABC):
     """Abstract base class for REST clients"""
@@ -39,6 +73,7 @@ class RESTClient(ABC):
         retry_attempts: Optional[int] = None,
         retry_wait_seconds: Optional[int] = None,
         retry_exception_codes: Optional[List[int]] = None,
+        session: Optional[Session] = None,
     ) -> None:
         """Abstract base class for REST clients. Handles submitting HTTP requests to
         Alpaca API endpoints.
@@ -56,6 +91,8 @@ class RESTClient(ABC):
             retry_attempts (Optional[int]): The number of times to retry a request that returns a RetryException.
             retry_wait_seconds (Optional[int]): The number of seconds to wait between requests before retrying.
             retry_exception_codes (Optional[List[int]]): The API exception codes to retry a request on.
+            session (Optional[Session]): An existing session to send requests through, e.g. the one returned by
+              get_shared_session(). A new pooled session is created if not provided.
         """
 
         self._api_key, self._secret_key, self._oauth_token = self._validate_credentials(
@@ -66,7 +103,9 @@ class RESTClient(ABC):
         self._sandbox: bool = sandbox
         self._use_basic_auth: bool = use_basic_auth
         self._use_raw_data: bool = raw_data
-        self._session: Session = Session()
+        self._session: Session = (
+            session if session is not None else self._create_session()
+        )
 
         # setting up request retry configurations
         self._retry: int = DEFAULT_RETRY_ATTEMPTS
@@ -82,6 +121,26 @@ class RESTClient(ABC):
         if retry_exception_codes:
             self._retry_codes = retry_exception_codes
 
+    @staticmethod
+    def _create_session() -> Session:
+        """Creates the HTTP session used for all requests made by this client.
+
+        The session keeps a pool of kept-alive connections per host large enough
+        that concurrent requests issued from multiple threads (e.g. several orders
+        submitted at once) reuse open connections instead of discarding them.
+
+        Returns:
+            Session: The configured session
+        """
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def _request(
         self,
         method: str,
@@ -206,8 +265,9 @@ class RESTClient(ABC):
 
             raise APIError(error, http_error) from http_error
 
-        if response.text != "":
-            return response.json()
+        # parse the raw bytes directly rather than decoding the body to text first
+        if response.content:
+            return _json_loads(response.content)
 
     def get(self, path: str, data: Optional[Union[dict, str]] = None, **kwargs) -> HTTPResult:
         """Performs a single GET request
@@ -1,7 +1,13 @@
-from typing import Union, Optional
+import sys
+from typing import Dict, Union, Optional
 from uuid import UUID
 from datetime import datetime
 
+# Keyword arguments for @dataclass that add __slots__ where supported (Python 3.10+).
+# Used on helper data classes that are created in bulk (bars, trades, articles, ...)
+# to drop the per-instance __dict__.
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def validate_uuid_id_param(
     id: Union[UUID, str],
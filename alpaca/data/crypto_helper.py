@@ -12,12 +12,24 @@ Example:
     >>> bars = helper.get_bars("BTC/USD", timeframe="1H", days_back=5)
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
+from requests import Session
+
+from alpaca.common.rest import get_shared_session
+from alpaca.common.utils import DATACLASS_SLOTS
 from alpaca.data.historical.crypto import CryptoHistoricalDataClient
+from alpaca.data.live.crypto import CryptoDataStream
 from alpaca.data.models import Bar, Quote, Snapshot, Trade
 from alpaca.data.requests import (
     CryptoBarsRequest,
@@ -28,9 +40,66 @@ from alpaca.data.requests import (
     CryptoTradesRequest,
 )
 from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+from alpaca.data.utils import bars_to_arrays
+
+# Maximum number of symbols the market data API accepts in a single request.
+MAX_SYMBOLS_PER_REQUEST = 200
+
+
+# Length of the aligned chunks closed bars are cached in on disk, per unit.
+# A timeframe is cached only if its bars tile a chunk exactly.
+_BAR_CACHE_CHUNKS = {
+    TimeFrameUnit.Minute: timedelta(hours=1),
+    TimeFrameUnit.Hour: timedelta(days=1),
+    TimeFrameUnit.Day: timedelta(days=30),
+}
+
+# How long after a bar closes before it is treated as final, since the API
+# can still fold late trades into it
+_BAR_SETTLE_DELAY = timedelta(minutes=1)
+
+# Default maximum number of chunk files kept in the bar cache directory
+DEFAULT_BAR_CACHE_MAX_ENTRIES = 4096
+
+# Fraction of the maximum entries kept when the bar cache overflows
+_BAR_CACHE_EVICT_TO = 0.9
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Default number of seconds a streamed quote is served before the latest
+# quote methods fall back to a REST request
+DEFAULT_STREAM_QUOTE_MAX_AGE = 10.0
 
 
-@dataclass
+def _as_utc(value: datetime) -> datetime:
+    """Return an aware UTC datetime, reading naive values as UTC like the API."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _bar_length(tf: TimeFrame) -> timedelta:
+    """Return the duration of one bar of a minute, hour or day timeframe."""
+    if tf.unit == TimeFrameUnit.Minute:
+        return timedelta(minutes=tf.amount)
+    if tf.unit == TimeFrameUnit.Hour:
+        return timedelta(hours=tf.amount)
+    return timedelta(days=tf.amount)
+
+
+def _is_cacheable(tf: TimeFrame) -> bool:
+    """Return whether bars of this timeframe can be cached in fixed chunks."""
+    chunk_len = _BAR_CACHE_CHUNKS.get(tf.unit)
+    return chunk_len is not None and chunk_len % _bar_length(tf) == timedelta(0)
+
+
+def _chunk_symbols(symbols: List[str]) -> Iterator[List[str]]:
+    """Split a symbol list into batches the API accepts in one request."""
+    for i in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST):
+        yield symbols[i : i + MAX_SYMBOLS_PER_REQUEST]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CryptoBarData:
     """Simplified cryptocurrency bar (OHLCV) data."""
 
@@ -60,7 +129,7 @@ class CryptoBarData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CryptoQuoteData:
     """Simplified cryptocurrency quote (bid/ask) data."""
 
@@ -84,7 +153,7 @@ class CryptoQuoteData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CryptoTradeData:
     """Simplified cryptocurrency trade (tick) data."""
 
@@ -106,7 +175,7 @@ class CryptoTradeData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CryptoSnapshotData:
     """Simplified cryptocurrency snapshot (latest market data)."""
 
@@ -175,6 +244,10 @@ class CryptoHelper:
         self,
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
+        session: Optional[Session] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_entries: int = DEFAULT_BAR_CACHE_MAX_ENTRIES,
+        stream_quote_max_age: float = DEFAULT_STREAM_QUOTE_MAX_AGE,
     ):
         """
         Initialize the CryptoHelper.
@@ -182,6 +255,14 @@ class CryptoHelper:
         Args:
             api_key: Alpaca API key (if None, loads from ALPACA_API_KEY env)
             secret_key: Alpaca secret key (if None, loads from env)
+            session: HTTP session to send requests through (defaults to a
+                session shared by all helpers, so connections are reused)
+            cache_dir: Directory for caching closed historical bars on disk
+                (e.g. "~/.cache/alpaca/bars"). Caching is disabled if None.
+            cache_max_entries: Maximum number of cached bar chunks to keep;
+                the least recently used are removed first
+            stream_quote_max_age: Seconds a quote received from stream_quotes
+                is served before falling back to a REST request
 
         Note:
             Crypto data does not require authentication, but authenticating
@@ -189,12 +270,29 @@ class CryptoHelper:
         """
         self.api_key = api_key or os.getenv("ALPACA_API_KEY")
         self.secret_key = secret_key or os.getenv("ALPACA_SECRET_KEY")
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.cache_max_entries = cache_max_entries
+        # Chunk files per cache directory, counted as they are written so the
+        # directory is only scanned when it overflows
+        self._bar_cache_counts: Dict[str, int] = {}
+        self._bar_cache_lock = threading.Lock()
 
         self.client = CryptoHistoricalDataClient(
             api_key=self.api_key,
             secret_key=self.secret_key,
+            session=session if session is not None else get_shared_session(),
         )
 
+        # Live quote stream state (see stream_quotes)
+        self._stream: Optional[CryptoDataStream] = None
+        self._stream_thread: Optional[threading.Thread] = None
+        # (handler, symbols) of every stream_quotes call, replayed on restart
+        self._stream_subscriptions: List[Tuple[Callable, Tuple[str, ...]]] = []
+        self._stream_lock = threading.Lock()
+        self._stream_quote_max_age = stream_quote_max_age
+        # symbol -> (monotonic receive time, quote)
+        self._streamed_quotes: Dict[str, Tuple[float, CryptoQuoteData]] = {}
+
     def _parse_timeframe(self, timeframe: str) -> TimeFrame:
         """
         Parse a simple timeframe string into a TimeFrame object.
@@ -240,7 +338,17 @@ class CryptoHelper:
 
         Returns:
             CryptoQuoteData with latest bid/ask, or None if not available
+
+        Note:
+            If the symbol is subscribed via stream_quotes, the most recent
+            streamed quote is returned without making a request, as long as
+            the stream is running and the quote is newer than
+            ``stream_quote_max_age``.
         """
+        streamed = self._get_streamed_quote(symbol)
+        if streamed is not None:
+            return streamed
+
         request = CryptoLatestQuoteRequest(symbol_or_symbols=symbol)
         response = self.client.get_crypto_latest_quote(request)
 
@@ -254,19 +362,111 @@ class CryptoHelper:
         """
         Get the latest quotes for multiple cryptocurrencies.
 
+        All symbols are fetched in a single request (split into batches of
+        MAX_SYMBOLS_PER_REQUEST if the list is longer). Symbols with a recent
+        quote from stream_quotes are served from the stream and not requested.
+
         Args:
             symbols: List of crypto symbols
 
         Returns:
             Dictionary mapping symbol to CryptoQuoteData
         """
-        request = CryptoLatestQuoteRequest(symbol_or_symbols=symbols)
-        response = self.client.get_crypto_latest_quote(request)
+        result = {}
+        for symbol in symbols:
+            streamed = self._get_streamed_quote(symbol)
+            if streamed is not None:
+                result[symbol] = streamed
+        missing = [symbol for symbol in symbols if symbol not in result]
+        for batch in _chunk_symbols(missing):
+            request = CryptoLatestQuoteRequest(symbol_or_symbols=batch)
+            response = self.client.get_crypto_latest_quote(request)
+            for symbol, quote in response.items():
+                result[symbol] = CryptoQuoteData.from_quote(symbol, quote)
+
+        return result
+
+    def _get_streamed_quote(self, symbol: str) -> Optional[CryptoQuoteData]:
+        """Return the streamed quote for symbol if the stream is live and fresh."""
+        if self._stream_thread is None or not self._stream_thread.is_alive():
+            return None
+
+        entry = self._streamed_quotes.get(symbol)
+        if entry is None:
+            return None
+
+        received_at, quote = entry
+        if time.monotonic() - received_at > self._stream_quote_max_age:
+            return None
+        return quote
+
+    def stream_quotes(
+        self,
+        symbols: List[str],
+        on_quote: Optional[Callable[[CryptoQuoteData], None]] = None,
+    ) -> None:
+        """
+        Subscribe to live quotes over a WebSocket instead of polling.
+
+        The stream runs in a background thread and keeps the latest quote for
+        each symbol in memory, so get_latest_quote and get_latest_quotes read
+        from it without making REST requests. Quotes older than
+        ``stream_quote_max_age``, or left over after the stream thread has
+        exited (e.g. on an authentication failure), are not served and the
+        REST endpoint is used instead. Can be called again to add symbols to
+        a running stream; if the stream thread has exited, calling it again
+        starts a new stream with every symbol subscribed so far.
+
+        Args:
+            symbols: List of crypto symbols to subscribe to
+            on_quote: Optional callback invoked with each new CryptoQuoteData
+
+        Example:
+            >>> helper.stream_quotes(["BTC/USD", "ETH/USD"])
+            >>> quote = helper.get_latest_quote("BTC/USD")  # From memory
+            >>> helper.stop_stream()
+        """
+
+        async def handle_quote(quote: Quote) -> None:
+            data = CryptoQuoteData.from_quote(quote.symbol, quote)
+            self._streamed_quotes[quote.symbol] = (time.monotonic(), data)
+            if on_quote is not None:
+                on_quote(data)
+
+        with self._stream_lock:
+            self._stream_subscriptions.append((handle_quote, tuple(symbols)))
+
+            if self._stream_thread is not None and self._stream_thread.is_alive():
+                self._stream.subscribe_quotes(handle_quote, *symbols)
+                return
+
+            # Not started yet, or the previous stream exited: start a new one
+            self._stream = CryptoDataStream(self.api_key, self.secret_key)
+            for handler, subscribed in self._stream_subscriptions:
+                self._stream.subscribe_quotes(handler, *subscribed)
 
-        return {
-            symbol: CryptoQuoteData.from_quote(symbol, quote)
-            for symbol, quote in response.items()
-        }
+            self._stream_thread = threading.Thread(
+                target=self._stream.run, daemon=True
+            )
+            self._stream_thread.start()
+
+    def stop_stream(self) -> None:
+        """
+        Stop the live quote stream started by stream_quotes.
+
+        Subsequent latest quote calls go back to REST requests.
+        """
+        with self._stream_lock:
+            # Only a stream whose thread is still running has a loop to stop
+            if self._stream_thread is not None and self._stream_thread.is_alive():
+                self._stream.stop()
+            if self._stream_thread is not None:
+                self._stream_thread.join(timeout=5)
+
+            self._stream = None
+            self._stream_thread = None
+            self._stream_subscriptions.clear()
+            self._streamed_quotes.clear()
 
     def get_latest_bar(self, symbol: str) -> Optional[CryptoBarData]:
         """
@@ -336,6 +536,25 @@ class CryptoHelper:
             end = end or datetime.now()
             start = end - timedelta(days=days_back)
 
+        if (
+            self.cache_dir
+            and start is not None
+            and limit is None
+            and _is_cacheable(tf)
+        ):
+            return self._get_bars_cached(symbol, tf, start, end)
+
+        return self._fetch_bars(symbol, tf, start, end, limit)
+
+    def _fetch_bars(
+        self,
+        symbol: str,
+        tf: TimeFrame,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int] = None,
+    ) -> List[CryptoBarData]:
+        """Request bars for a single symbol from the API."""
         request = CryptoBarsRequest(
             symbol_or_symbols=symbol,
             timeframe=tf,
@@ -354,6 +573,264 @@ class CryptoHelper:
             for bar in response[symbol]
         ]
 
+    def _get_bars_cached(
+        self,
+        symbol: str,
+        tf: TimeFrame,
+        start: datetime,
+        end: Optional[datetime],
+    ) -> List[CryptoBarData]:
+        """
+        Get bars, serving the closed part of the range from the disk cache.
+
+        Bars that have already closed never change, so they are cached on disk
+        in fixed chunks aligned to ``_BAR_CACHE_CHUNKS``. A range reads every
+        closed chunk it overlaps from the cache (fetching the chunk once on a
+        miss) and only requests the bars after the last closed chunk, so
+        rolling ``days_back`` windows keep reusing the same entries.
+        """
+        start = _as_utc(start)
+        end = _as_utc(end) if end is not None else None
+        chunk_len = _BAR_CACHE_CHUNKS[tf.unit]
+
+        # Chunks ending by this point only hold bars that have closed
+        settled = (
+            datetime.now(timezone.utc) - _bar_length(tf) - _BAR_SETTLE_DELAY
+        )
+
+        chunk_start = _EPOCH + (start - _EPOCH) // chunk_len * chunk_len
+        bars: List[CryptoBarData] = []
+        while chunk_start + chunk_len <= settled and (
+            end is None or chunk_start <= end
+        ):
+            chunk_end = chunk_start + chunk_len
+            for bar in self._load_or_fetch_chunk(symbol, tf, chunk_start, chunk_end):
+                timestamp = _as_utc(bar.timestamp)
+                if start <= timestamp and (end is None or timestamp <= end):
+                    bars.append(bar)
+            chunk_start = chunk_end
+
+        if end is None or chunk_start <= end:
+            bars.extend(self._fetch_bars(symbol, tf, max(start, chunk_start), end))
+
+        return bars
+
+    def _load_or_fetch_chunk(
+        self,
+        symbol: str,
+        tf: TimeFrame,
+        chunk_start: datetime,
+        chunk_end: datetime,
+    ) -> List[CryptoBarData]:
+        """Read a closed cache chunk from disk, fetching it on a miss."""
+        key = f"{symbol}|{tf.value}|{chunk_start.isoformat()}"
+        path = os.path.join(
+            self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".json"
+        )
+
+        # Entries hold plain rows rather than pickled objects, so they survive
+        # changes to CryptoBarData and loading one never runs arbitrary code
+        try:
+            with open(path, "r") as f:
+                rows = json.load(f)
+            bars = [
+                CryptoBarData(symbol, datetime.fromisoformat(row[0]), *row[1:])
+                for row in rows
+            ]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Truncated by an interrupted write or written in another format
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        else:
+            try:
+                # Mark the entry as recently used for eviction
+                os.utime(path)
+            except OSError:
+                pass
+            return bars
+
+        bars = self._fetch_bars(
+            symbol, tf, chunk_start, chunk_end - timedelta(microseconds=1)
+        )
+        rows = [
+            [
+                bar.timestamp.isoformat(),
+                bar.open,
+                bar.high,
+                bar.low,
+                bar.close,
+                bar.volume,
+                bar.trade_count,
+                bar.vwap,
+            ]
+            for bar in bars
+        ]
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(rows, f)
+        os.replace(tmp_path, path)
+        self._record_bar_cache_write()
+
+        return bars
+
+    def _record_bar_cache_write(self) -> None:
+        """Count a newly written chunk, evicting once there are too many."""
+        with self._bar_cache_lock:
+            count = self._bar_cache_counts.get(self.cache_dir)
+            if count is None:
+                # Seed the count once; it already includes the new file
+                count = len(self._scan_bar_cache())
+            else:
+                count += 1
+
+            if count > self.cache_max_entries:
+                count = self._evict_bar_cache()
+            self._bar_cache_counts[self.cache_dir] = count
+
+    def _scan_bar_cache(self) -> List[Tuple[float, str]]:
+        """Return (last use time, path) of every chunk in the cache directory."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def _evict_bar_cache(self) -> int:
+        """
+        Remove the least recently used chunks and return how many remain.
+
+        Evicts down to _BAR_CACHE_EVICT_TO of cache_max_entries, so a full
+        cache is scanned once per batch of writes rather than on every write.
+        """
+        entries = self._scan_bar_cache()
+        keep = int(self.cache_max_entries * _BAR_CACHE_EVICT_TO)
+        excess = len(entries) - keep
+        if excess <= 0:
+            return len(entries)
+
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Already evicted by another thread or process
+                pass
+        return keep
+
+    def get_bars_arrays(
+        self,
+        symbol: str,
+        timeframe: str = "1D",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get historical bars as numpy columns instead of a list of objects.
+
+        Args:
+            symbol: Crypto symbol (e.g., "BTC/USD")
+            timeframe: Simple timeframe string (e.g., "1Min", "1H", "1D")
+            start: Start datetime (if None and days_back provided, auto-calc)
+            end: End datetime (defaults to now)
+            days_back: Number of days to look back (alternative to start/end)
+            limit: Maximum number of bars to return
+
+        Returns:
+            Dict of column name to array, see bars_to_arrays
+
+        Example:
+            >>> cols = helper.get_bars_arrays("BTC/USD", "1H", days_back=1)
+            >>> returns = np.diff(cols["close"]) / cols["close"][:-1]
+        """
+        return bars_to_arrays(
+            self.get_bars(
+                symbol,
+                timeframe=timeframe,
+                start=start,
+                end=end,
+                days_back=days_back,
+                limit=limit,
+            )
+        )
+
+    @staticmethod
+    def compute_returns(bars_arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Compute the percent change from open to close of every bar.
+
+        Args:
+            bars_arrays: Columns from get_bars_arrays or bars_to_arrays
+
+        Returns:
+            float64 array of per-bar percent changes
+
+        Example:
+            >>> cols = helper.get_bars_arrays("BTC/USD", "1H", days_back=1)
+            >>> pct = helper.compute_returns(cols)
+        """
+        opens = bars_arrays["open"]
+        return (bars_arrays["close"] - opens) / opens * 100
+
+    async def aget_bars(
+        self,
+        symbol: str,
+        timeframe: str = "1D",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[CryptoBarData]:
+        """
+        Async variant of get_bars.
+
+        The request runs in the event loop's default executor, so several
+        independent fetches can be awaited together with asyncio.gather and
+        overlap on the client's pooled connections.
+
+        Args:
+            symbol: Crypto symbol (e.g., "BTC/USD")
+            timeframe: Simple timeframe string (e.g., "1Min", "1H", "1D")
+            start: Start datetime (if None and days_back provided, auto-calc)
+            end: End datetime (defaults to now)
+            days_back: Number of days to look back (alternative to start/end)
+            limit: Maximum number of bars to return
+
+        Returns:
+            List of CryptoBarData objects
+
+        Example:
+            >>> results = await asyncio.gather(
+            ...     helper.aget_bars("BTC/USD", timeframe="1H", limit=1),
+            ...     helper.aget_bars("BTC/USD", timeframe="1D", limit=1),
+            ... )
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.get_bars,
+                symbol,
+                timeframe=timeframe,
+                start=start,
+                end=end,
+                days_back=days_back,
+                limit=limit,
+            ),
+        )
+
     def get_bars_multi(
         self,
         symbols: List[str],
@@ -366,6 +843,9 @@ class CryptoHelper:
         """
         Get historical bars for multiple cryptocurrencies.
 
+        All symbols are fetched in a single request (split into batches of
+        MAX_SYMBOLS_PER_REQUEST if the list is longer).
+
         Args:
             symbols: List of crypto symbols
             timeframe: Simple timeframe string (e.g., "1Min", "1H", "1D")
@@ -383,20 +863,20 @@ class CryptoHelper:
             end = end or datetime.now()
             start = end - timedelta(days=days_back)
 
-        request = CryptoBarsRequest(
-            symbol_or_symbols=symbols,
-            timeframe=tf,
-            start=start,
-            end=end,
-            limit=limit,
-        )
-
-        response = self.client.get_crypto_bars(request)
-
-        return {
-            symbol: [CryptoBarData.from_bar(symbol, bar) for bar in bars]
-            for symbol, bars in response.items()
-        }
+        result = {}
+        for batch in _chunk_symbols(symbols):
+            request = CryptoBarsRequest(
+                symbol_or_symbols=batch,
+                timeframe=tf,
+                start=start,
+                end=end,
+                limit=limit,
+            )
+            response = self.client.get_crypto_bars(request)
+            for symbol, bars in response.items():
+                result[symbol] = [CryptoBarData.from_bar(symbol, bar) for bar in bars]
+
+        return result
 
     def get_quotes(
         self,
@@ -511,16 +991,20 @@ class CryptoHelper:
         """
         Get snapshots for multiple cryptocurrencies.
 
+        All symbols are fetched in a single request (split into batches of
+        MAX_SYMBOLS_PER_REQUEST if the list is longer).
+
         Args:
             symbols: List of crypto symbols
 
         Returns:
             Dictionary mapping symbol to CryptoSnapshotData
         """
-        request = CryptoSnapshotRequest(symbol_or_symbols=symbols)
-        response = self.client.get_crypto_snapshot(request)
-
-        return {
-            symbol: CryptoSnapshotData.from_snapshot(symbol, snapshot)
-            for symbol, snapshot in response.items()
-        }
+        result = {}
+        for batch in _chunk_symbols(symbols):
+            request = CryptoSnapshotRequest(symbol_or_symbols=batch)
+            response = self.client.get_crypto_snapshot(request)
+            for symbol, snapshot in response.items():
+                result[symbol] = CryptoSnapshotData.from_snapshot(symbol, snapshot)
+
+        return result
@@ -1,5 +1,7 @@
 from typing import Dict, Optional, Union
 
+from requests import Session
+
 from alpaca.common.enums import BaseURL
 from alpaca.common.rest import RESTClient
 from alpaca.common.types import Credentials, RawData
@@ -43,6 +45,7 @@ class CryptoHistoricalDataClient(RESTClient):
         url_override: Optional[str] = None,
         use_basic_auth: bool = False,
         sandbox: bool = False,
+        session: Optional[Session] = None,
     ) -> None:
         """
         Instantiates a Historical Data Client for Crypto Data.
@@ -58,6 +61,7 @@ class CryptoHistoricalDataClient(RESTClient):
             use_basic_auth (bool, optional): If true, API requests will use basic authorization headers. Set to true if using
               broker api sandbox credentials
             sandbox (bool): True if using sandbox mode. Defaults to False.
+            session (Optional[Session]): An existing session to send requests through. Defaults to None.
         """
 
         base_url = (
@@ -75,6 +79,7 @@ class CryptoHistoricalDataClient(RESTClient):
             sandbox=sandbox,
             raw_data=raw_data,
             use_basic_auth=use_basic_auth,
+            session=session,
         )
 
     def get_crypto_bars(
@@ -1,9 +1,11 @@
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
+
+from requests import Session
 
 from alpaca.common.enums import BaseURL
 from alpaca.common.rest import RESTClient
 from alpaca.common.types import RawData
-from alpaca.data.models.news import NewsSet
+from alpaca.data.models.news import News, NewsSet
 from alpaca.data.requests import NewsRequest
 
 
@@ -21,6 +23,7 @@ class NewsClient(RESTClient):
         use_basic_auth: bool = False,
         raw_data: bool = False,
         url_override: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> None:
         """
         Instantiates a Historical Data Client.
@@ -34,6 +37,7 @@ class NewsClient(RESTClient):
               methods. Defaults to False. This has not been implemented yet.
             url_override (Optional[str], optional): If specified allows you to override the base url the client points
               to for proxy/testing.
+            session (Optional[Session]): An existing session to send requests through. Defaults to None.
         """
         super().__init__(
             api_key=api_key,
@@ -44,6 +48,7 @@ class NewsClient(RESTClient):
             base_url=url_override if url_override is not None else BaseURL.DATA,
             sandbox=False,
             raw_data=raw_data,
+            session=session,
         )
 
     def get_news(self, request_params: NewsRequest) -> Union[RawData, NewsSet]:
@@ -61,3 +66,37 @@ class NewsClient(RESTClient):
             return raw_news
 
         return NewsSet(raw_news)
+
+    def iter_news(self, request_params: NewsRequest) -> Iterator[News]:
+        """Yields news articles one page at a time.
+
+        Unlike get_news, only a single page of the response is held in memory at
+        once, which keeps memory flat for long date ranges or large limits.
+
+        Args:
+            request_params (NewsRequest): The request params to filter the news data
+
+        Yields:
+            News: The news articles, in the order returned by the API
+        """
+        params = request_params.to_request_fields()
+        remaining = params.get("limit")
+        page_token = params.get("page_token")
+
+        while True:
+            params["limit"] = min(remaining, 50) if remaining else 50
+            params["page_token"] = page_token
+
+            response = self.get(path="/news", data=params)
+            articles = response.get("news", [])
+            for article in articles:
+                yield News(raw_data=article)
+
+            if remaining:
+                remaining -= len(articles)
+                if remaining < 1:
+                    break
+
+            page_token = response.get("next_page_token")
+            if page_token is None:
+                break
@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import Dict, Optional, Union
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from requests import Session
 
 from alpaca.common.enums import BaseURL
 from alpaca.common.rest import RESTClient
@@ -37,6 +39,7 @@ class OptionHistoricalDataClient(RESTClient):
         raw_data: bool = False,
         url_override: Optional[str] = None,
         sandbox: bool = False,
+        session: Optional[Session] = None,
     ) -> None:
         """
         Instantiates a Historical Data Client.
@@ -52,6 +55,7 @@ class OptionHistoricalDataClient(RESTClient):
             url_override (Optional[str], optional): If specified allows you to override the base url the client points
               to for proxy/testing.
             sandbox (bool): True if using sandbox mode. Defaults to False.
+            session (Optional[Session]): An existing session to send requests through. Defaults to None.
         """
 
         base_url = (
@@ -69,6 +73,7 @@ class OptionHistoricalDataClient(RESTClient):
             base_url=base_url,
             sandbox=sandbox,
             raw_data=raw_data,
+            session=session,
         )
 
     def get_option_bars(self, request_params: OptionBarsRequest) -> Union[BarSet, RawData]:
@@ -224,3 +229,42 @@ class OptionHistoricalDataClient(RESTClient):
             return raw_snapshots
 
         return parse_obj_as_symbol_dict(OptionsSnapshot, raw_snapshots)
+
+    def iter_option_chain(
+        self, request_params: OptionChainRequest
+    ) -> Iterator[Tuple[str, Union[OptionsSnapshot, RawData]]]:
+        """Yields the contracts of an option chain one page at a time.
+
+        Unlike get_option_chain, only a single page of the response is held in
+        memory at once, so chains with thousands of contracts can be processed
+        with flat memory use. Each page is requested only once the previous one
+        has been consumed. Contracts without a snapshot are skipped.
+
+        Args:
+            request_params (OptionChainRequest): The request object for retrieving snapshot data.
+
+        Yields:
+            Tuple[str, Union[OptionsSnapshot, RawData]]: The contract symbol and its
+            snapshot, either in raw or wrapped form
+        """
+        params = request_params.to_request_fields()
+        del params["underlying_symbol"]
+        path = f"/options/snapshots/{request_params.underlying_symbol}"
+        page_token = params.get("page_token")
+        params["limit"] = 1000
+
+        while True:
+            params["page_token"] = page_token
+
+            response = self.get(path=path, data=params)
+            for symbol, raw_snapshot in (response.get("snapshots") or {}).items():
+                if raw_snapshot is None:
+                    continue
+                if self._use_raw_data:
+                    yield symbol, raw_snapshot
+                else:
+                    yield symbol, OptionsSnapshot(symbol, raw_snapshot)
+
+            page_token = response.get("next_page_token")
+            if page_token is None:
+                break
@@ -1,6 +1,8 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
+
+from requests import Session
 
 from alpaca.common.constants import DATA_V2_MAX_LIMIT
 from alpaca.common.enums import BaseURL
@@ -38,6 +40,7 @@ class StockHistoricalDataClient(RESTClient):
         raw_data: bool = False,
         url_override: Optional[str] = None,
         sandbox: bool = False,
+        session: Optional[Session] = None,
     ) -> None:
         """
         Instantiates a Historical Data Client.
@@ -53,6 +56,7 @@ class StockHistoricalDataClient(RESTClient):
             url_override (Optional[str], optional): If specified allows you to override the base url the client points
               to for proxy/testing.
             sandbox (bool): True if using sandbox mode. Defaults to False.
+            session (Optional[Session]): An existing session to send requests through. Defaults to None.
         """
 
         base_url = (
@@ -70,6 +74,7 @@ class StockHistoricalDataClient(RESTClient):
             base_url=base_url,
             sandbox=sandbox,
             raw_data=raw_data,
+            session=session,
         )
 
     def get_stock_bars(self, request_params: StockBarsRequest) -> Union[BarSet, RawData]:
@@ -93,6 +98,46 @@ class StockHistoricalDataClient(RESTClient):
 
         return BarSet(raw_bars)
 
+    def iter_stock_bars(self, request_params: StockBarsRequest) -> Iterator[Bar]:
+        """Yields bars one page at a time.
+
+        Unlike get_stock_bars, only a single page of the response is held in memory
+        at once, so long ranges of fine-grained bars can be processed with flat
+        memory use. Each page is requested only once the previous one has been
+        consumed.
+
+        Args:
+            request_params (StockBarsRequest): The request object for retrieving stock bar data.
+
+        Yields:
+            Bar: The bars, in the order returned by the API
+        """
+        params = request_params.to_request_fields()
+        remaining = params.get("limit")
+        page_token = params.get("page_token")
+
+        while True:
+            params["limit"] = (
+                min(remaining, DATA_V2_MAX_LIMIT) if remaining else DATA_V2_MAX_LIMIT
+            )
+            params["page_token"] = page_token
+
+            response = self.get(path="/stocks/bars", data=params)
+            count = 0
+            for symbol, bars in (response.get("bars") or {}).items():
+                for bar in bars:
+                    count += 1
+                    yield Bar(symbol, bar)
+
+            if remaining:
+                remaining -= count
+                if remaining < 1:
+                    break
+
+            page_token = response.get("next_page_token")
+            if page_token is None:
+                break
+
     def get_stock_quotes(self, request_params: StockQuotesRequest) -> Union[QuoteSet, RawData]:
         """Returns level 1 quote data over a given time period for a security or list of securities.
 
@@ -6,19 +6,24 @@ without requiring complex request objects. It handles environment variables,
 type conversions, and provides clean dataclass-based responses.
 """
 
+import asyncio
 import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from functools import partial
+from typing import Iterator, List, Optional
 
 from dotenv import load_dotenv
+from requests import Session
 
+from alpaca.common.rest import get_shared_session
+from alpaca.common.utils import DATACLASS_SLOTS
 from alpaca.data.historical.news import NewsClient
 from alpaca.data.models.news import News, NewsSet
 from alpaca.data.requests import NewsRequest
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NewsArticle:
     """
     Simplified news article data.
@@ -105,6 +110,7 @@ class NewsHelper:
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         paper: bool = False,
+        session: Optional[Session] = None,
     ):
         """
         Initialize NewsHelper.
@@ -113,6 +119,8 @@ class NewsHelper:
             api_key: Alpaca API key (if None, loads from APCA_API_KEY_ID env var)
             secret_key: Alpaca secret key (if None, loads from APCA_API_SECRET_KEY env var)
             paper: Whether to use paper trading (default: False, not applicable for news data)
+            session: HTTP session to send requests through (defaults to a
+                session shared by all helpers, so connections are reused)
 
         Raises:
             ValueError: If API credentials are not provided and not found in environment
@@ -134,6 +142,43 @@ class NewsHelper:
         self._client = NewsClient(
             api_key=self._api_key,
             secret_key=self._secret_key,
+            session=session if session is not None else get_shared_session(),
+        )
+
+    @staticmethod
+    def _build_news_request(
+        symbols: Optional[List[str]],
+        days_back: Optional[int],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        include_content: bool,
+        exclude_contentless: bool,
+        sort: str,
+    ) -> NewsRequest:
+        """Build a NewsRequest from the simplified helper arguments."""
+        # Handle date range
+        if days_back is not None:
+            end = end or datetime.now(timezone.utc)
+            start = end - timedelta(days=days_back)
+        elif start is None:
+            # Default to last 7 days if no time range specified
+            end = end or datetime.now(timezone.utc)
+            start = end - timedelta(days=7)
+
+        # Convert symbols list to comma-separated string
+        symbols_str = None
+        if symbols:
+            symbols_str = ",".join(symbols)
+
+        return NewsRequest(
+            symbols=symbols_str,
+            start=start,
+            end=end,
+            limit=limit,
+            include_content=include_content,
+            exclude_contentless=exclude_contentless,
+            sort=sort,
         )
 
     def get_news(
@@ -173,23 +218,9 @@ class NewsHelper:
             >>> end = datetime(2024, 1, 31, tzinfo=timezone.utc)
             >>> articles = helper.get_news(symbols=["NVDA"], start=start, end=end)
         """
-        # Handle date range
-        if days_back is not None:
-            end = end or datetime.now(timezone.utc)
-            start = end - timedelta(days=days_back)
-        elif start is None:
-            # Default to last 7 days if no time range specified
-            end = end or datetime.now(timezone.utc)
-            start = end - timedelta(days=7)
-
-        # Convert symbols list to comma-separated string
-        symbols_str = None
-        if symbols:
-            symbols_str = ",".join(symbols)
-
-        # Create request
-        request = NewsRequest(
-            symbols=symbols_str,
+        request = self._build_news_request(
+            symbols=symbols,
+            days_back=days_back,
             start=start,
             end=end,
             limit=limit,
@@ -362,6 +393,48 @@ class NewsHelper:
             sort="desc",
         )
 
+    def stream_search_news(
+        self,
+        symbols: List[str],
+        days_back: int = 30,
+        limit: int = 100,
+        include_content: bool = True,
+    ) -> Iterator[NewsArticle]:
+        """
+        Search for news like search_news, yielding articles one at a time.
+
+        Pages are fetched as the iterator is consumed and only one page is
+        held in memory at a time, so large searches can be aggregated without
+        building the full result list.
+
+        Args:
+            symbols: List of ticker symbols to search for
+            days_back: Number of days back to search (default: 30)
+            limit: Maximum number of articles to return (default: 100)
+            include_content: Whether to include full article content (default: True)
+
+        Yields:
+            NewsArticle objects, newest first
+
+        Example:
+            >>> from collections import Counter
+            >>> articles = helper.stream_search_news(["NVDA"], days_back=30)
+            >>> sources = Counter(article.source for article in articles)
+        """
+        request = self._build_news_request(
+            symbols=symbols,
+            days_back=days_back,
+            start=None,
+            end=None,
+            limit=limit,
+            include_content=include_content,
+            exclude_contentless=False,
+            sort="desc",
+        )
+
+        for news_item in self._client.iter_news(request):
+            yield NewsArticle.from_news(news_item)
+
     def get_multi_symbol_news(
         self,
         symbols: List[str],
@@ -372,7 +445,8 @@ class NewsHelper:
         Get news for multiple symbols efficiently.
 
         Retrieves news that mentions any of the provided symbols. Useful for
-        monitoring a portfolio or watchlist.
+        monitoring a portfolio or watchlist. All symbols are sent in a single
+        request rather than one request per symbol.
 
         Args:
             symbols: List of ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"])
@@ -396,3 +470,37 @@ class NewsHelper:
             include_content=True,
             sort="desc",
         )
+
+    async def aget_multi_symbol_news(
+        self,
+        symbols: List[str],
+        days_back: int = 7,
+        limit: int = 50,
+    ) -> List[NewsArticle]:
+        """
+        Async variant of get_multi_symbol_news.
+
+        The single request runs in the event loop's default executor, so it can
+        be awaited alongside other fetches with asyncio.gather.
+
+        Args:
+            symbols: List of ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"])
+            days_back: Number of days back to fetch news (default: 7)
+            limit: Maximum number of articles to return (default: 50)
+
+        Returns:
+            List of NewsArticle objects
+
+        Example:
+            >>> articles = await helper.aget_multi_symbol_news(["AAPL", "MSFT"])
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.get_multi_symbol_news,
+                symbols,
+                days_back=days_back,
+                limit=limit,
+            ),
+        )
@@ -6,19 +6,69 @@ with a single call, eliminating the need to manage multiple clients and requests
 """
 
 import os
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
-
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+from requests import Session
+
+from alpaca.common.rest import get_shared_session
+from alpaca.common.types import RawData
+from alpaca.common.utils import DATACLASS_SLOTS
 from alpaca.data.historical.option import OptionHistoricalDataClient
 from alpaca.data.requests import OptionSnapshotRequest
 
+# Default number of seconds an option chain is served from cache
+DEFAULT_CHAIN_CACHE_TTL = 30.0
+
+# Maximum number of (underlying, expiration) chains kept in the cache
+CHAIN_CACHE_MAXSIZE = 128
+
+# Shares of the underlying controlled by one standard equity option contract
+CONTRACT_MULTIPLIER = 100
+
+# Maximum number of contract symbols the snapshots endpoint accepts per request
+MAX_SYMBOLS_PER_REQUEST = 100
+
+# Upper bound on snapshot requests sent at once for long symbol lists
+MAX_CONCURRENT_REQUESTS = 8
+
+# Offsets of the fixed-width tail of an OCC symbol: YYMMDD, C/P, 8-digit strike
+_OCC_SUFFIX_LEN = 15
+_DATE_START = -15
+_TYPE_INDEX = -9
+_STRIKE_START = -8
+_OPTION_TYPES = {"C": "call", "P": "put"}
 
-@dataclass
+# Stand-in for a snapshot section (quote, trade, greeks) the API left out
+_EMPTY: dict = {}
+
+# Snapshot sections that make a contract worth returning; snapshots with none
+# of them (illiquid strikes with no quote, trade or greeks) are skipped
+_SNAPSHOT_DATA_KEYS = frozenset(
+    ("latestQuote", "latestTrade", "greeks", "impliedVolatility")
+)
+
+# Same timestamp parsing the SDK models apply (handles nanosecond precision)
+_validate_timestamp = TypeAdapter(datetime).validate_python
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class OptionData:
     """
     Complete option information in a single, easy-to-use object.
 
+    Instances are immutable, since cached option chains hand the same objects
+    to every caller.
+
     Attributes:
         symbol: The option contract symbol
         strike: Strike price
@@ -86,7 +136,7 @@ class OptionData:
     def __post_init__(self):
         """Calculate mid price if not provided."""
         if self.mid is None and self.bid is not None and self.ask is not None:
-            self.mid = (self.bid + self.ask) / 2
+            object.__setattr__(self, "mid", (self.bid + self.ask) / 2)
 
     def __repr__(self) -> str:
         iv_str = f"{self.implied_volatility:.2%}" if self.implied_volatility else "N/A"
@@ -99,6 +149,15 @@ class OptionData:
         )
 
 
+# DataFrame columns for get_option_chain_df; numeric ones are float64 with NaN gaps
+_CHAIN_COLUMNS = [field.name for field in fields(OptionData)]
+_NUMERIC_CHAIN_COLUMNS = frozenset(
+    column
+    for column in _CHAIN_COLUMNS
+    if column not in ("symbol", "expiration", "option_type", "timestamp")
+)
+
+
 class OptionHelper:
     """
     Simplified interface for option data.
@@ -133,6 +192,8 @@ class OptionHelper:
         secret_key: Optional[str] = None,
         oauth_token: Optional[str] = None,
         sandbox: bool = False,
+        session: Optional[Session] = None,
+        chain_cache_ttl: float = DEFAULT_CHAIN_CACHE_TTL,
     ):
         """
         Initialize the Option Helper.
@@ -145,6 +206,10 @@ class OptionHelper:
             secret_key: Alpaca API secret key (defaults to ALPACA_SECRET_KEY env var)
             oauth_token: OAuth token (alternative to api_key/secret_key)
             sandbox: Use sandbox environment (defaults to ALPACA_PAPER env var or False)
+            session: HTTP session to send requests through (defaults to a
+                session shared by all helpers, so connections are reused)
+            chain_cache_ttl: Seconds to reuse a fetched option chain for the
+                same underlying and expiration (0 disables caching)
 
         Example:
             ```python
@@ -173,12 +238,28 @@ class OptionHelper:
             secret_key=secret_key,
             oauth_token=oauth_token,
             sandbox=sandbox,
+            session=session if session is not None else get_shared_session(),
+            # Snapshots are read straight from the response, and only for the
+            # contracts we keep
+            raw_data=True,
         )
 
+        self._chain_cache_ttl = chain_cache_ttl
+        # (underlying, expiration) -> (expiry time, chain), least recently used first
+        self._chain_cache = OrderedDict()
+        # Guards the cache so scanner threads can share one helper
+        self._chain_lock = threading.Lock()
+
+        # symbol -> pending get_option result, shared by concurrent callers
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
     def get_option(self, symbol: str) -> Optional[OptionData]:
         """
         Get complete option information with a single call.
 
+        Threads asking for the same symbol at the same time share one request.
+
         Args:
             symbol: Option contract symbol (e.g., "AAPL250117C00150000")
 
@@ -193,18 +274,43 @@ class OptionHelper:
                 print(f"Delta: {data.delta}, IV: {data.implied_volatility:.2%}")
             ```
         """
-        result = self.get_options([symbol])
-        return result[0] if result else None
+        # Concurrent lookups of the same symbol share one in-flight request
+        with self._inflight_lock:
+            future = self._inflight.get(symbol)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[symbol] = Future()
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = self.get_options([symbol])
+            data = result[0] if result else None
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                del self._inflight[symbol]
 
     def get_options(self, symbols: List[str]) -> List[OptionData]:
         """
         Get complete information for multiple options with a single call.
 
+        Symbols go into one snapshot request (split into batches of
+        MAX_SYMBOLS_PER_REQUEST, fetched concurrently, if the list is longer),
+        and each snapshot already carries the latest quote, trade and greeks,
+        so no per-symbol or per-field requests are made.
+
         Args:
             symbols: List of option contract symbols
 
         Returns:
-            List of OptionData objects
+            List of OptionData objects. Contracts with no quote, trade or
+            greeks in their snapshot are left out.
 
         Example:
             ```python
@@ -217,52 +323,29 @@ class OptionHelper:
         if not symbols:
             return []
 
+        batches = [
+            symbols[i : i + MAX_SYMBOLS_PER_REQUEST]
+            for i in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST)
+        ]
+        if len(batches) == 1:
+            responses = [self._fetch_snapshots(batches[0])]
+        else:
+            # Batches share the pooled session, so they go out in parallel
+            workers = min(len(batches), MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(self._fetch_snapshots, batches))
+
+        return [
+            self._build_option_data(symbol, raw_snapshot)
+            for snapshots in responses
+            for symbol, raw_snapshot in snapshots.items()
+            if _has_market_data(raw_snapshot)
+        ]
+
+    def _fetch_snapshots(self, symbols: List[str]) -> RawData:
+        """Request raw snapshots for one batch of contract symbols."""
         request = OptionSnapshotRequest(symbol_or_symbols=symbols)
-        snapshots = self._client.get_option_snapshot(request)
-
-        results = []
-        for symbol, snapshot in snapshots.items():
-            option_data = OptionData(symbol=symbol)
-
-            # Parse symbol for strike/expiration/type
-            parsed = self._parse_option_symbol(symbol)
-            option_data.strike = parsed["strike"]
-            option_data.expiration = parsed["expiration"]
-            option_data.option_type = parsed["option_type"]
-
-            # Latest quote (bid/ask)
-            if snapshot.latest_quote:
-                option_data.bid = snapshot.latest_quote.bid_price
-                option_data.ask = snapshot.latest_quote.ask_price
-                option_data.bid_size = snapshot.latest_quote.bid_size
-                option_data.ask_size = snapshot.latest_quote.ask_size
-
-                if option_data.bid and option_data.ask:
-                    option_data.mid = (option_data.bid + option_data.ask) / 2
-
-                option_data.timestamp = snapshot.latest_quote.timestamp
-
-            # Latest trade (price/volume)
-            if snapshot.latest_trade:
-                option_data.last_price = snapshot.latest_trade.price
-                option_data.last_size = snapshot.latest_trade.size
-                # Note: Volume requires aggregation from trades endpoint
-                # Open interest requires separate data source
-
-            # Greeks
-            if snapshot.greeks:
-                option_data.delta = snapshot.greeks.delta
-                option_data.gamma = snapshot.greeks.gamma
-                option_data.theta = snapshot.greeks.theta
-                option_data.vega = snapshot.greeks.vega
-                option_data.rho = snapshot.greeks.rho
-
-            # Implied Volatility
-            option_data.implied_volatility = snapshot.implied_volatility
-
-            results.append(option_data)
-
-        return results
+        return self._client.get_option_snapshot(request)
 
     def get_option_chain(
         self, underlying: str, expiration: Optional[datetime] = None
@@ -270,12 +353,17 @@ class OptionHelper:
         """
         Get complete option chain for an underlying symbol.
 
+        Chains are cached for ``chain_cache_ttl`` seconds per underlying and
+        expiration, so repeated lookups within that window make no requests.
+        Use invalidate_chain to force a refresh.
+
         Args:
             underlying: Underlying stock symbol (e.g., "AAPL")
             expiration: Optional filter by expiration date
 
         Returns:
-            List of OptionData for all options in the chain
+            List of OptionData for all options in the chain (contracts with
+            no quote, trade or greeks in their snapshot are left out)
 
         Example:
             ```python
@@ -294,56 +382,206 @@ class OptionHelper:
                     print(f"{opt.symbol}: Strike={opt.strike}, Delta={opt.delta}")
             ```
         """
+        key = (underlying, expiration.isoformat() if expiration else None)
+        if self._chain_cache_ttl > 0:
+            with self._chain_lock:
+                cached = self._chain_cache.get(key)
+                if cached is not None and cached[0] > time.monotonic():
+                    self._chain_cache.move_to_end(key)
+                    return list(cached[1])
+
+        results = self._fetch_option_chain(underlying, expiration)
+
+        if self._chain_cache_ttl > 0:
+            expiry = time.monotonic() + self._chain_cache_ttl
+            with self._chain_lock:
+                self._chain_cache[key] = (expiry, results)
+                self._chain_cache.move_to_end(key)
+                if len(self._chain_cache) > CHAIN_CACHE_MAXSIZE:
+                    self._chain_cache.popitem(last=False)
+
+        return list(results)
+
+    def invalidate_chain(self, underlying: Optional[str] = None) -> None:
+        """
+        Drop cached option chains so the next lookup fetches fresh data.
+
+        Args:
+            underlying: Only drop chains for this underlying (all if None)
+
+        Example:
+            ```python
+            options.invalidate_chain("AAPL")
+            chain = options.get_option_chain("AAPL")  # Fetched again
+            ```
+        """
+        with self._chain_lock:
+            if underlying is None:
+                self._chain_cache.clear()
+                return
+
+            for key in [key for key in self._chain_cache if key[0] == underlying]:
+                del self._chain_cache[key]
+
+    def iter_option_chain(
+        self, underlying: str, expiration: Optional[datetime] = None
+    ) -> Iterator[OptionData]:
+        """
+        Yield an option chain one contract at a time.
+
+        Pages are fetched lazily and only one page of the response is held in
+        memory, which suits scanning very large chains. Results are not cached;
+        use get_option_chain for repeated lookups.
+
+        Args:
+            underlying: Underlying stock symbol (e.g., "AAPL")
+            expiration: Optional expiration date to filter
+
+        Yields:
+            OptionData for each contract with market data
+        """
         from alpaca.data.requests import OptionChainRequest
 
         request_params = {"underlying_symbol": underlying}
         if expiration:
             request_params["expiration_date"] = expiration.strftime("%Y-%m-%d")
 
+        # Filter on the symbol's YYMMDD before building anything, so contracts
+        # for other expirations cost one slice comparison each
+        date_tag = expiration.strftime("%y%m%d") if expiration else None
+
         request = OptionChainRequest(**request_params)
-        snapshots = self._client.get_option_chain(request)
-
-        results = []
-        for symbol, snapshot in snapshots.items():
-            option_data = OptionData(symbol=symbol)
-
-            # Parse symbol
-            parsed = self._parse_option_symbol(symbol)
-            option_data.strike = parsed["strike"]
-            option_data.expiration = parsed["expiration"]
-            option_data.option_type = parsed["option_type"]
-
-            # Quote data
-            if snapshot.latest_quote:
-                option_data.bid = snapshot.latest_quote.bid_price
-                option_data.ask = snapshot.latest_quote.ask_price
-                option_data.bid_size = snapshot.latest_quote.bid_size
-                option_data.ask_size = snapshot.latest_quote.ask_size
-
-                if option_data.bid and option_data.ask:
-                    option_data.mid = (option_data.bid + option_data.ask) / 2
-
-            # Trade data
-            if snapshot.latest_trade:
-                option_data.last_price = snapshot.latest_trade.price
-                option_data.last_size = snapshot.latest_trade.size
-
-            # Greeks
-            if snapshot.greeks:
-                option_data.delta = snapshot.greeks.delta
-                option_data.gamma = snapshot.greeks.gamma
-                option_data.theta = snapshot.greeks.theta
-                option_data.vega = snapshot.greeks.vega
-                option_data.rho = snapshot.greeks.rho
-
-            # IV
-            option_data.implied_volatility = snapshot.implied_volatility
-
-            # Filter by expiration if specified
-            if expiration is None or option_data.expiration == expiration:
-                results.append(option_data)
-
-        return results
+        for symbol, raw_snapshot in self._client.iter_option_chain(request):
+            if date_tag is not None and symbol[_DATE_START:_TYPE_INDEX] != date_tag:
+                continue
+            if _has_market_data(raw_snapshot):
+                yield self._build_option_data(symbol, raw_snapshot)
+
+    def _fetch_option_chain(
+        self, underlying: str, expiration: Optional[datetime]
+    ) -> List[OptionData]:
+        """Request an option chain from the API."""
+        return list(self.iter_option_chain(underlying, expiration))
+
+    def get_option_chain_df(
+        self, underlying: str, expiration: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Get an option chain as a pandas DataFrame indexed by symbol.
+
+        Columns match the OptionData fields, with missing values as NaN, so
+        large chains can be filtered and ranked with vectorized operations.
+
+        Args:
+            underlying: Underlying stock symbol (e.g., "AAPL")
+            expiration: Optional filter by expiration date
+
+        Returns:
+            DataFrame with one row per option contract
+
+        Example:
+            ```python
+            df = options.get_option_chain_df("SPY", expiration=datetime(2025, 2, 21))
+            puts = df[(df["option_type"] == "put") & (df["delta"].abs() > 0.4)]
+            top = puts.nlargest(5, "implied_volatility")
+            ```
+        """
+        chain = self.get_option_chain(underlying, expiration=expiration)
+
+        # Build each column in one pass (struct of arrays) so numeric fields
+        # land directly in float64 arrays instead of being inferred row by row
+        data = {}
+        for column in _CHAIN_COLUMNS:
+            values = [getattr(option, column) for option in chain]
+            if column in _NUMERIC_CHAIN_COLUMNS:
+                data[column] = np.array(values, dtype=np.float64)
+            else:
+                data[column] = values
+        df = pd.DataFrame(data, columns=_CHAIN_COLUMNS)
+        return df.set_index("symbol")
+
+    @staticmethod
+    def analyze_chain(chain: pd.DataFrame, spot: float) -> pd.DataFrame:
+        """
+        Add per-contract analytics columns to an option chain DataFrame.
+
+        Every column is computed with whole-array numpy operations, so large
+        chains are analyzed without a Python loop over contracts. Missing
+        inputs (e.g. no greeks) give NaN in the derived columns.
+
+        Args:
+            chain: DataFrame from get_option_chain_df
+            spot: Current price of the underlying
+
+        Returns:
+            A copy of ``chain`` with these extra columns:
+                moneyness: ln(spot / strike), positive when calls are in the money
+                spread: ask - bid
+                spread_pct: spread as a fraction of mid
+                delta_dollars: delta * spot * contract multiplier (100)
+
+        Example:
+            ```python
+            df = options.get_option_chain_df("SPY", expiration=datetime(2025, 2, 21))
+            stats = OptionHelper.analyze_chain(df, spot=585.0)
+            near_money = stats[stats["moneyness"].abs() < 0.02]
+            net_delta = near_money["delta_dollars"].sum()
+            ```
+        """
+        strike = chain["strike"].to_numpy(dtype=np.float64)
+        bid = chain["bid"].to_numpy(dtype=np.float64)
+        ask = chain["ask"].to_numpy(dtype=np.float64)
+        mid = chain["mid"].to_numpy(dtype=np.float64)
+        delta = chain["delta"].to_numpy(dtype=np.float64)
+
+        spread = ask - bid
+        with np.errstate(divide="ignore", invalid="ignore"):
+            moneyness = np.log(spot / strike)
+            spread_pct = spread / mid
+
+        result = chain.copy()
+        result["moneyness"] = moneyness
+        result["spread"] = spread
+        result["spread_pct"] = spread_pct
+        result["delta_dollars"] = delta * (spot * CONTRACT_MULTIPLIER)
+        return result
+
+    @classmethod
+    def _build_option_data(cls, symbol: str, snapshot: RawData) -> OptionData:
+        """Combine a raw API snapshot and the parsed contract symbol into OptionData."""
+        parsed = _parse_occ_symbol(symbol)
+
+        # Bind each section's lookup once; missing sections read as empty
+        quote_get = (snapshot.get("latestQuote") or _EMPTY).get
+        trade_get = (snapshot.get("latestTrade") or _EMPTY).get
+        greeks_get = (snapshot.get("greeks") or _EMPTY).get
+
+        bid = quote_get("bp")
+        ask = quote_get("ap")
+        timestamp = quote_get("t")
+
+        # Note: Volume requires aggregation from trades endpoint
+        # Open interest requires separate data source
+        return OptionData(
+            symbol,
+            parsed.strike,
+            parsed.expiration,
+            parsed.option_type,
+            bid=bid,
+            ask=ask,
+            mid=(bid + ask) / 2 if bid is not None and ask is not None else None,
+            last_price=trade_get("p"),
+            delta=greeks_get("delta"),
+            gamma=greeks_get("gamma"),
+            theta=greeks_get("theta"),
+            vega=greeks_get("vega"),
+            rho=greeks_get("rho"),
+            implied_volatility=snapshot.get("impliedVolatility"),
+            bid_size=quote_get("bs"),
+            ask_size=quote_get("as"),
+            last_size=trade_get("s"),
+            timestamp=_parse_timestamp(timestamp) if timestamp is not None else None,
+        )
 
     @staticmethod
     def _parse_option_symbol(symbol: str) -> dict:
@@ -356,48 +594,73 @@ class OptionHelper:
         Returns:
             dict with keys: 'underlying', 'strike', 'expiration', 'option_type'
         """
-        try:
-            # Find where the date starts (6 digits for YYMMDD)
-            # Work backwards from the end to find C or P
-            cp_index = -1
-            for i, char in enumerate(symbol):
-                if char in ("C", "P"):
-                    # Check if this looks like a valid position
-                    # Should have 6 digits before it and 8 after it
-                    if i >= 6 and len(symbol) - i == 9:
-                        cp_index = i
-                        break
-
-            if cp_index == -1:
-                raise ValueError("Could not find C/P indicator")
-
-            # Extract underlying (everything before date)
-            underlying = symbol[: cp_index - 6]
-
-            # Extract expiration date (6 chars before C/P)
-            exp_str = symbol[cp_index - 6 : cp_index]
-            year = 2000 + int(exp_str[:2])
-            month = int(exp_str[2:4])
-            day = int(exp_str[4:6])
-            expiration = datetime(year, month, day)
-
-            # Extract option type (C or P)
-            option_type = "call" if symbol[cp_index] == "C" else "put"
-
-            # Extract strike (8 digits after C/P, divide by 1000 for decimal)
-            strike_str = symbol[cp_index + 1 : cp_index + 9]
-            strike = float(strike_str) / 1000
-
-            return {
-                "underlying": underlying,
-                "strike": strike,
-                "expiration": expiration,
-                "option_type": option_type,
-            }
-        except (ValueError, IndexError):
-            return {
-                "underlying": symbol,
-                "strike": None,
-                "expiration": None,
-                "option_type": None,
-            }
+        return _parse_occ_symbol(symbol)._asdict()
+
+
+class _ParsedSymbol(NamedTuple):
+    """Fields decoded from an OCC option symbol."""
+
+    underlying: str
+    strike: Optional[float]
+    expiration: Optional[datetime]
+    option_type: Optional[str]
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_occ_symbol(symbol: str) -> _ParsedSymbol:
+    """Parse an OCC symbol once; chains are refreshed with the same symbols."""
+    # The date, type and strike are always the last 15 characters, so
+    # slice them at fixed offsets instead of scanning for the C/P flag.
+    option_type = _OPTION_TYPES.get(symbol[_TYPE_INDEX:_STRIKE_START])
+    if option_type is None or len(symbol) < _OCC_SUFFIX_LEN:
+        return _ParsedSymbol(symbol, None, None, None)
+
+    try:
+        expiration = _expiration_date(int(symbol[_DATE_START:_TYPE_INDEX]))
+        # Strike is quoted in thousandths of a dollar
+        strike = int(symbol[_STRIKE_START:]) / 1000
+    except ValueError:
+        return _ParsedSymbol(symbol, None, None, None)
+
+    return _ParsedSymbol(symbol[:_DATE_START], strike, expiration, option_type)
+
+
+def _has_market_data(snapshot: Optional[RawData]) -> bool:
+    """Check a raw snapshot has at least one quote, trade or greeks section."""
+    return snapshot is not None and not _SNAPSHOT_DATA_KEYS.isdisjoint(snapshot)
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Parse an API timestamp such as "2024-11-09T15:30:00.123456789Z".
+
+    Quotes across a chain often share a timestamp, so results are cached.
+    Fractions beyond microseconds are truncated; any other shape falls back
+    to the pydantic parser the SDK models use.
+    """
+    if len(value) >= 20 and value[-1] == "Z" and value[10] == "T":
+        fraction = value[20:-1]
+        if len(value) == 20 or value[19] == ".":
+            try:
+                return datetime(
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                    int(fraction[:6].ljust(6, "0")) if fraction else 0,
+                    timezone.utc,
+                )
+            except ValueError:
+                pass
+    return _validate_timestamp(value)
+
+
+@lru_cache(maxsize=4096)
+def _expiration_date(yymmdd: int) -> datetime:
+    """Convert a YYMMDD integer to a datetime (chains repeat a few dates)."""
+    year, month_day = divmod(yymmdd, 10000)
+    month, day = divmod(month_day, 100)
+    return datetime(2000 + year, month, day)
@@ -11,11 +11,30 @@ Example:
     >>> bars = helper.get_bars("SPY", timeframe="1H", days_back=5)
 """
 
+import asyncio
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+import numpy as np
+from requests import Session
 
+from alpaca.common.rest import get_shared_session
+from alpaca.common.utils import DATACLASS_SLOTS
 from alpaca.data.historical.stock import StockHistoricalDataClient
 from alpaca.data.models import Bar, Quote, Snapshot, Trade
 from alpaca.data.requests import (
@@ -28,9 +47,52 @@ from alpaca.data.requests import (
     StockTradesRequest,
 )
 from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+from alpaca.data.utils import bars_to_arrays
+
+# Symbols sent per request when a multi-symbol lookup is split into batches
+MAX_SYMBOLS_PER_REQUEST = 100
+
+# Upper bound on batch requests sent at once for long symbol lists
+MAX_CONCURRENT_REQUESTS = 8
+
+# Timeframe units keyed by the suffixes accepted by _parse_timeframe
+_TIMEFRAME_UNITS = {
+    "Min": TimeFrameUnit.Minute,
+    "Hour": TimeFrameUnit.Hour,
+    "H": TimeFrameUnit.Hour,
+    "Day": TimeFrameUnit.Day,
+    "D": TimeFrameUnit.Day,
+    "Week": TimeFrameUnit.Week,
+    "W": TimeFrameUnit.Week,
+    "Month": TimeFrameUnit.Month,
+    "M": TimeFrameUnit.Month,
+}
+_TIMEFRAME_RE = re.compile(r"(\d+)(Min|Hour|H|Day|D|Week|W|Month|M)")
+
+
+@lru_cache(maxsize=64)
+def _parse_timeframe_str(timeframe: str) -> TimeFrame:
+    """Parse a timeframe string, caching the result.
+
+    TimeFrame is read-only, so the cached instances are shared between calls.
+    """
+    timeframe = timeframe.strip()
+    match = _TIMEFRAME_RE.fullmatch(timeframe)
+    if match:
+        try:
+            return TimeFrame(
+                amount=int(match.group(1)), unit=_TIMEFRAME_UNITS[match.group(2)]
+            )
+        except ValueError:
+            pass
+
+    raise ValueError(
+        f"Invalid timeframe '{timeframe}'. "
+        "Use format like '1Min', '5Min', '1H', '1D', etc."
+    )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BarData:
     """Simplified bar (OHLCV) data."""
 
@@ -60,7 +122,7 @@ class BarData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QuoteData:
     """Simplified quote (bid/ask) data."""
 
@@ -86,7 +148,7 @@ class QuoteData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TradeData:
     """Simplified trade (tick) data."""
 
@@ -110,7 +172,7 @@ class TradeData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SnapshotData:
     """Simplified snapshot data with latest bar, quote, and trade."""
 
@@ -148,6 +210,43 @@ class SnapshotData:
         )
 
 
+_T = TypeVar("_T")
+
+
+class _LazyDataMap(Mapping[str, _T], Generic[_T]):
+    """Read-only symbol mapping that converts SDK models on first access.
+
+    Multi-symbol calls often return far more symbols than the caller reads,
+    so each value is only converted (and then kept) when it is looked up.
+    """
+
+    __slots__ = ("_raw", "_convert", "_converted")
+
+    def __init__(self, raw: Dict[str, Any], convert: Callable[[str, Any], _T]):
+        self._raw = raw
+        self._convert = convert
+        self._converted: Dict[str, _T] = {}
+
+    def __getitem__(self, symbol: str) -> _T:
+        try:
+            return self._converted[symbol]
+        except KeyError:
+            value = self._converted[symbol] = self._convert(symbol, self._raw[symbol])
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._raw
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class StockHelper:
     """
     Simplified interface for Alpaca stock market data.
@@ -169,6 +268,7 @@ class StockHelper:
         self,
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
+        session: Optional[Session] = None,
     ):
         """
         Initialize StockHelper.
@@ -176,6 +276,8 @@ class StockHelper:
         Args:
             api_key: Alpaca API key. If None, reads from ALPACA_API_KEY env var.
             secret_key: Alpaca secret key. If None, reads from ALPACA_SECRET_KEY.
+            session: HTTP session to send requests through. Defaults to a
+                session shared by all helpers, so connections are reused.
 
         Raises:
             ValueError: If API credentials are not provided and not in env vars.
@@ -195,6 +297,7 @@ class StockHelper:
         self.client = StockHistoricalDataClient(
             api_key=api_key,
             secret_key=secret_key,
+            session=session if session is not None else get_shared_session(),
         )
 
     def _parse_timeframe(self, timeframe: str) -> TimeFrame:
@@ -210,35 +313,7 @@ class StockHelper:
         Raises:
             ValueError: If timeframe format is invalid
         """
-        timeframe = timeframe.strip()
-
-        # Map of valid units
-        unit_map = {
-            "Min": TimeFrameUnit.Minute,
-            "Hour": TimeFrameUnit.Hour,
-            "H": TimeFrameUnit.Hour,
-            "Day": TimeFrameUnit.Day,
-            "D": TimeFrameUnit.Day,
-            "Week": TimeFrameUnit.Week,
-            "W": TimeFrameUnit.Week,
-            "Month": TimeFrameUnit.Month,
-            "M": TimeFrameUnit.Month,
-        }
-
-        # Try to parse amount and unit
-        for unit_str, unit_enum in unit_map.items():
-            if timeframe.endswith(unit_str):
-                amount_str = timeframe[: -len(unit_str)]
-                try:
-                    amount = int(amount_str)
-                    return TimeFrame(amount=amount, unit=unit_enum)
-                except ValueError:
-                    pass
-
-        raise ValueError(
-            f"Invalid timeframe '{timeframe}'. "
-            "Use format like '1Min', '5Min', '1H', '1D', etc."
-        )
+        return _parse_timeframe_str(timeframe)
 
     # ==================== Latest Data Methods ====================
 
@@ -264,31 +339,33 @@ class StockHelper:
 
         raise ValueError(f"No quote data returned for {symbol}")
 
-    def get_latest_quotes(self, symbols: List[str]) -> Dict[str, QuoteData]:
+    def get_latest_quotes(self, symbols: List[str]) -> Mapping[str, QuoteData]:
         """
         Get latest quotes for multiple symbols.
 
+        Lists longer than MAX_SYMBOLS_PER_REQUEST are split into batches that
+        are fetched concurrently.
+
         Args:
             symbols: List of stock symbols.
 
         Returns:
-            Dictionary mapping symbols to QuoteData.
+            Read-only mapping of symbols to QuoteData. Each quote is converted
+            when first accessed, so reading a few symbols of a large universe
+            only pays for those.
 
         Example:
             >>> quotes = helper.get_latest_quotes(["SPY", "QQQ", "IWM"])
             >>> for symbol, quote in quotes.items():
             ...     print(f"{symbol}: ${quote.bid_price}")
         """
-        request = StockLatestQuoteRequest(symbol_or_symbols=symbols)
-        response = self.client.get_stock_latest_quote(request)
-
-        if isinstance(response, dict):
-            return {
-                symbol: QuoteData.from_quote(symbol, quote)
-                for symbol, quote in response.items()
-            }
-
-        return {}
+        response = self._fetch_in_batches(
+            lambda batch: self.client.get_stock_latest_quote(
+                StockLatestQuoteRequest(symbol_or_symbols=batch)
+            ),
+            symbols,
+        )
+        return _LazyDataMap(response, QuoteData.from_quote)
 
     def get_latest_bar(self, symbol: str) -> BarData:
         """
@@ -397,6 +474,100 @@ class StockHelper:
 
         return bars
 
+    def iter_bars(
+        self,
+        symbol: str,
+        timeframe: str = "1D",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[BarData]:
+        """
+        Iterate over historical bars for a symbol, one page at a time.
+
+        Takes the same arguments as get_bars, but yields bars as each page
+        of up to 10,000 arrives instead of building the full list, so years
+        of minute bars can be processed with bounded memory.
+
+        Args:
+            symbol: Stock symbol (e.g., "SPY").
+            timeframe: Bar interval (e.g., "1Min", "5Min", "1H", "1D").
+            start: Start datetime (optional).
+            end: End datetime (optional).
+            days_back: Days back from now (alternative to start).
+            limit: Maximum number of bars to return (optional).
+
+        Yields:
+            BarData objects in chronological order.
+
+        Example:
+            >>> for bar in helper.iter_bars("SPY", timeframe="1Min", days_back=365):
+            ...     process(bar)
+        """
+        if days_back is not None and start is None:
+            start = datetime.now() - timedelta(days=days_back)
+
+        request = StockBarsRequest(
+            symbol_or_symbols=symbol,
+            timeframe=self._parse_timeframe(timeframe),
+            start=start,
+            end=end,
+            limit=limit,
+        )
+
+        for bar in self.client.iter_stock_bars(request):
+            yield BarData.from_bar(symbol, bar)
+
+    def get_bars_arrays(
+        self,
+        symbol: str,
+        timeframe: str = "1D",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get historical bars as numpy columns instead of a list of objects.
+
+        The columns are built straight from the API response, without
+        creating a BarData per bar.
+
+        Args:
+            symbol: Stock symbol (e.g., "SPY").
+            timeframe: Bar interval (e.g., "1Min", "5Min", "1H", "1D").
+            start: Start datetime (optional).
+            end: End datetime (optional).
+            days_back: Days back from now (alternative to start).
+            limit: Maximum number of bars to return (optional).
+
+        Returns:
+            Dict of column name to array, see bars_to_arrays.
+
+        Example:
+            >>> cols = helper.get_bars_arrays("SPY", timeframe="1Min", days_back=5)
+            >>> returns = np.diff(cols["close"]) / cols["close"][:-1]
+        """
+        if days_back is not None and start is None:
+            start = datetime.now() - timedelta(days=days_back)
+
+        request = StockBarsRequest(
+            symbol_or_symbols=symbol,
+            timeframe=self._parse_timeframe(timeframe),
+            start=start,
+            end=end,
+            limit=limit,
+        )
+
+        response = self.client.get_stock_bars(request)
+
+        bars = []
+        if hasattr(response, "data") and symbol in response.data:
+            bars = response.data[symbol]
+
+        return bars_to_arrays(bars)
+
     def get_bars_multi(
         self,
         symbols: List[str],
@@ -581,26 +752,172 @@ class StockHelper:
 
         raise ValueError(f"No snapshot data returned for {symbol}")
 
-    def get_snapshots(self, symbols: List[str]) -> Dict[str, SnapshotData]:
+    def get_snapshots(self, symbols: List[str]) -> Mapping[str, SnapshotData]:
         """
         Get snapshots for multiple symbols.
 
+        Long symbol lists are fetched in concurrent batches, like
+        get_latest_quotes.
+
         Args:
             symbols: List of stock symbols.
 
         Returns:
-            Dictionary mapping symbols to SnapshotData.
+            Read-only mapping of symbols to SnapshotData, converted on first
+            access like get_latest_quotes.
 
         Example:
             >>> snapshots = helper.get_snapshots(["SPY", "QQQ", "IWM"])
         """
-        request = StockSnapshotRequest(symbol_or_symbols=symbols)
-        response = self.client.get_stock_snapshot(request)
+        response = self._fetch_in_batches(
+            lambda batch: self.client.get_stock_snapshot(
+                StockSnapshotRequest(symbol_or_symbols=batch)
+            ),
+            symbols,
+        )
+        return _LazyDataMap(response, SnapshotData.from_snapshot)
+
+    def _fetch_in_batches(
+        self, fetch: Callable[[List[str]], Any], symbols: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Run a multi-symbol request in batches of MAX_SYMBOLS_PER_REQUEST.
+
+        Batches share the pooled session, so long symbol lists are fetched
+        concurrently. Responses that are not symbol dicts are skipped.
+        """
+        batches = [
+            symbols[i : i + MAX_SYMBOLS_PER_REQUEST]
+            for i in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST)
+        ]
+        if len(batches) <= 1:
+            responses = [fetch(batch) for batch in batches]
+        else:
+            workers = min(len(batches), MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(fetch, batches))
+
+        merged: Dict[str, Any] = {}
+        for response in responses:
+            if isinstance(response, dict):
+                merged.update(response)
+        return merged
+
+    # ==================== Async Variants ====================
+
+    async def _run_in_executor(self, func, *args, **kwargs):
+        """Run a blocking helper call in the event loop's default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    async def aget_bars(
+        self,
+        symbol: str,
+        timeframe: str = "1D",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[BarData]:
+        """
+        Async variant of get_bars.
+
+        The request runs in the event loop's default executor, so several
+        independent fetches can be awaited together with asyncio.gather and
+        overlap on the client's pooled connections.
+
+        Example:
+            >>> hourly, daily = await asyncio.gather(
+            ...     helper.aget_bars("SPY", timeframe="1H", days_back=5),
+            ...     helper.aget_bars("SPY", timeframe="1D", days_back=30),
+            ... )
+        """
+        return await self._run_in_executor(
+            self.get_bars,
+            symbol,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            days_back=days_back,
+            limit=limit,
+        )
+
+    async def aget_bars_multi(
+        self,
+        symbols: List[str],
+        timeframe: str = "1D",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[BarData]]:
+        """
+        Async variant of get_bars_multi.
 
-        if isinstance(response, dict):
-            return {
-                symbol: SnapshotData.from_snapshot(symbol, snapshot)
-                for symbol, snapshot in response.items()
-            }
+        Example:
+            >>> bars = await helper.aget_bars_multi(["SPY", "QQQ"], days_back=5)
+        """
+        return await self._run_in_executor(
+            self.get_bars_multi,
+            symbols,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            days_back=days_back,
+            limit=limit,
+        )
+
+    async def aget_quotes(
+        self,
+        symbol: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[QuoteData]:
+        """
+        Async variant of get_quotes.
 
-        return {}
+        Example:
+            >>> quotes = await helper.aget_quotes("SPY", days_back=1, limit=5)
+        """
+        return await self._run_in_executor(
+            self.get_quotes,
+            symbol,
+            start=start,
+            end=end,
+            days_back=days_back,
+            limit=limit,
+        )
+
+    async def aget_trades(
+        self,
+        symbol: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        days_back: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[TradeData]:
+        """
+        Async variant of get_trades.
+
+        Example:
+            >>> trades = await helper.aget_trades("SPY", days_back=1, limit=5)
+        """
+        return await self._run_in_executor(
+            self.get_trades,
+            symbol,
+            start=start,
+            end=end,
+            days_back=days_back,
+            limit=limit,
+        )
+
+    async def aget_snapshots(self, symbols: List[str]) -> Mapping[str, SnapshotData]:
+        """
+        Async variant of get_snapshots.
+
+        Example:
+            >>> snapshots = await helper.aget_snapshots(["SPY", "QQQ", "IWM"])
+        """
+        return await self._run_in_executor(self.get_snapshots, symbols)
@@ -0,0 +1,50 @@
+"""
+Utilities shared by the market data helpers.
+"""
+
+from datetime import timezone
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+# Numeric bar attributes that bars_to_arrays turns into float64 columns
+BAR_COLUMNS = ("open", "high", "low", "close", "volume", "trade_count", "vwap")
+
+
+def bars_to_arrays(bars: Sequence[Any]) -> Dict[str, np.ndarray]:
+    """
+    Convert a list of bars into contiguous numpy columns.
+
+    Accepts the helpers' bar data classes or the SDK's Bar models. Each column
+    is converted by numpy in one pass, so calculations such as returns run as
+    single vectorized operations instead of Python loops over bar attributes.
+
+    Args:
+        bars: List of bar objects with timestamp, OHLCV, trade_count and vwap
+            attributes
+
+    Returns:
+        Dict with "timestamp" (datetime64[ns], UTC) and float64 "open",
+        "high", "low", "close", "volume", "trade_count" and "vwap" arrays.
+        Missing trade counts and VWAPs are NaN.
+
+    Example:
+        >>> cols = bars_to_arrays(helper.get_bars("SPY", days_back=30))
+        >>> pct = (cols["close"][-1] - cols["open"][0]) / cols["open"][0]
+    """
+    columns = {
+        field: np.array([getattr(bar, field) for bar in bars], dtype=np.float64)
+        for field in BAR_COLUMNS
+    }
+    columns["timestamp"] = np.array(
+        [
+            (
+                bar.timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+                if bar.timestamp.tzinfo
+                else bar.timestamp
+            )
+            for bar in bars
+        ],
+        dtype="datetime64[ns]",
+    )
+    return columns
@@ -0,0 +1,53 @@
+"""
+Account cache shared by the trading helpers.
+"""
+
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from alpaca.trading.models import TradeAccount
+
+# Default number of seconds an account fetch is reused by the getters, so
+# reading cash, buying power and PDT status in one tick makes one request.
+# Kept short because fills land asynchronously and are not seen until it
+# expires.
+DEFAULT_ACCOUNT_CACHE_TTL = 0.25
+
+
+class AccountCache:
+    """
+    Reuses a fetched account for a short TTL.
+
+    Shared by AccountHelper and TradingHelper. Concurrent callers that miss
+    the cache wait on one another, so a burst of account lookups from several
+    threads results in a single request.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # (expiry time, account) from the last fetch
+        self._entry: Optional[Tuple[float, TradeAccount]] = None
+        self._lock = threading.Lock()
+
+    def get(self, fetch: Callable[[], TradeAccount]) -> TradeAccount:
+        """Return the cached account, calling fetch if it is missing or expired."""
+        if self.ttl <= 0:
+            return fetch()
+
+        entry = self._entry
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            account = fetch()
+            self._entry = (time.monotonic() + self.ttl, account)
+            return account
+
+    def invalidate(self) -> None:
+        """Drop the cached account."""
+        self._entry = None
@@ -16,6 +16,11 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Optional
 
+import numpy as np
+from requests import Session
+
+from alpaca.common.rest import get_shared_session
+from alpaca.trading._cache import DEFAULT_ACCOUNT_CACHE_TTL, AccountCache
 from alpaca.trading.client import TradingClient
 from alpaca.trading.models import PortfolioHistory, TradeAccount
 from alpaca.trading.requests import GetPortfolioHistoryRequest
@@ -107,9 +112,7 @@ class PortfolioHistoryData:
     ) -> "PortfolioHistoryData":
         """Create PortfolioHistoryData from API PortfolioHistory object."""
         return cls(
-            timestamps=[
-                datetime.fromtimestamp(ts) for ts in history.timestamp
-            ],
+            timestamps=list(map(datetime.fromtimestamp, history.timestamp)),
             equity=history.equity,
             profit_loss=history.profit_loss,
             profit_loss_pct=[
@@ -119,6 +122,38 @@ class PortfolioHistoryData:
             base_value=history.base_value or 0.0,
         )
 
+    def returns(self) -> np.ndarray:
+        """
+        Get the fractional change in equity between consecutive points.
+
+        Returns:
+            float64 array one shorter than equity; points without equity
+            (missing or zero) give NaN
+        """
+        equity = np.asarray(self.equity, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(equity) / equity[:-1]
+        returns[~np.isfinite(returns)] = np.nan
+        return returns
+
+    def max_drawdown(self) -> float:
+        """
+        Get the largest peak-to-trough decline in equity.
+
+        Returns:
+            Drawdown as a negative fraction of the running peak (e.g. -0.12
+            for a 12% decline), or 0.0 if equity never fell
+        """
+        equity = np.asarray(self.equity, dtype=np.float64)
+        if equity.size == 0:
+            return 0.0
+
+        # fmax skips missing points instead of carrying NaN into the peak
+        peak = np.fmax.accumulate(equity)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = equity / peak - 1.0
+        return float(np.nan_to_num(drawdown, nan=0.0, neginf=0.0).min())
+
 
 class AccountHelper:
     """
@@ -153,6 +188,8 @@ class AccountHelper:
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         paper: Optional[bool] = None,
+        session: Optional[Session] = None,
+        account_cache_ttl: float = DEFAULT_ACCOUNT_CACHE_TTL,
     ):
         """
         Initialize the AccountHelper.
@@ -161,6 +198,10 @@ class AccountHelper:
             api_key: Alpaca API key (if None, loads from ALPACA_API_KEY env)
             secret_key: Alpaca secret key (if None, loads from env)
             paper: Use paper trading (if None, defaults to True)
+            session: HTTP session to send requests through (defaults to a
+                session shared by all helpers, so connections are reused)
+            account_cache_ttl: Seconds to reuse a fetched account across the
+                getters (0 disables caching)
         """
         self.api_key = api_key or os.getenv("ALPACA_API_KEY")
         self.secret_key = secret_key or os.getenv("ALPACA_SECRET_KEY")
@@ -183,8 +224,25 @@ class AccountHelper:
             api_key=self.api_key,
             secret_key=self.secret_key,
             paper=self.paper,
+            session=session if session is not None else get_shared_session(),
         )
 
+        self._account_cache = AccountCache(account_cache_ttl)
+
+    def _get_trade_account(self) -> TradeAccount:
+        """Fetch the account, reusing a fetch made within the cache TTL."""
+        return self._account_cache.get(self.client.get_account)
+
+    def invalidate_account(self) -> None:
+        """
+        Drop the cached account so the next getter fetches fresh data.
+
+        Example:
+            >>> helper.invalidate_account()
+            >>> cash = helper.get_cash()  # Fetched again
+        """
+        self._account_cache.invalidate()
+
     def get_account(self) -> AccountInfo:
         """
         Get complete account information.
@@ -198,7 +256,7 @@ class AccountHelper:
             >>> print(f"Cash: ${account.cash:,.2f}")
             >>> print(f"Equity: ${account.equity:,.2f}")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return AccountInfo.from_trade_account(account)
 
     def get_cash(self) -> float:
@@ -212,7 +270,7 @@ class AccountHelper:
             >>> cash = helper.get_cash()
             >>> print(f"Available cash: ${cash:,.2f}")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return float(account.cash) if account.cash else 0.0
 
     def get_buying_power(self) -> float:
@@ -229,7 +287,7 @@ class AccountHelper:
             >>> bp = helper.get_buying_power()
             >>> print(f"Buying power: ${bp:,.2f}")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return float(account.buying_power) if account.buying_power else 0.0
 
     def get_portfolio_value(self) -> float:
@@ -243,7 +301,7 @@ class AccountHelper:
             >>> value = helper.get_portfolio_value()
             >>> print(f"Portfolio value: ${value:,.2f}")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return float(account.portfolio_value) if account.portfolio_value else 0.0
 
     def get_equity(self) -> float:
@@ -257,7 +315,7 @@ class AccountHelper:
             >>> equity = helper.get_equity()
             >>> print(f"Account equity: ${equity:,.2f}")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return float(account.equity) if account.equity else 0.0
 
     def is_pattern_day_trader(self) -> bool:
@@ -274,7 +332,7 @@ class AccountHelper:
             >>> if helper.is_pattern_day_trader():
             ...     print("Account is a Pattern Day Trader")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return account.pattern_day_trader or False
 
     def get_day_trades_remaining(self) -> int:
@@ -290,7 +348,7 @@ class AccountHelper:
             >>> remaining = helper.get_day_trades_remaining()
             >>> print(f"Day trades remaining: {remaining}")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
 
         if account.pattern_day_trader:
             return 0
@@ -310,7 +368,7 @@ class AccountHelper:
             >>> mult = helper.get_multiplier()
             >>> print(f"Margin multiplier: {mult}x")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return float(account.multiplier) if account.multiplier else 1.0
 
     def is_blocked(self) -> bool:
@@ -324,7 +382,7 @@ class AccountHelper:
             >>> if helper.is_blocked():
             ...     print("Account is blocked!")
         """
-        account = self.client.get_account()
+        account = self._get_trade_account()
         return (account.account_blocked or False) or (
             account.trading_blocked or False
         )
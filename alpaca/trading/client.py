@@ -4,6 +4,7 @@ from typing import List, Optional, Union
 from uuid import UUID
 
 from pydantic import TypeAdapter
+from requests import Session
 
 from alpaca.common import RawData
 from alpaca.common.enums import BaseURL
@@ -58,6 +59,7 @@ class TradingClient(RESTClient):
         paper: bool = True,
         raw_data: bool = False,
         url_override: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> None:
         """
         Instantiates a client for trading and managing personal brokerage accounts.
@@ -70,6 +72,7 @@ class TradingClient(RESTClient):
             raw_data (bool): Whether API responses should be wrapped in data models or returned raw.
                 This has not been implemented yet.
             url_override (Optional[str]): If specified allows you to override the base url the client points to for proxy/testing.
+            session (Optional[Session]): An existing session to send requests through. Defaults to None.
         """
         super().__init__(
             api_key=api_key,
@@ -83,6 +86,7 @@ class TradingClient(RESTClient):
             ),
             sandbox=paper,
             raw_data=raw_data,
+            session=session,
         )
 
     # ############################## ORDERS ################################# #
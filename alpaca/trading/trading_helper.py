@@ -15,9 +15,15 @@ Example:
 import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
+from requests import Session
+
+from alpaca.common.rest import get_shared_session
+from alpaca.trading._cache import DEFAULT_ACCOUNT_CACHE_TTL, AccountCache
+from alpaca.trading.account_helper import AccountInfo
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import (
     OrderClass,
@@ -25,7 +31,7 @@ from alpaca.trading.enums import (
     QueryOrderStatus,
     TimeInForce,
 )
-from alpaca.trading.models import Order, Position
+from alpaca.trading.models import Order, Position, TradeAccount
 from alpaca.trading.requests import (
     ClosePositionRequest,
     GetOrdersRequest,
@@ -36,6 +42,27 @@ from alpaca.trading.requests import (
 )
 
 
+@lru_cache(maxsize=64)
+def _make_orders_request(
+    status: QueryOrderStatus,
+    symbols: Optional[Tuple[str, ...]],
+    limit: Optional[int],
+) -> GetOrdersRequest:
+    """
+    Build (or reuse) a GetOrdersRequest for the given filters.
+
+    Pollers call get_orders with identical arguments over and over, so the
+    validated request is cached instead of being rebuilt on every call. The
+    client only reads the request via to_request_fields(), which returns a
+    fresh dict, so sharing the instance is safe.
+    """
+    return GetOrdersRequest(
+        status=status,
+        symbols=list(symbols) if symbols else None,
+        limit=limit,
+    )
+
+
 @dataclass
 class PositionInfo:
     """Simplified position information."""
@@ -132,6 +159,8 @@ class TradingHelper:
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         paper: Optional[bool] = None,
+        account_cache_ttl: float = DEFAULT_ACCOUNT_CACHE_TTL,
+        session: Optional[Session] = None,
     ):
         """
         Initialize TradingHelper.
@@ -141,6 +170,12 @@ class TradingHelper:
             secret_key: Alpaca secret key. If None, reads from ALPACA_SECRET_KEY.
             paper: Use paper trading. If None, reads from ALPACA_PAPER env var
                    (defaults to True if not set).
+            account_cache_ttl: Seconds to reuse fetched account data across
+                get_account/get_cash/get_buying_power/get_portfolio_value
+                (0 disables caching). Fills are not reflected in cached
+                balances until it expires.
+            session: HTTP session to send requests through. Defaults to a
+                session shared by all helpers, so connections are reused.
 
         Raises:
             ValueError: If API credentials are not provided and not in env vars.
@@ -164,9 +199,12 @@ class TradingHelper:
             api_key=api_key,
             secret_key=secret_key,
             paper=paper,
+            session=session if session is not None else get_shared_session(),
         )
         self._paper = paper
 
+        self._account_cache = AccountCache(account_cache_ttl)
+
     @property
     def is_paper(self) -> bool:
         """Check if using paper trading."""
@@ -213,7 +251,7 @@ class TradingHelper:
             time_in_force=time_in_force,
         )
 
-        order = self.client.submit_order(request)
+        order = self._submit_order(request)
         return OrderInfo.from_order(order)
 
     def sell_market(
@@ -254,7 +292,7 @@ class TradingHelper:
             time_in_force=time_in_force,
         )
 
-        order = self.client.submit_order(request)
+        order = self._submit_order(request)
         return OrderInfo.from_order(order)
 
     # ==================== Limit Orders ====================
@@ -289,7 +327,7 @@ class TradingHelper:
             time_in_force=time_in_force,
         )
 
-        order = self.client.submit_order(request)
+        order = self._submit_order(request)
         return OrderInfo.from_order(order)
 
     def sell_limit(
@@ -322,7 +360,7 @@ class TradingHelper:
             time_in_force=time_in_force,
         )
 
-        order = self.client.submit_order(request)
+        order = self._submit_order(request)
         return OrderInfo.from_order(order)
 
     # ==================== Bracket Orders ====================
@@ -389,7 +427,7 @@ class TradingHelper:
             stop_loss=stop_loss_obj,
         )
 
-        order = self.client.submit_order(request)
+        order = self._submit_order(request)
         return OrderInfo.from_order(order)
 
     def sell_with_bracket(
@@ -452,7 +490,7 @@ class TradingHelper:
             stop_loss=stop_loss_obj,
         )
 
-        order = self.client.submit_order(request)
+        order = self._submit_order(request)
         return OrderInfo.from_order(order)
 
     # ==================== Position Management ====================
@@ -533,6 +571,7 @@ class TradingHelper:
             )
             response = self.client.close_position(symbol, request)
 
+        self.invalidate_account()
         return OrderInfo.from_order(response)
 
     # ==================== Order Management ====================
@@ -579,7 +618,9 @@ class TradingHelper:
         if status is None:
             status = QueryOrderStatus.OPEN
 
-        request = GetOrdersRequest(status=status, symbols=symbols, limit=limit)
+        request = _make_orders_request(
+            status, tuple(symbols) if symbols else None, limit
+        )
         orders = self.client.get_orders(request)
         return [OrderInfo.from_order(o) for o in orders]
 
@@ -594,6 +635,7 @@ class TradingHelper:
             >>> helper.cancel_order("a1b2c3d4-...")
         """
         self.client.cancel_order_by_id(order_id)
+        self.invalidate_account()
 
     def cancel_all_orders(self) -> None:
         """
@@ -603,9 +645,52 @@ class TradingHelper:
             >>> helper.cancel_all_orders()
         """
         self.client.cancel_orders()
+        self.invalidate_account()
+
+    def _submit_order(self, request) -> Order:
+        """Submit an order and drop cached account data it makes stale."""
+        order = self.client.submit_order(request)
+        self.invalidate_account()
+        return order
 
     # ==================== Account Info ====================
 
+    def get_account(self) -> AccountInfo:
+        """
+        Get account balances and status with a single request.
+
+        The result is reused for ``account_cache_ttl`` seconds, and the
+        get_cash, get_buying_power and get_portfolio_value shortcuts read
+        from the same fetch. Lookups made concurrently from several threads
+        are coalesced into one request. Submitting, closing or cancelling orders
+        through this helper drops the cached account, but fills happen
+        asynchronously afterwards, so balances read within the TTL of a fill
+        may not reflect it yet.
+
+        Returns:
+            AccountInfo with cash, buying power, portfolio value and more.
+
+        Example:
+            >>> account = helper.get_account()
+            >>> print(f"Cash: ${account.cash:,.2f}")
+            >>> print(f"Buying power: ${account.buying_power:,.2f}")
+        """
+        return AccountInfo.from_trade_account(self._get_trade_account())
+
+    def invalidate_account(self) -> None:
+        """
+        Drop cached account data so the next lookup fetches fresh values.
+
+        Example:
+            >>> helper.invalidate_account()
+            >>> cash = helper.get_cash()  # Fetched again
+        """
+        self._account_cache.invalidate()
+
+    def _get_trade_account(self) -> TradeAccount:
+        """Fetch the account, reusing a recent response within the TTL."""
+        return self._account_cache.get(self.client.get_account)
+
     def get_buying_power(self) -> float:
         """
         Get current buying power.
@@ -617,8 +702,7 @@ class TradingHelper:
             >>> bp = helper.get_buying_power()
             >>> print(f"Buying power: ${bp:,.2f}")
         """
-        from alpaca.trading.models import TradeAccount
-        account = self.client.get_account()
+        account = self._get_trade_account()
         if isinstance(account, TradeAccount):
             return float(account.buying_power) if account.buying_power else 0.0
         return 0.0
@@ -634,8 +718,7 @@ class TradingHelper:
             >>> cash = helper.get_cash()
             >>> print(f"Cash: ${cash:,.2f}")
         """
-        from alpaca.trading.models import TradeAccount
-        account = self.client.get_account()
+        account = self._get_trade_account()
         if isinstance(account, TradeAccount):
             return float(account.cash) if account.cash else 0.0
         return 0.0
@@ -651,8 +734,7 @@ class TradingHelper:
             >>> value = helper.get_portfolio_value()
             >>> print(f"Portfolio: ${value:,.2f}")
         """
-        from alpaca.trading.models import TradeAccount
-        account = self.client.get_account()
+        account = self._get_trade_account()
         if isinstance(account, TradeAccount):
             return float(account.portfolio_value) if account.portfolio_value else 0.0
         return 0.0
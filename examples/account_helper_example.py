@@ -7,21 +7,25 @@ account management with a clean, simple API.
 
 from alpaca.trading.account_helper import AccountHelper
 
+# Separator lines for the example output
+_SEP = "=" * 70
+_SUB = "-" * 70
+
 # Initialize helper (auto-loads API keys from environment)
 helper = AccountHelper()
 
 # Alternative: explicit credentials
 # helper = AccountHelper(api_key="your_key", secret_key="your_secret", paper=True)
 
-print("=" * 70)
+print(_SEP)
 print("AccountHelper Examples - Simplified Account Management API")
-print("=" * 70)
+print(_SEP)
 
 # ============================================================================
 # Example 1: Quick Account Overview
 # ============================================================================
 print("\n1. Quick Account Overview:")
-print("-" * 70)
+print(_SUB)
 
 print(f"Cash: ${helper.get_cash():,.2f}")
 print(f"Buying Power: ${helper.get_buying_power():,.2f}")
@@ -32,7 +36,7 @@ print(f"Equity: ${helper.get_equity():,.2f}")
 # Example 2: Complete Account Details
 # ============================================================================
 print("\n2. Complete Account Information:")
-print("-" * 70)
+print(_SUB)
 
 account = helper.get_account()
 print(f"Account Number: {account.account_number}")
@@ -55,7 +59,7 @@ print(f"  Maintenance Margin: ${account.maintenance_margin:,.2f}")
 # Example 3: Pattern Day Trader (PDT) Status
 # ============================================================================
 print("\n3. Pattern Day Trader Status:")
-print("-" * 70)
+print(_SUB)
 
 if helper.is_pattern_day_trader():
     print("⚠️  Account is flagged as a Pattern Day Trader")
@@ -71,7 +75,7 @@ else:
 # Example 4: Account Status Checks
 # ============================================================================
 print("\n4. Account Status Checks:")
-print("-" * 70)
+print(_SUB)
 
 if helper.is_blocked():
     print("❌ Account or trading is blocked!")
@@ -91,7 +95,7 @@ else:
 # Example 5: Portfolio History - Last 30 Days
 # ============================================================================
 print("\n5. Portfolio History (Last 30 Days):")
-print("-" * 70)
+print(_SUB)
 
 history = helper.get_portfolio_history(days_back=30, timeframe="1D")
 
@@ -124,7 +128,7 @@ if history.timestamps:
 # Example 6: Portfolio History - Intraday (1 Minute Bars)
 # ============================================================================
 print("\n6. Intraday Portfolio History (Last Hour):")
-print("-" * 70)
+print(_SUB)
 
 intraday = helper.get_portfolio_history(period="1D", timeframe="1Min")
 
@@ -143,7 +147,7 @@ if intraday.timestamps and len(intraday.timestamps) > 0:
 # Example 7: Calculate Account Metrics
 # ============================================================================
 print("\n7. Account Metrics:")
-print("-" * 70)
+print(_SUB)
 
 account = helper.get_account()
 
@@ -180,7 +184,7 @@ print(f"Buying Power Ratio: {bp_ratio:.2f}x")
 # Example 8: Weekly Performance Summary
 # ============================================================================
 print("\n8. Weekly Performance Summary:")
-print("-" * 70)
+print(_SUB)
 
 weekly = helper.get_portfolio_history(period="1W", timeframe="1D")
 
@@ -205,7 +209,7 @@ if weekly.timestamps and len(weekly.timestamps) > 0:
 # Example 9: Risk Check Before Trading
 # ============================================================================
 print("\n9. Pre-Trade Risk Check:")
-print("-" * 70)
+print(_SUB)
 
 
 def can_trade(symbol: str, notional: float) -> bool:
@@ -237,7 +241,7 @@ can_trade("AAPL", 5000.00)
 # Example 10: Old API vs New API Comparison
 # ============================================================================
 print("\n10. Old API vs New API Comparison:")
-print("-" * 70)
+print(_SUB)
 
 print("\nOLD WAY (Complex):")
 print("""
@@ -277,7 +281,7 @@ print(f"Portfolio: ${helper.get_portfolio_value():,.2f}")
 print(f"Day trades remaining: {helper.get_day_trades_remaining()}")
 """)
 
-print("\n" + "=" * 70)
+print("\n" + _SEP)
 print("Key Benefits:")
 print("  - Native Python types (float, not strings)")
 print("  - Simple method calls (no complex parsing)")
@@ -285,4 +289,4 @@ print("  - Pattern Day Trader calculations built-in")
 print("  - Portfolio history with easy date ranges")
 print("  - Environment variable loading")
 print("  - Clean account status checks")
-print("=" * 70)
+print(_SEP)
@@ -5,25 +5,39 @@ This file demonstrates how to use the CryptoHelper class to fetch
 cryptocurrency market data with a clean, simple API.
 """
 
-from alpaca.data.crypto_helper import CryptoHelper
+import asyncio
+import time
+
+from alpaca.data.crypto_helper import CryptoHelper, bars_to_arrays
 
-# Initialize helper (auto-loads API keys from environment)
-helper = CryptoHelper()
+# Separator lines for the example output
+_SEP = "=" * 70
+_SUB = "-" * 70
+
+# Initialize helper (auto-loads API keys from environment). Closed historical
+# bars are cached on disk, so re-running the examples skips re-downloading them.
+helper = CryptoHelper(cache_dir="~/.cache/alpaca/bars")
 
 # Alternative: explicit credentials
 # helper = CryptoHelper(api_key="your_key", secret_key="your_secret")
 
-print("=" * 70)
+print(_SEP)
 print("CryptoHelper Examples - Simplified Cryptocurrency Data API")
-print("=" * 70)
+print(_SEP)
+
+# A snapshot already carries the latest quote, trade, minute bar and previous
+# daily bar, so fetch the snapshots once up front and reuse them in Examples
+# 1, 3, 7 and 8 instead of making a separate request for each field.
+snapshots = helper.get_snapshots(["BTC/USD", "ETH/USD", "SOL/USD"])
+snapshot = snapshots.get("BTC/USD")
 
 # ============================================================================
 # Example 1: Get Latest Quote
 # ============================================================================
 print("\n1. Latest Quote for BTC/USD:")
-print("-" * 70)
+print(_SUB)
 
-quote = helper.get_latest_quote("BTC/USD")
+quote = snapshot.latest_quote if snapshot else None
 if quote:
     print(f"Symbol: {quote.symbol}")
     print(f"Time: {quote.timestamp}")
@@ -36,20 +50,31 @@ if quote:
 # Example 2: Get Latest Quotes for Multiple Cryptos
 # ============================================================================
 print("\n2. Latest Quotes for Multiple Cryptocurrencies:")
-print("-" * 70)
+print(_SUB)
+
+# Subscribe once and let the WebSocket stream push quotes into memory instead
+# of polling the REST API. Symbols without a streamed quote yet fall back to a
+# single REST request.
+symbols = ["BTC/USD", "ETH/USD", "DOGE/USD"]
+helper.stream_quotes(symbols)
+time.sleep(2)
+
+for _ in range(3):
+    quotes = helper.get_latest_quotes(symbols)
+    for symbol, quote in quotes.items():
+        mid = (quote.bid_price + quote.ask_price) / 2
+        print(f"{symbol:10} Mid: ${mid:>10,.2f}")
+    time.sleep(1)
 
-quotes = helper.get_latest_quotes(["BTC/USD", "ETH/USD", "DOGE/USD"])
-for symbol, quote in quotes.items():
-    mid = (quote.bid_price + quote.ask_price) / 2
-    print(f"{symbol:10} Mid: ${mid:>10,.2f}")
+helper.stop_stream()
 
 # ============================================================================
 # Example 3: Get Latest Bar
 # ============================================================================
 print("\n3. Latest Minute Bar for BTC/USD:")
-print("-" * 70)
+print(_SUB)
 
-bar = helper.get_latest_bar("BTC/USD")
+bar = snapshot.latest_bar if snapshot else None
 if bar:
     print(f"Time: {bar.timestamp}")
     print(f"Open:   ${bar.open:>10,.2f}")
@@ -65,16 +90,17 @@ if bar:
 # Example 4: Get Hourly Bars for Past 24 Hours
 # ============================================================================
 print("\n4. Hourly Bars for BTC/USD (Last 24 Hours):")
-print("-" * 70)
+print(_SUB)
 
 bars = helper.get_bars("BTC/USD", timeframe="1H", days_back=1)
 print(f"Retrieved {len(bars)} bars")
-for bar in bars[-5:]:  # Show last 5 bars
-    change = bar.close - bar.open
-    arrow = "▲" if change >= 0 else "▼"
+# Percent changes for every bar in one vectorized operation
+pcts = helper.compute_returns(bars_to_arrays(bars))
+for bar, pct in zip(bars[-5:], pcts[-5:]):  # Show last 5 bars
+    arrow = "▲" if pct >= 0 else "▼"
     print(
-        f"{bar.timestamp.strftime('%Y-%m-%d %H:%M')} | "
-        f"Close: ${bar.close:>10,.2f} {arrow} ${abs(change):>6,.2f} | "
+        f"{bar.timestamp.isoformat(sep=' ', timespec='minutes')[:16]} | "
+        f"Close: ${bar.close:>10,.2f} {arrow} {abs(pct):>5.2f}% | "
         f"Vol: {bar.volume:>8.4f}"
     )
 
@@ -82,7 +108,7 @@ for bar in bars[-5:]:  # Show last 5 bars
 # Example 5: Get Multi-Symbol Bars
 # ============================================================================
 print("\n5. Daily Bars for Multiple Cryptos (Last 7 Days):")
-print("-" * 70)
+print(_SUB)
 
 multi_bars = helper.get_bars_multi(
     ["BTC/USD", "ETH/USD"], timeframe="1D", days_back=7
@@ -90,13 +116,12 @@ multi_bars = helper.get_bars_multi(
 
 for symbol, bars in multi_bars.items():
     if bars:
-        first = bars[0]
-        last = bars[-1]
-        change = last.close - first.open
-        pct = (change / first.open) * 100
+        cols = bars_to_arrays(bars)
+        opens, closes = cols["open"], cols["close"]
+        pct = (closes[-1] - opens[0]) / opens[0] * 100
         print(
-            f"{symbol:10} | Start: ${first.open:>10,.2f} | "
-            f"End: ${last.close:>10,.2f} | "
+            f"{symbol:10} | Start: ${opens[0]:>10,.2f} | "
+            f"End: ${closes[-1]:>10,.2f} | "
             f"Change: {pct:>+6.2f}%"
         )
 
@@ -104,14 +129,14 @@ for symbol, bars in multi_bars.items():
 # Example 6: Get Recent Trades
 # ============================================================================
 print("\n6. Recent Trades for BTC/USD (Last 10):")
-print("-" * 70)
+print(_SUB)
 
 trades = helper.get_trades("BTC/USD", limit=10)
 print(f"Retrieved {len(trades)} trades")
 for trade in trades[:5]:  # Show first 5
     side = trade.taker_side if trade.taker_side else "N/A"
     print(
-        f"{trade.timestamp.strftime('%H:%M:%S')} | "
+        f"{trade.timestamp.time().isoformat(timespec='seconds')} | "
         f"${trade.price:>10,.2f} | "
         f"Size: {trade.size:>8.6f} | "
         f"Side: {side:>4}"
@@ -121,9 +146,8 @@ for trade in trades[:5]:  # Show first 5
 # Example 7: Get Snapshot (All Latest Data)
 # ============================================================================
 print("\n7. Complete Snapshot for BTC/USD:")
-print("-" * 70)
+print(_SUB)
 
-snapshot = helper.get_snapshot("BTC/USD")
 if snapshot:
     print("Latest Quote:")
     if snapshot.latest_quote:
@@ -155,9 +179,8 @@ if snapshot:
 # Example 8: Get Snapshots for Multiple Cryptos
 # ============================================================================
 print("\n8. Snapshots for Multiple Cryptocurrencies:")
-print("-" * 70)
+print(_SUB)
 
-snapshots = helper.get_snapshots(["BTC/USD", "ETH/USD", "SOL/USD"])
 for symbol, snap in snapshots.items():
     if snap.latest_bar:
         print(f"{symbol:10} Close: ${snap.latest_bar.close:>10,.2f}")
@@ -166,12 +189,21 @@ for symbol, snap in snapshots.items():
 # Example 9: Different Timeframes
 # ============================================================================
 print("\n9. Different Timeframe Options:")
-print("-" * 70)
+print(_SUB)
 
 timeframes = ["1Min", "5Min", "15Min", "1H", "4H", "1D"]
+
+
+async def fetch_timeframes():
+    # The fetches are independent, so run them concurrently instead of one
+    # round-trip after another.
+    return await asyncio.gather(
+        *[helper.aget_bars("BTC/USD", timeframe=tf, limit=1) for tf in timeframes]
+    )
+
+
 print("Supported timeframes:")
-for tf in timeframes:
-    bars = helper.get_bars("BTC/USD", timeframe=tf, limit=1)
+for tf, bars in zip(timeframes, asyncio.run(fetch_timeframes())):
     if bars:
         print(f"  {tf:6} - Latest: ${bars[0].close:,.2f}")
 
@@ -179,7 +211,7 @@ for tf in timeframes:
 # Example 10: Old API vs New API Comparison
 # ============================================================================
 print("\n10. Old API vs New API Comparison:")
-print("-" * 70)
+print(_SUB)
 
 print("\nOLD WAY (Complex):")
 print("""
@@ -212,7 +244,7 @@ for bar in bars:
     print(f"Close: {bar.close}")  # Already a float!
 """)
 
-print("\n" + "=" * 70)
+print("\n" + _SEP)
 print("Key Benefits:")
 print("  - Simple timeframe strings (no TimeFrame objects)")
 print("  - Automatic date calculations (days_back parameter)")
@@ -220,4 +252,4 @@ print("  - Native Python types (float, int, not strings)")
 print("  - No complex request objects")
 print("  - Environment variable loading")
 print("  - Multi-symbol support built-in")
-print("=" * 70)
+print(_SEP)
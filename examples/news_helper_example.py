@@ -5,10 +5,18 @@ This script demonstrates how to use NewsHelper to access financial news
 data from Alpaca's News API.
 """
 
+import asyncio
+import io
+import sys
+import threading
+from collections import Counter
 from datetime import datetime, timezone
 
 from alpaca.data.news_helper import NewsHelper
 
+# Separator lines for the example output
+_SEP = "=" * 60
+
 
 def example_1_latest_news():
     """Example 1: Get latest news articles."""
@@ -145,22 +153,20 @@ def example_8_search_historical_news():
 
     helper = NewsHelper()
 
-    # Search for news mentions over the past month
-    articles = helper.search_news(
+    # Search for news mentions over the past month, counting sources as the
+    # articles stream in instead of holding the whole result list in memory
+    articles = helper.stream_search_news(
         ["AMD"],
         days_back=30,
         limit=100
     )
+    sources = Counter(article.source for article in articles)
 
-    print(f"Found {len(articles)} AMD articles in the past month")
+    print(f"Found {sum(sources.values())} AMD articles in the past month")
 
     # Analyze by source
-    sources = {}
-    for article in articles:
-        sources[article.source] = sources.get(article.source, 0) + 1
-
     print("Articles by source:")
-    for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True)[:5]:
+    for source, count in sources.most_common(5):
         print(f"  {source}: {count} articles")
 
 
@@ -177,14 +183,16 @@ def example_9_sector_news_monitoring():
     print(f"Found {len(articles)} tech sector articles in the past day:")
 
     # Show most mentioned stocks
-    mentions = {}
-    for article in articles:
-        for symbol in article.symbols:
-            if symbol in tech_stocks:
-                mentions[symbol] = mentions.get(symbol, 0) + 1
+    tech_stocks_set = frozenset(tech_stocks)
+    mentions = Counter(
+        symbol
+        for article in articles
+        for symbol in article.symbols
+        if symbol in tech_stocks_set
+    )
 
     print("\nMost mentioned tech stocks:")
-    for symbol, count in sorted(mentions.items(), key=lambda x: x[1], reverse=True):
+    for symbol, count in mentions.most_common():
         print(f"  {symbol}: {count} articles")
 
 
@@ -245,10 +253,40 @@ def example_10_old_vs_new_api():
     print("\n✅ 70% less code with NewsHelper!")
 
 
-def main():
-    """Run all examples."""
+class _PerThreadOutput(io.TextIOBase):
+    """Stdout replacement that sends each thread's output to its own buffer.
+
+    Lets the examples run concurrently while still printing each one's
+    output as a contiguous block.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def run_captured(self, example_func) -> str:
+        """Run an example, returning everything it printed."""
+        self._local.buffer = io.StringIO()
+        try:
+            example_func()
+        except Exception as e:
+            print(f"Error in {example_func.__name__}: {e}")
+        finally:
+            output = self._local.buffer.getvalue()
+            del self._local.buffer
+        return output
+
+
+async def amain():
+    """Run all examples concurrently."""
     print("NewsHelper Examples")
-    print("=" * 60)
+    print(_SEP)
 
     examples = [
         example_1_latest_news,
@@ -263,15 +301,32 @@ def main():
         example_10_old_vs_new_api,
     ]
 
-    for example_func in examples:
-        try:
-            example_func()
-        except Exception as e:
-            print(f"Error in {example_func.__name__}: {e}")
-
-    print("\n" + "=" * 60)
+    # The examples share no state, so their requests can overlap. Output is
+    # buffered per example and printed in order once all have finished.
+    stdout = _PerThreadOutput(sys.stdout)
+    sys.stdout = stdout
+    try:
+        loop = asyncio.get_running_loop()
+        outputs = await asyncio.gather(
+            *[
+                loop.run_in_executor(None, stdout.run_captured, example_func)
+                for example_func in examples
+            ]
+        )
+    finally:
+        sys.stdout = stdout._stream
+
+    for output in outputs:
+        print(output, end="")
+
+    print("\n" + _SEP)
     print("Examples complete!")
 
 
+def main():
+    """Run all examples."""
+    asyncio.run(amain())
+
+
 if __name__ == "__main__":
     main()
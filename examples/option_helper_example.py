@@ -11,13 +11,28 @@ Before running:
 """
 
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 from alpaca.data.option_helper import OptionHelper
 
+# Separator lines for the example output
+_SEP = "=" * 70
+
 # Load environment variables from .env file
 load_dotenv()
 
+
+@lru_cache(maxsize=None)
+def get_options() -> OptionHelper:
+    """Return the helper shared by all examples, created on first use.
+
+    OptionHelper reads ALPACA_API_KEY/ALPACA_SECRET_KEY from the environment,
+    so there is no need to look the keys up and build a new helper per example.
+    """
+    return OptionHelper()
+
 # ============================================================================
 # OLD WAY (Complex, Multiple Clients & Calls)
 # ============================================================================
@@ -66,9 +81,7 @@ def new_way_example():
     """The new, simple way with OptionHelper."""
 
     # Initialize once (reads from environment variables automatically)
-    api_key = os.getenv("ALPACA_API_KEY")
-    secret_key = os.getenv("ALPACA_SECRET_KEY")
-    options = OptionHelper(api_key=api_key, secret_key=secret_key)
+    options = get_options()
 
     # Get everything in one call!
     data = options.get_option("AAPL250117C00150000")
@@ -100,9 +113,7 @@ def new_way_example():
 def multiple_options_example():
     """Get multiple options at once."""
 
-    api_key = os.getenv("ALPACA_API_KEY")
-    secret_key = os.getenv("ALPACA_SECRET_KEY")
-    options = OptionHelper(api_key=api_key, secret_key=secret_key)
+    options = get_options()
 
     # Get multiple options with one call
     symbols = [
@@ -129,9 +140,7 @@ def option_chain_example():
     """Get entire option chain."""
     from datetime import datetime
 
-    api_key = os.getenv("ALPACA_API_KEY")
-    secret_key = os.getenv("ALPACA_SECRET_KEY")
-    options = OptionHelper(api_key=api_key, secret_key=secret_key)
+    options = get_options()
 
     # Get all options for AAPL expiring Jan 17, 2025
     expiration = datetime(2025, 1, 17)
@@ -160,33 +169,28 @@ def find_best_options():
     """Find options with specific criteria."""
     from datetime import datetime
 
-    api_key = os.getenv("ALPACA_API_KEY")
-    secret_key = os.getenv("ALPACA_SECRET_KEY")
-    options = OptionHelper(api_key=api_key, secret_key=secret_key)
+    options = get_options()
 
-    # Get the chain
+    # Get the chain as a DataFrame
     exp = datetime(2025, 2, 21)
-    chain = options.get_option_chain("SPY", expiration=exp)
-
-    # Filter for liquid, ATM puts with good IV
-    candidates = [
-        opt
-        for opt in chain
-        if (
-            opt.option_type == "put"
-            and abs(opt.delta) > 0.4
-            and opt.implied_volatility > 0.20
-            and opt.bid
-            and opt.ask
-            and (opt.ask - opt.bid) < 0.50  # Tight spread
-        )
+    df = options.get_option_chain_df("SPY", expiration=exp)
+
+    # Filter for liquid, ATM puts with good IV in one vectorized pass
+    spread = df["ask"] - df["bid"]
+    candidates = df[
+        (df["option_type"] == "put")
+        & (df["delta"].abs() > 0.4)
+        & (df["implied_volatility"] > 0.20)
+        & (df["bid"] > 0)
+        & (df["ask"] > 0)
+        & (spread < 0.50)  # Tight spread
     ]
 
-    # Sort by IV (highest first)
-    candidates.sort(key=lambda x: x.implied_volatility, reverse=True)
+    # Top 5 by IV (highest first)
+    top = candidates.nlargest(5, "implied_volatility")
 
     print("Top 5 candidates for selling puts:")
-    for i, opt in enumerate(candidates[:5], 1):
+    for i, opt in enumerate(top.itertuples(), 1):
         spread = opt.ask - opt.bid
         print(f"{i}. Strike ${opt.strike}:")
         print(f"   Bid/Ask: ${opt.bid:.2f}/${opt.ask:.2f} (spread: ${spread:.2f})")
@@ -205,9 +209,9 @@ if __name__ == "__main__":
         print("ALPACA_SECRET_KEY=your_secret_here")
         exit(1)
 
-    print("=" * 70)
+    print(_SEP)
     print("NEW SIMPLIFIED OPTION API")
-    print("=" * 70)
+    print(_SEP)
     print("\n# Simple single option lookup:")
     print("from dotenv import load_dotenv")
     print("load_dotenv()")
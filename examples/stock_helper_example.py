@@ -3,44 +3,248 @@ Example usage of the StockHelper simplified stock data API.
 
 This example demonstrates how the StockHelper class simplifies fetching
 stock market data compared to using the raw API.
+
+Run with ``--async`` to fetch the same data with asyncio.gather and the
+helper's async methods instead of a thread pool.
+
+Large bar/quote/trade responses decode faster with orjson. Install it with
+``pip install orjson`` (or the ``fast-json`` extra) and the client uses it
+automatically; no code changes are needed.
 """
 
+import asyncio
+import hashlib
 import os
-from datetime import datetime, timedelta
-from alpaca.data.stock_helper import StockHelper
-
-# Load environment variables from .env file
+import pickle
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from dotenv import load_dotenv
-load_dotenv()
-
-# Validate required environment variables
-required_vars = ["ALPACA_API_KEY", "ALPACA_SECRET_KEY"]
-missing_vars = [var for var in required_vars if not os.getenv(var)]
-if missing_vars:
-    raise ValueError(
-        f"Missing required environment variables: {', '.join(missing_vars)}\n"
-        "Please create a .env file with ALPACA_API_KEY and ALPACA_SECRET_KEY"
+
+# Separator lines for the example output
+_SEP = "=" * 60
+
+# Maximum requests in flight at once. Alpaca enforces per-minute request
+# caps, and bursts far above this mostly buy HTTP 429s and retry backoff.
+MAX_INFLIGHT = 5
+
+# Line templates for the per-item output loops
+_BAR_FMT = "  %s: Close $%.2f, Vol %s\n"
+_QUOTE_FMT = "  %s: Bid $%.2f / Ask $%.2f (spread: $%.2f)\n"
+_TRADE_FMT = "  %s: $%.2f x %s\n"
+_SNAPSHOT_FMT = "  • %s: $%.2f / $%.2f\n"
+
+# Environment variables the example needs
+_REQUIRED_VARS = ("ALPACA_API_KEY", "ALPACA_SECRET_KEY")
+
+
+@lru_cache(maxsize=1)
+def _ensure_env():
+    """Load .env and validate required variables, once per process."""
+    load_dotenv()
+    missing_vars = [var for var in _REQUIRED_VARS if not os.environ.get(var)]
+    if missing_vars:
+        raise ValueError(
+            f"Missing required environment variables: {', '.join(missing_vars)}\n"
+            "Please create a .env file with ALPACA_API_KEY and ALPACA_SECRET_KEY"
+        )
+
+# Seconds a cached historical response stays fresh, by bar timeframe.
+# Quote/trade windows that ended before today never change and never expire.
+_BAR_TTLS = {"1D": 7 * 24 * 3600, "1H": 3600}
+
+
+class FileCache:
+    """
+    Minimal on-disk cache for historical market data.
+
+    Each entry is a pickled ``(timestamp, payload)`` tuple stored under the
+    md5 of its key, so re-running the example skips requests whose data
+    cannot have changed. Latest quotes and snapshots are never cached.
+    """
+
+    def __init__(self, directory: str = ".cache"):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(
+            self.directory, hashlib.md5(key.encode()).hexdigest() + ".pkl"
+        )
+
+    def get(self, key: str, ttl):
+        """Return the cached payload, or None if missing or older than ttl."""
+        try:
+            with open(self._path(key), "rb") as f:
+                stored_at, payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if ttl is not None and time.time() - stored_at > ttl:
+            return None
+        return payload
+
+    def set(self, key: str, payload) -> None:
+        """Store payload under key, replacing any previous entry."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((time.time(), payload), f)
+        os.replace(tmp_path, path)
+
+
+def cached_fetch(cache: FileCache, key: str, ttl, fetch, *args, **kwargs):
+    """Return ``fetch(*args, **kwargs)``, served from cache while fresh."""
+    payload = cache.get(key, ttl)
+    if payload is None:
+        payload = fetch(*args, **kwargs)
+        cache.set(key, payload)
+    return payload
+
+
+@lru_cache(maxsize=256)
+def _fetch_bars_memo(helper, cache, symbol, timeframe, start_ts, end_ts, limit):
+    start = datetime.fromtimestamp(start_ts, timezone.utc)
+    end = datetime.fromtimestamp(end_ts, timezone.utc)
+    return cached_fetch(
+        cache,
+        f"bars|{symbol}|{timeframe}|{start}|{end}|{limit}",
+        _BAR_TTLS.get(timeframe),
+        helper.get_bars,
+        symbol,
+        timeframe=timeframe,
+        start=start,
+        end=end,
+        limit=limit,
+    )
+
+
+def fetch_bars(helper, cache, symbol, timeframe, start, end, limit=None):
+    """
+    Fetch bars through an in-process LRU on top of the disk cache.
+
+    Repeat lookups of the same range within one run return the same list
+    object without unpickling it again. Datetimes are reduced to epoch
+    seconds so the arguments are hashable and compare consistently.
+    """
+    return _fetch_bars_memo(
+        helper,
+        cache,
+        symbol,
+        timeframe,
+        int(start.timestamp()),
+        int(end.timestamp()),
+        limit,
     )
 
 
 def main():
     """Run stock helper examples."""
+    # Imported here so importing this module stays cheap
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    from alpaca.data.stock_helper import StockHelper
+
+    _ensure_env()
+
+    # Send every request through one keep-alive session. Connections (and
+    # their TLS handshakes) are reused across calls and shared by the worker
+    # threads below. Helpers use a shared pooled session by default; passing
+    # one explicitly lets you size the pool yourself.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
     # Initialize the helper (automatically loads from environment)
-    helper = StockHelper()
+    helper = StockHelper(session=session)
 
-    print("=" * 60)
+    print(_SEP)
     print("StockHelper Example - Simplified Stock Data API")
-    print("=" * 60)
+    print(_SEP)
     print()
 
+    # None of the requests below depend on each other, so they are all
+    # submitted up front and the examples print their results in order.
+    # Total wait is the slowest request rather than the sum of all of them.
+    #
+    # Latest quote, trade and bar for every symbol come from one snapshot
+    # request; StockSnapshotRequest(symbol_or_symbols=[...]) accepts up to
+    # 200 symbols, so Examples 1-3, 9 and 10 read from that one result.
+    #
+    # Historical ranges are aligned to hour/day boundaries so repeat runs
+    # produce the same cache keys and are served from .cache/ on disk.
+    cache = FileCache()
+    # Timestamps are timezone-aware UTC; naive datetimes would be sent as if
+    # they were already UTC.
+    hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    today = hour.replace(hour=0)
+    end_date = today
+    start_date = end_date - timedelta(days=30)
+    yesterday = today - timedelta(days=1)
+    with ThreadPoolExecutor(max_workers=MAX_INFLIGHT) as executor:
+        futures = {
+            "snapshots": executor.submit(
+                helper.get_snapshots, ["SPY", "QQQ", "IWM"]
+            ),
+            "hourly_bars": executor.submit(
+                fetch_bars,
+                helper,
+                cache,
+                "SPY",
+                "1H",
+                hour - timedelta(days=5),
+                hour,
+                10,
+            ),
+            "daily_bars": executor.submit(
+                fetch_bars, helper, cache, "SPY", "1D", start_date, end_date
+            ),
+            "multi_bars": executor.submit(
+                cached_fetch,
+                cache,
+                f"bars|SPY,QQQ,IWM|1D|{today - timedelta(days=5)}|{today}|None",
+                _BAR_TTLS["1D"],
+                helper.get_bars_multi,
+                ["SPY", "QQQ", "IWM"],
+                timeframe="1D",
+                start=today - timedelta(days=5),
+                end=today,
+            ),
+            "quotes": executor.submit(
+                cached_fetch,
+                cache,
+                f"quotes|SPY|{yesterday}|{today}|5",
+                None,
+                helper.get_quotes,
+                "SPY",
+                start=yesterday,
+                end=today,
+                limit=5,
+            ),
+            "trades": executor.submit(
+                cached_fetch,
+                cache,
+                f"trades|SPY|{yesterday}|{today}|5",
+                None,
+                helper.get_trades,
+                "SPY",
+                start=yesterday,
+                end=today,
+                limit=5,
+            ),
+        }
+
     # ==================== Latest Quote ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Latest Quote Data")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 1: Get latest quote for SPY")
     try:
-        quote = helper.get_latest_quote("SPY")
+        quote = futures["snapshots"].result()["SPY"].latest_quote
         spread = quote.ask_price - quote.bid_price
         midpoint = (quote.bid_price + quote.ask_price) / 2
         
@@ -55,21 +259,27 @@ def main():
     # ==================== Multiple Quotes ====================
     print("\nExample 2: Get latest quotes for multiple symbols")
     try:
-        quotes = helper.get_latest_quotes(["SPY", "QQQ", "IWM"])
+        quotes = {
+            symbol: snapshot.latest_quote
+            for symbol, snapshot in futures["snapshots"].result().items()
+            if snapshot.latest_quote
+        }
         print(f"✓ Retrieved quotes for {len(quotes)} symbols:")
-        for symbol, quote in quotes.items():
-            print(f"  • {symbol}: Bid ${quote.bid_price:.2f} / Ask ${quote.ask_price:.2f}")
+        sys.stdout.write("".join(
+            f"  • {symbol}: Bid ${quote.bid_price:.2f} / Ask ${quote.ask_price:.2f}\n"
+            for symbol, quote in quotes.items()
+        ))
     except Exception as e:
         print(f"✗ Error: {e}")
 
     # ==================== Latest Bar ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Latest Bar (OHLCV) Data")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 3: Get latest bar for SPY")
     try:
-        bar = helper.get_latest_bar("SPY")
+        bar = futures["snapshots"].result()["SPY"].latest_bar
         change = bar.close - bar.open
         change_pct = (change / bar.open) * 100
         
@@ -86,31 +296,25 @@ def main():
         print(f"✗ Error: {e}")
 
     # ==================== Historical Bars ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Historical Bar Data")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 4: Get hourly bars for last 5 days")
     try:
-        bars = helper.get_bars("SPY", timeframe="1H", days_back=5, limit=10)
+        bars = futures["hourly_bars"].result()
         print(f"✓ Retrieved {len(bars)} hourly bars:")
-        for bar in bars[:5]:  # Show first 5
-            print(f"  {bar.timestamp}: Close ${bar.close:.2f}, Vol {bar.volume:,}")
+        lines = []
+        for bar in islice(bars, 5):  # Show first 5
+            ts, close, vol = bar.timestamp, bar.close, bar.volume
+            lines.append(_BAR_FMT % (ts, close, f"{vol:,}"))
+        sys.stdout.write("".join(lines))
     except Exception as e:
         print(f"✗ Error: {e}")
 
     print("\nExample 5: Get daily bars with specific date range")
     try:
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
-        
-        bars = helper.get_bars(
-            "SPY",
-            timeframe="1D",
-            start=start_date,
-            end=end_date
-        )
-        
+        bars = futures["daily_bars"].result()
         print(f"✓ Retrieved {len(bars)} daily bars from {start_date.date()} to {end_date.date()}")
         if bars:
             first_bar = bars[0]
@@ -122,62 +326,78 @@ def main():
     except Exception as e:
         print(f"✗ Error: {e}")
 
+    print("\nExample 5b: Stream a large range of minute bars page by page")
+    try:
+        # iter_bars yields each page (up to 10,000 bars) as it arrives, so
+        # memory stays flat even for years of minute data.
+        count = 0
+        volume = 0
+        notional = 0.0
+        for bar in helper.iter_bars("SPY", timeframe="1Min", start=start_date, end=end_date):
+            count += 1
+            volume += bar.volume
+            notional += bar.close * bar.volume
+        print(f"✓ Processed {count:,} minute bars without holding them in memory")
+        if volume:
+            print(f"  Volume-weighted close: ${notional / volume:.2f}")
+    except Exception as e:
+        print(f"✗ Error: {e}")
+
     # ==================== Multi-Symbol Bars ====================
     print("\nExample 6: Get bars for multiple symbols")
     try:
-        symbols = ["SPY", "QQQ", "IWM"]
-        bars_dict = helper.get_bars_multi(
-            symbols,
-            timeframe="1D",
-            days_back=5
-        )
-        
+        bars_dict = futures["multi_bars"].result()
         print(f"✓ Retrieved bars for {len(bars_dict)} symbols:")
-        for symbol, bars in bars_dict.items():
-            if bars:
-                latest = bars[-1]
-                print(f"  • {symbol}: {len(bars)} bars, latest close ${latest.close:.2f}")
+        sys.stdout.write("".join(
+            f"  • {symbol}: {len(bars)} bars, latest close ${bars[-1].close:.2f}\n"
+            for symbol, bars in bars_dict.items()
+            if bars
+        ))
     except Exception as e:
         print(f"✗ Error: {e}")
 
     # ==================== Historical Quotes ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Historical Quote Data (Bid/Ask)")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 7: Get recent quotes")
     try:
-        quotes = helper.get_quotes("SPY", days_back=1, limit=5)
+        quotes = futures["quotes"].result()
         print(f"✓ Retrieved {len(quotes)} recent quotes:")
-        for quote in quotes[:3]:
-            spread = quote.ask_price - quote.bid_price
-            print(f"  {quote.timestamp}: Bid ${quote.bid_price:.2f} / "
-                  f"Ask ${quote.ask_price:.2f} (spread: ${spread:.2f})")
+        lines = []
+        for quote in islice(quotes, 3):
+            ts, bid, ask = quote.timestamp, quote.bid_price, quote.ask_price
+            lines.append(_QUOTE_FMT % (ts, bid, ask, ask - bid))
+        sys.stdout.write("".join(lines))
     except Exception as e:
         print(f"✗ Error: {e}")
 
     # ==================== Historical Trades ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Historical Trade Data (Ticks)")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 8: Get recent trades")
     try:
-        trades = helper.get_trades("SPY", days_back=1, limit=5)
+        trades = futures["trades"].result()
         print(f"✓ Retrieved {len(trades)} recent trades:")
-        for trade in trades[:3]:
-            print(f"  {trade.timestamp}: ${trade.price:.2f} x {trade.size}")
+        lines = []
+        for trade in islice(trades, 3):
+            ts, price, size = trade.timestamp, trade.price, trade.size
+            lines.append(_TRADE_FMT % (ts, price, size))
+        sys.stdout.write("".join(lines))
     except Exception as e:
         print(f"✗ Error: {e}")
 
     # ==================== Snapshots ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Snapshot Data (Latest Everything)")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 9: Get snapshot for SPY")
     try:
-        snapshot = helper.get_snapshot("SPY")
+        snapshot = futures["snapshots"].result()["SPY"]
         print("✓ SPY Snapshot:")
         
         if snapshot.latest_quote:
@@ -203,19 +423,21 @@ def main():
 
     print("\nExample 10: Get snapshots for multiple symbols")
     try:
-        snapshots = helper.get_snapshots(["SPY", "QQQ", "IWM"])
+        snapshots = futures["snapshots"].result()
         print(f"✓ Retrieved snapshots for {len(snapshots)} symbols:")
+        lines = []
         for symbol, snapshot in snapshots.items():
-            if snapshot.latest_quote:
-                print(f"  • {symbol}: ${snapshot.latest_quote.bid_price:.2f} / "
-                      f"${snapshot.latest_quote.ask_price:.2f}")
+            quote = snapshot.latest_quote
+            if quote:
+                lines.append(_SNAPSHOT_FMT % (symbol, quote.bid_price, quote.ask_price))
+        sys.stdout.write("".join(lines))
     except Exception as e:
         print(f"✗ Error: {e}")
 
     # ==================== Timeframe Examples ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Supported Timeframes")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nAvailable timeframe formats:")
     print("  • Minutes: '1Min', '5Min', '15Min', '30Min'")
@@ -225,9 +447,9 @@ def main():
     print("  • Months:  '1M', '1Month'")
 
     # ==================== Comparison: Old vs New API ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("API Comparison: Old Way vs New Way")
-    print("=" * 60)
+    print(_SEP)
 
     print("\n📛 OLD WAY (Complex):")
     print("""
@@ -270,10 +492,51 @@ def main():
         print(f"{bar.timestamp}: ${bar.close}, Vol: {bar.volume}")
     """)
 
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Example completed!")
-    print("=" * 60)
+    print(_SEP)
+
+
+async def main_async():
+    """Fetch the example data concurrently with asyncio instead of threads."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    from alpaca.data.stock_helper import StockHelper
+
+    _ensure_env()
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    helper = StockHelper(session=session)
+    symbols = ["SPY", "QQQ", "IWM"]
+
+    print(_SEP)
+    print("StockHelper Async Example")
+    print(_SEP)
+
+    try:
+        snapshots, hourly_bars, multi_bars, quotes, trades = await asyncio.gather(
+            helper.aget_snapshots(symbols),
+            helper.aget_bars("SPY", timeframe="1H", days_back=5, limit=10),
+            helper.aget_bars_multi(symbols, timeframe="1D", days_back=5),
+            helper.aget_quotes("SPY", days_back=1, limit=5),
+            helper.aget_trades("SPY", days_back=1, limit=5),
+        )
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return
+    finally:
+        session.close()
+
+    print(f"✓ Snapshots for {len(snapshots)} symbols")
+    print(f"✓ {len(hourly_bars)} hourly SPY bars")
+    print(f"✓ Daily bars for {len(multi_bars)} symbols")
+    print(f"✓ {len(quotes)} SPY quotes, {len(trades)} SPY trades")
 
 
 if __name__ == "__main__":
-    main()
+    if "--async" in sys.argv[1:]:
+        asyncio.run(main_async())
+    else:
+        main()
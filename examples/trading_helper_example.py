@@ -6,31 +6,63 @@ trading operations compared to using the raw API.
 """
 
 import os
-from alpaca.trading.trading_helper import TradingHelper
-from alpaca.trading.enums import QueryOrderStatus, TimeInForce
-
-# Load environment variables from .env file
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from dotenv import load_dotenv
-load_dotenv()
-
-# Validate required environment variables
-required_vars = ["ALPACA_API_KEY", "ALPACA_SECRET_KEY"]
-missing_vars = [var for var in required_vars if not os.getenv(var)]
-if missing_vars:
-    raise ValueError(
-        f"Missing required environment variables: {', '.join(missing_vars)}\n"
-        "Please create a .env file with ALPACA_API_KEY and ALPACA_SECRET_KEY"
-    )
+
+# Separator lines for the example output
+_SEP = "=" * 60
+
+# Maximum requests in flight at once. Alpaca enforces per-minute request
+# caps, and bursts far above this mostly buy HTTP 429s and retry backoff.
+MAX_INFLIGHT = 5
+
+# Environment variables the example needs
+_REQUIRED_VARS = ("ALPACA_API_KEY", "ALPACA_SECRET_KEY")
+
+
+@lru_cache(maxsize=1)
+def _ensure_env():
+    """Load .env and validate required variables, once per process."""
+    load_dotenv()
+    missing_vars = [var for var in _REQUIRED_VARS if not os.environ.get(var)]
+    if missing_vars:
+        raise ValueError(
+            f"Missing required environment variables: {', '.join(missing_vars)}\n"
+            "Please create a .env file with ALPACA_API_KEY and ALPACA_SECRET_KEY"
+        )
 
 
 def main():
     """Run trading helper examples."""
-    # Initialize the helper (automatically loads from environment)
-    helper = TradingHelper()
+    # Imported here so importing this module stays cheap
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    from alpaca.trading.enums import QueryOrderStatus, TimeInForce
+    from alpaca.trading.trading_helper import TradingHelper
+
+    _ensure_env()
 
-    print("=" * 60)
+    # Send every request through one keep-alive session. Connections (and
+    # their TLS handshakes) are reused across calls and shared by the worker
+    # threads below. Helpers use a shared pooled session by default; passing
+    # one explicitly lets you size the pool yourself.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+    # Initialize the helper (automatically loads from environment).
+    # Account lookups made within account_cache_ttl seconds of each other,
+    # including concurrent ones from several threads, share one /v2/account
+    # request. A strategy loop can shrink the window for fresher balances
+    # or widen it to save requests.
+    helper = TradingHelper(session=session, account_cache_ttl=0.25)
+
+    print(_SEP)
     print("TradingHelper Example - Simplified Trading API")
-    print("=" * 60)
+    print(_SEP)
     print()
 
     # Check if using paper trading
@@ -39,22 +71,24 @@ def main():
     print()
 
     # ==================== Account Information ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Account Information")
-    print("=" * 60)
+    print(_SEP)
 
-    cash = helper.get_cash()
-    buying_power = helper.get_buying_power()
-    portfolio_value = helper.get_portfolio_value()
+    # One request returns every account field
+    account = helper.get_account()
+    cash = account.cash
+    buying_power = account.buying_power
+    portfolio_value = account.portfolio_value
 
     print(f"Cash: ${cash:,.2f}")
     print(f"Buying Power: ${buying_power:,.2f}")
     print(f"Portfolio Value: ${portfolio_value:,.2f}")
 
     # ==================== Simple Market Orders ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Simple Market Orders")
-    print("=" * 60)
+    print(_SEP)
 
     # Example 1: Buy market order
     print("\nExample 1: Buy 1 share of SPY at market")
@@ -78,9 +112,9 @@ def main():
         print(f"✗ Error: {e}")
 
     # ==================== Limit Orders ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Limit Orders")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 3: Buy SPY with limit price")
     try:
@@ -92,9 +126,9 @@ def main():
         print(f"✗ Error: {e}")
 
     # ==================== Bracket Orders ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Bracket Orders (with Stop Loss & Take Profit)")
-    print("=" * 60)
+    print(_SEP)
 
     print("\nExample 4: Buy with stop loss and take profit")
     try:
@@ -123,23 +157,38 @@ def main():
     except Exception as e:
         print(f"✗ Error: {e}")
 
+    # Positions and orders are read after the orders above are submitted.
+    # The reads don't depend on each other, so fetch them all concurrently
+    # and let Examples 6-10 print the results in order.
+    with ThreadPoolExecutor(max_workers=MAX_INFLIGHT) as executor:
+        futures = {
+            "positions": executor.submit(helper.get_all_positions),
+            "spy_position": executor.submit(helper.get_position, "SPY"),
+            "open_orders": executor.submit(helper.get_orders),
+            "all_orders": executor.submit(
+                helper.get_orders, status=QueryOrderStatus.ALL, limit=5
+            ),
+        }
+
     # ==================== Position Management ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Position Management")
-    print("=" * 60)
+    print(_SEP)
 
     # Get all positions
     print("\nExample 6: Get all open positions")
     try:
-        positions = helper.get_all_positions()
+        positions = futures["positions"].result()
         if positions:
             print(f"✓ Found {len(positions)} open position(s):")
+            lines = []
             for pos in positions:
                 pnl_color = "+" if pos.unrealized_pl >= 0 else ""
-                print(f"  • {pos.symbol}: {pos.qty} shares @ ${pos.avg_entry_price:.2f}")
-                print(f"    Current: ${pos.current_price:.2f}")
-                print(f"    P&L: {pnl_color}${pos.unrealized_pl:.2f} "
-                      f"({pnl_color}{pos.unrealized_plpc * 100:.2f}%)")
+                lines.append(f"  • {pos.symbol}: {pos.qty} shares @ ${pos.avg_entry_price:.2f}")
+                lines.append(f"    Current: ${pos.current_price:.2f}")
+                lines.append(f"    P&L: {pnl_color}${pos.unrealized_pl:.2f} "
+                             f"({pnl_color}{pos.unrealized_plpc * 100:.2f}%)")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("✓ No open positions")
     except Exception as e:
@@ -148,7 +197,7 @@ def main():
     # Get specific position
     print("\nExample 7: Get position for SPY")
     try:
-        position = helper.get_position("SPY")
+        position = futures["spy_position"].result()
         print("✓ SPY Position:")
         print(f"  Qty: {position.qty}")
         print(f"  Market Value: ${position.market_value:,.2f}")
@@ -166,20 +215,22 @@ def main():
     print("  # order = helper.close_position('SPY', qty=5)")
 
     # ==================== Order Management ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Order Management")
-    print("=" * 60)
+    print(_SEP)
 
     # Get open orders
     print("\nExample 9: Get all open orders")
     try:
-        orders = helper.get_orders()
+        orders = futures["open_orders"].result()
         if orders:
             print(f"✓ Found {len(orders)} open order(s):")
+            lines = []
             for order in orders:
-                print(f"  • {order.symbol}: {order.side} {order.qty} @ {order.type}")
-                print(f"    Status: {order.status}")
-                print(f"    ID: {order.id}")
+                lines.append(f"  • {order.symbol}: {order.side} {order.qty} @ {order.type}")
+                lines.append(f"    Status: {order.status}")
+                lines.append(f"    ID: {order.id}")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("✓ No open orders")
     except Exception as e:
@@ -188,14 +239,16 @@ def main():
     # Get all orders (including filled)
     print("\nExample 10: Get all orders (including filled)")
     try:
-        all_orders = helper.get_orders(status=QueryOrderStatus.ALL, limit=5)
+        all_orders = futures["all_orders"].result()
         if all_orders:
             print(f"✓ Found {len(all_orders)} recent order(s):")
-            for order in all_orders[:3]:  # Show first 3
+            lines = []
+            for order in islice(all_orders, 3):  # Show first 3
                 filled_info = ""
                 if order.filled_qty > 0:
                     filled_info = f", Filled: {order.filled_qty} @ ${order.filled_avg_price:.2f}"
-                print(f"  • {order.symbol}: {order.status}{filled_info}")
+                lines.append(f"  • {order.symbol}: {order.status}{filled_info}")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("✓ No orders found")
     except Exception as e:
@@ -205,13 +258,13 @@ def main():
     print("\nExample 11: Cancel orders (examples - commented out)")
     print("  # Cancel specific order:")
     print("  # helper.cancel_order(order_id)")
-    print("  # Cancel ALL open orders:")
+    print("  # Cancel ALL open orders in one request (not one DELETE per order):")
     print("  # helper.cancel_all_orders()")
 
     # ==================== Comparison: Old vs New API ====================
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("API Comparison: Old Way vs New Way")
-    print("=" * 60)
+    print(_SEP)
 
     print("\n📛 OLD WAY (Complex):")
     print("""
@@ -246,9 +299,9 @@ def main():
     )
     """)
 
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Example completed!")
-    print("=" * 60)
+    print(_SEP)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+from requests import Session
+
+from alpaca.common.constants import DEFAULT_POOL_MAXSIZE
+from alpaca.common.rest import get_shared_session
+from alpaca.trading.client import TradingClient
+
+
+def test_session_keeps_pooled_connections():
+    client = TradingClient("key-id", "secret-key")
+
+    adapter = client._session.get_adapter("https://paper-api.alpaca.markets")
+
+    assert adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
+
+
+def test_client_uses_provided_session():
+    session = Session()
+
+    client = TradingClient("key-id", "secret-key", session=session)
+
+    assert client._session is session
+
+
+def test_shared_session_is_reused():
+    assert get_shared_session() is get_shared_session()
@@ -2,114 +2,180 @@
 Tests for CryptoHelper simplified crypto data API.
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from alpaca.data.models import Bar, Quote, Snapshot, Trade
 from alpaca.data.crypto_helper import (
+    MAX_SYMBOLS_PER_REQUEST,
     CryptoBarData,
     CryptoHelper,
     CryptoQuoteData,
     CryptoSnapshotData,
     CryptoTradeData,
+    bars_to_arrays,
 )
 from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
 
 
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
 # ==================== Fixtures ====================
 
+_CRYPTO_TS = datetime(2025, 1, 1, 10, 0, 0)
+
+# Stand-ins for the SDK models (numeric, as the SDK parses them). The helpers
+# only read attributes, so one shared instance of each serves every test.
+_BAR = SimpleNamespace(
+    timestamp=_CRYPTO_TS,
+    open=50000.00,
+    high=50500.00,
+    low=49900.00,
+    close=50300.00,
+    volume=10.5,
+    trade_count=500,
+    vwap=50200.00,
+)
+_QUOTE = SimpleNamespace(
+    timestamp=_CRYPTO_TS,
+    bid_price=50250.00,
+    bid_size=1.5,
+    ask_price=50275.00,
+    ask_size=2.0,
+)
+_TRADE = SimpleNamespace(
+    timestamp=_CRYPTO_TS,
+    price=50260.00,
+    size=0.5,
+    taker_side="buy",
+)
+_SNAPSHOT = SimpleNamespace(
+    minute_bar=_BAR,
+    latest_quote=_QUOTE,
+    latest_trade=_TRADE,
+    previous_daily_bar=_BAR,
+)
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_crypto_bar():
-    """Create a mock Bar object for crypto."""
-    bar = MagicMock(spec=Bar)
-    bar.timestamp = datetime(2025, 1, 1, 10, 0, 0)
-    bar.open = "50000.00"
-    bar.high = "50500.00"
-    bar.low = "49900.00"
-    bar.close = "50300.00"
-    bar.volume = "10.5"
-    bar.trade_count = "500"
-    bar.vwap = "50200.00"
-    return bar
+    """Return the stand-in Bar object for crypto."""
+    return _BAR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_crypto_quote():
-    """Create a mock Quote object for crypto."""
-    quote = MagicMock(spec=Quote)
-    quote.timestamp = datetime(2025, 1, 1, 10, 0, 0)
-    quote.bid_price = "50250.00"
-    quote.bid_size = "1.5"
-    quote.ask_price = "50275.00"
-    quote.ask_size = "2.0"
-    return quote
+    """Return the stand-in Quote object for crypto."""
+    return _QUOTE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_crypto_trade():
-    """Create a mock Trade object for crypto."""
-    trade = MagicMock(spec=Trade)
-    trade.timestamp = datetime(2025, 1, 1, 10, 0, 0)
-    trade.price = "50260.00"
-    trade.size = "0.5"
-    trade.taker_side = "buy"
-    return trade
+    """Return the stand-in Trade object for crypto."""
+    return _TRADE
 
 
-@pytest.fixture
-def mock_crypto_snapshot(mock_crypto_bar, mock_crypto_quote, mock_crypto_trade):
-    """Create a mock Snapshot object for crypto."""
-    snapshot = MagicMock(spec=Snapshot)
-    snapshot.minute_bar = mock_crypto_bar
-    snapshot.latest_quote = mock_crypto_quote
-    snapshot.latest_trade = mock_crypto_trade
-    snapshot.previous_daily_bar = mock_crypto_bar
-    return snapshot
+@pytest.fixture(scope="session")
+def mock_crypto_snapshot():
+    """Return the stand-in Snapshot object for crypto."""
+    return _SNAPSHOT
+
+
+@pytest.fixture(scope="module")
+def mock_barset_with_data(mock_crypto_bar):
+    """Create a BarSet stand-in holding one bar for any symbol."""
+    barset = MagicMock()
+    barset.__getitem__.return_value = [mock_crypto_bar]
+    barset.__contains__.return_value = True
+    return barset
+
+
+@pytest.fixture(scope="module")
+def mock_tradeset_with_data(mock_crypto_trade):
+    """Create a TradeSet stand-in holding one trade for any symbol."""
+    tradeset = MagicMock()
+    tradeset.__getitem__.return_value = [mock_crypto_trade]
+    tradeset.__contains__.return_value = True
+    return tradeset
+
+
+@pytest.fixture(scope="module")
+def mock_barset_empty():
+    """Create an empty BarSet/TradeSet stand-in."""
+    barset = MagicMock()
+    barset.__contains__.return_value = False
+    return barset
 
 
 @pytest.fixture
-def crypto_helper_with_mocks():
-    """Create CryptoHelper with mocked client."""
+def _stub_crypto_client(monkeypatch):
+    """Skip building a real data client for tests that never use it."""
+    monkeypatch.setattr(
+        "alpaca.data.crypto_helper.CryptoHistoricalDataClient",
+        lambda **kwargs: MagicMock(),
+    )
+
+
+@pytest.fixture(scope="session")
+def _crypto_helper_session():
+    """Build one CryptoHelper for the whole test session."""
     with patch.dict(
         os.environ,
         {
             "ALPACA_API_KEY": "test_api_key",
             "ALPACA_SECRET_KEY": "test_secret_key",
         },
+    ), patch(
+        "alpaca.data.crypto_helper.CryptoHistoricalDataClient",
+        lambda **kwargs: MagicMock(),
     ):
-        helper = CryptoHelper()
-        helper.client = MagicMock()
-        return helper
+        return CryptoHelper()
+
+
+@pytest.fixture
+def crypto_helper_with_mocks(_crypto_helper_session):
+    """Return the shared CryptoHelper with fresh client method mocks and no cache."""
+    helper = _crypto_helper_session
+    helper.client = SimpleNamespace(
+        get_crypto_bars=MagicMock(),
+        get_crypto_quotes=MagicMock(),
+        get_crypto_trades=MagicMock(),
+        get_crypto_latest_bar=MagicMock(),
+        get_crypto_latest_quote=MagicMock(),
+        get_crypto_latest_trade=MagicMock(),
+        get_crypto_snapshot=MagicMock(),
+    )
+    helper.cache_dir = None
+    helper._streamed_quotes.clear()
+    return helper
 
 
 # ==================== Initialization Tests ====================
 
 
-def test_init_with_explicit_credentials():
+def test_init_with_explicit_credentials(_stub_crypto_client):
     """Test initialization with explicit credentials."""
     helper = CryptoHelper(api_key="test_key", secret_key="test_secret")
     assert helper.client is not None
 
 
-def test_init_from_environment():
+def test_init_from_environment(_crypto_helper_session):
     """Test initialization from environment variables."""
-    with patch.dict(
-        os.environ,
-        {
-            "ALPACA_API_KEY": "env_key",
-            "ALPACA_SECRET_KEY": "env_secret",
-        },
-    ):
-        helper = CryptoHelper()
-        assert helper.api_key == "env_key"
-        assert helper.secret_key == "env_secret"
+    # The session helper is built from patched env vars, so reuse it
+    # rather than constructing another client.
+    assert _crypto_helper_session.api_key == "test_api_key"
+    assert _crypto_helper_session.secret_key == "test_secret_key"
 
 
-def test_init_without_credentials():
+def test_init_without_credentials(_stub_crypto_client):
     """Test that CryptoHelper can initialize without credentials."""
     with patch.dict(os.environ, {}, clear=True):
         helper = CryptoHelper()
@@ -117,43 +183,31 @@ def test_init_without_credentials():
         assert helper.secret_key is None
 
 
-# ==================== Timeframe Parsing Tests ====================
-
-
-def test_parse_timeframe_minutes(crypto_helper_with_mocks):
-    """Test parsing minute timeframes."""
-    tf = crypto_helper_with_mocks._parse_timeframe("1Min")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Minute
-
-    tf = crypto_helper_with_mocks._parse_timeframe("5Min")
-    assert tf.amount == 5
-    assert tf.unit == TimeFrameUnit.Minute
-
-
-def test_parse_timeframe_hours(crypto_helper_with_mocks):
-    """Test parsing hour timeframes."""
-    tf = crypto_helper_with_mocks._parse_timeframe("1H")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Hour
-
-    tf = crypto_helper_with_mocks._parse_timeframe("4Hour")
-    assert tf.amount == 4
-    assert tf.unit == TimeFrameUnit.Hour
+def test_init_shares_session_between_helpers():
+    """Test that helpers reuse one pooled session by default."""
+    first = CryptoHelper(api_key="test_key", secret_key="test_secret")
+    second = CryptoHelper(api_key="test_key", secret_key="test_secret")
+    assert first.client._session is second.client._session
 
 
-def test_parse_timeframe_days(crypto_helper_with_mocks):
-    """Test parsing day timeframes."""
-    tf = crypto_helper_with_mocks._parse_timeframe("1D")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Day
+# ==================== Timeframe Parsing Tests ====================
 
 
-def test_parse_timeframe_weeks(crypto_helper_with_mocks):
-    """Test parsing week timeframes."""
-    tf = crypto_helper_with_mocks._parse_timeframe("1W")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Week
+@pytest.mark.parametrize(
+    "timeframe,amount,unit",
+    [
+        ("1Min", 1, TimeFrameUnit.Minute),
+        ("5Min", 5, TimeFrameUnit.Minute),
+        ("1H", 1, TimeFrameUnit.Hour),
+        ("4Hour", 4, TimeFrameUnit.Hour),
+        ("1D", 1, TimeFrameUnit.Day),
+        ("1W", 1, TimeFrameUnit.Week),
+    ],
+)
+def test_parse_timeframe_valid(crypto_helper_with_mocks, timeframe, amount, unit):
+    """Test parsing supported timeframe strings."""
+    tf = crypto_helper_with_mocks._parse_timeframe(timeframe)
+    assert (tf.amount, tf.unit) == (amount, unit)
 
 
 def test_parse_timeframe_invalid(crypto_helper_with_mocks):
@@ -165,44 +219,62 @@ def test_parse_timeframe_invalid(crypto_helper_with_mocks):
 # ==================== Dataclass Conversion Tests ====================
 
 
-def test_crypto_bar_data_from_bar(mock_crypto_bar):
-    """Test CryptoBarData creation from Bar."""
-    bar_data = CryptoBarData.from_bar("BTC/USD", mock_crypto_bar)
+def test_crypto_bar_data_from_bar():
+    """Test CryptoBarData creation from Bar, including string-valued fields."""
+    raw_bar = SimpleNamespace(
+        timestamp=_CRYPTO_TS,
+        open="50000.00",
+        high="50500.00",
+        low="49900.00",
+        close="50300.00",
+        volume="10.5",
+        trade_count="500",
+        vwap="50200.00",
+    )
+    bar_data = CryptoBarData.from_bar("BTC/USD", raw_bar)
     assert bar_data.symbol == "BTC/USD"
-    assert bar_data.timestamp == mock_crypto_bar.timestamp
+    assert bar_data.timestamp == raw_bar.timestamp
     assert bar_data.open == 50000.00
     assert bar_data.close == 50300.00
     assert bar_data.volume == 10.5
     assert isinstance(bar_data.volume, float)
+    assert bar_data.trade_count == 500
 
 
-def test_crypto_quote_data_from_quote(mock_crypto_quote):
+def test_crypto_quote_data_from_quote():
     """Test CryptoQuoteData creation from Quote."""
-    quote_data = CryptoQuoteData.from_quote("BTC/USD", mock_crypto_quote)
+    quote_data = CryptoQuoteData.from_quote("BTC/USD", _QUOTE)
     assert quote_data.symbol == "BTC/USD"
     assert quote_data.bid_price == 50250.00
     assert quote_data.ask_price == 50275.00
     assert isinstance(quote_data.bid_size, float)
 
 
-def test_crypto_trade_data_from_trade(mock_crypto_trade):
+def test_crypto_trade_data_from_trade():
     """Test CryptoTradeData creation from Trade."""
-    trade_data = CryptoTradeData.from_trade("BTC/USD", mock_crypto_trade)
+    trade_data = CryptoTradeData.from_trade("BTC/USD", _TRADE)
     assert trade_data.symbol == "BTC/USD"
     assert trade_data.price == 50260.00
     assert trade_data.size == 0.5
     assert trade_data.taker_side == "buy"
 
 
-def test_crypto_snapshot_data_from_snapshot(mock_crypto_snapshot):
+def test_crypto_snapshot_data_from_snapshot():
     """Test CryptoSnapshotData creation from Snapshot."""
-    snap_data = CryptoSnapshotData.from_snapshot("BTC/USD", mock_crypto_snapshot)
+    snap_data = CryptoSnapshotData.from_snapshot("BTC/USD", _SNAPSHOT)
     assert snap_data.symbol == "BTC/USD"
     assert snap_data.latest_bar is not None
     assert snap_data.latest_quote is not None
     assert snap_data.latest_trade is not None
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_bar_data_uses_slots():
+    """Test bar dataclasses don't carry a per-instance __dict__."""
+    bar = CryptoBarData.from_bar("BTC/USD", _BAR)
+    assert not hasattr(bar, "__dict__")
+
+
 # ==================== Latest Data Tests ====================
 
 
@@ -237,6 +309,152 @@ def test_get_latest_quotes_multi(crypto_helper_with_mocks, mock_crypto_quote):
     assert len(quotes) == 2
     assert "BTC/USD" in quotes
     assert "ETH/USD" in quotes
+    crypto_helper_with_mocks.client.get_crypto_latest_quote.assert_called_once()
+
+
+def test_get_latest_quotes_chunks_large_symbol_lists(
+    crypto_helper_with_mocks, mock_crypto_quote
+):
+    """Test symbol lists over the per-request cap are split into batches."""
+    symbols = [f"COIN{i}/USD" for i in range(MAX_SYMBOLS_PER_REQUEST + 50)]
+    crypto_helper_with_mocks.client.get_crypto_latest_quote.side_effect = (
+        lambda request: {s: mock_crypto_quote for s in request.symbol_or_symbols}
+    )
+
+    quotes = crypto_helper_with_mocks.get_latest_quotes(symbols)
+
+    assert len(quotes) == len(symbols)
+    calls = crypto_helper_with_mocks.client.get_crypto_latest_quote.call_args_list
+    assert [len(c[0][0].symbol_or_symbols) for c in calls] == [
+        MAX_SYMBOLS_PER_REQUEST,
+        50,
+    ]
+
+
+@pytest.fixture
+def mock_quote_stream():
+    """Patch CryptoDataStream with a stand-in whose run blocks until stop."""
+    with patch("alpaca.data.crypto_helper.CryptoDataStream") as mock_stream_cls:
+        stream = mock_stream_cls.return_value
+        stopped = threading.Event()
+        stream.run.side_effect = stopped.wait
+        stream.stop.side_effect = stopped.set
+        yield stream
+        stopped.set()
+
+
+def _stream_quote(stream, quote):
+    """Deliver ``quote`` through the handler registered by stream_quotes."""
+    handler = stream.subscribe_quotes.call_args[0][0]
+    asyncio.run(handler(quote))
+
+
+def test_stream_quotes_serves_latest_from_memory(
+    crypto_helper_with_mocks, mock_crypto_quote, mock_quote_stream
+):
+    """Test streamed quotes are returned without REST requests."""
+    # The quote fixture is shared across the module, so stream a copy
+    streamed_quote = SimpleNamespace(symbol="BTC/USD", **vars(mock_crypto_quote))
+    received = []
+
+    crypto_helper_with_mocks.stream_quotes(["BTC/USD"], on_quote=received.append)
+
+    assert mock_quote_stream.subscribe_quotes.call_args[0][1] == "BTC/USD"
+    _stream_quote(mock_quote_stream, streamed_quote)
+
+    quote = crypto_helper_with_mocks.get_latest_quote("BTC/USD")
+    quotes = crypto_helper_with_mocks.get_latest_quotes(["BTC/USD"])
+
+    assert quote.bid_price == 50250.00
+    assert quotes == {"BTC/USD": quote}
+    assert received == [quote]
+    crypto_helper_with_mocks.client.get_crypto_latest_quote.assert_not_called()
+
+    crypto_helper_with_mocks.stop_stream()
+    mock_quote_stream.stop.assert_called_once()
+    assert crypto_helper_with_mocks._streamed_quotes == {}
+
+
+def test_stream_quotes_falls_back_when_stale(
+    crypto_helper_with_mocks, mock_crypto_quote, mock_quote_stream, monkeypatch
+):
+    """Test quotes older than stream_quote_max_age are fetched over REST."""
+    streamed_quote = SimpleNamespace(symbol="BTC/USD", **vars(mock_crypto_quote))
+    crypto_helper_with_mocks.client.get_crypto_latest_quote.return_value = {
+        "BTC/USD": mock_crypto_quote
+    }
+    monkeypatch.setattr(crypto_helper_with_mocks, "_stream_quote_max_age", 10.0)
+
+    crypto_helper_with_mocks.stream_quotes(["BTC/USD"])
+    _stream_quote(mock_quote_stream, streamed_quote)
+    received_at = crypto_helper_with_mocks._streamed_quotes["BTC/USD"][0]
+    monkeypatch.setattr(
+        "alpaca.data.crypto_helper.time.monotonic", lambda: received_at + 11.0
+    )
+
+    try:
+        assert crypto_helper_with_mocks.get_latest_quote("BTC/USD") is not None
+        assert "BTC/USD" in crypto_helper_with_mocks.get_latest_quotes(["BTC/USD"])
+        assert crypto_helper_with_mocks.client.get_crypto_latest_quote.call_count == 2
+    finally:
+        crypto_helper_with_mocks.stop_stream()
+
+
+def test_stream_quotes_falls_back_when_stream_dies(
+    crypto_helper_with_mocks, mock_crypto_quote
+):
+    """Test quotes left by a stream whose thread exited are not served."""
+    streamed_quote = SimpleNamespace(symbol="BTC/USD", **vars(mock_crypto_quote))
+    crypto_helper_with_mocks.client.get_crypto_latest_quote.return_value = {
+        "BTC/USD": mock_crypto_quote
+    }
+
+    with patch("alpaca.data.crypto_helper.CryptoDataStream") as mock_stream_cls:
+        # run returns at once, as it does after an authentication failure
+        crypto_helper_with_mocks.stream_quotes(["BTC/USD"])
+        crypto_helper_with_mocks._stream_thread.join()
+        _stream_quote(mock_stream_cls.return_value, streamed_quote)
+
+        crypto_helper_with_mocks.get_latest_quote("BTC/USD")
+        crypto_helper_with_mocks.stop_stream()
+
+    crypto_helper_with_mocks.client.get_crypto_latest_quote.assert_called_once()
+    mock_stream_cls.return_value.stop.assert_not_called()
+
+
+def test_stream_quotes_restarts_dead_stream(
+    crypto_helper_with_mocks, mock_crypto_quote
+):
+    """Test calling stream_quotes after the stream exited starts a new one."""
+    streamed_quote = SimpleNamespace(symbol="BTC/USD", **vars(mock_crypto_quote))
+    dead_stream, live_stream = MagicMock(), MagicMock()
+    stopped = threading.Event()
+    live_stream.run.side_effect = stopped.wait
+    live_stream.stop.side_effect = stopped.set
+
+    with patch(
+        "alpaca.data.crypto_helper.CryptoDataStream",
+        side_effect=[dead_stream, live_stream],
+    ):
+        crypto_helper_with_mocks.stream_quotes(["BTC/USD"])
+        crypto_helper_with_mocks._stream_thread.join()
+
+        crypto_helper_with_mocks.stream_quotes(["ETH/USD"])
+
+    try:
+        subscribed = [
+            call.args[1:] for call in live_stream.subscribe_quotes.call_args_list
+        ]
+        assert subscribed == [("BTC/USD",), ("ETH/USD",)]
+
+        _stream_quote(live_stream, streamed_quote)
+        assert crypto_helper_with_mocks.get_latest_quote("BTC/USD") is not None
+        crypto_helper_with_mocks.client.get_crypto_latest_quote.assert_not_called()
+    finally:
+        crypto_helper_with_mocks.stop_stream()
+        stopped.set()
+
+    live_stream.stop.assert_called_once()
 
 
 def test_get_latest_bar(crypto_helper_with_mocks, mock_crypto_bar):
@@ -266,24 +484,18 @@ def test_get_latest_trade(crypto_helper_with_mocks, mock_crypto_trade):
 # ==================== Historical Bars Tests ====================
 
 
-def test_get_bars_with_timeframe(crypto_helper_with_mocks, mock_crypto_bar):
+def test_get_bars_with_timeframe(crypto_helper_with_mocks, mock_barset_with_data):
     """Test getting historical bars with timeframe."""
-    mock_barset = MagicMock()
-    mock_barset.__getitem__.return_value = [mock_crypto_bar]
-    mock_barset.__contains__.return_value = True
-    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset
+    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset_with_data
 
     bars = crypto_helper_with_mocks.get_bars("BTC/USD", timeframe="1H")
     assert len(bars) > 0
     assert bars[0].symbol == "BTC/USD"
 
 
-def test_get_bars_with_days_back(crypto_helper_with_mocks, mock_crypto_bar):
+def test_get_bars_with_days_back(crypto_helper_with_mocks, mock_barset_with_data):
     """Test getting bars with days_back parameter."""
-    mock_barset = MagicMock()
-    mock_barset.__getitem__.return_value = [mock_crypto_bar]
-    mock_barset.__contains__.return_value = True
-    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset
+    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset_with_data
 
     bars = crypto_helper_with_mocks.get_bars("BTC/USD", days_back=7)
     assert len(bars) > 0
@@ -295,16 +507,219 @@ def test_get_bars_with_days_back(crypto_helper_with_mocks, mock_crypto_bar):
     assert request.end is not None
 
 
-def test_get_bars_empty_response(crypto_helper_with_mocks):
+def test_get_bars_empty_response(crypto_helper_with_mocks, mock_barset_empty):
     """Test getting bars when symbol has no data."""
-    mock_barset = MagicMock()
-    mock_barset.__contains__.return_value = False
-    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset
+    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset_empty
 
     bars = crypto_helper_with_mocks.get_bars("INVALID")
     assert bars == []
 
 
+def test_get_bars_arrays(crypto_helper_with_mocks, mock_crypto_bar):
+    """Test bars are returned as contiguous numpy columns."""
+    mock_barset = MagicMock()
+    mock_barset.__getitem__.return_value = [mock_crypto_bar, mock_crypto_bar]
+    mock_barset.__contains__.return_value = True
+    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset
+
+    cols = crypto_helper_with_mocks.get_bars_arrays("BTC/USD", "1H", days_back=1)
+
+    assert cols["close"].dtype == np.float64
+    assert cols["close"].tolist() == [50300.0, 50300.0]
+    assert cols["timestamp"].dtype == np.dtype("datetime64[ns]")
+    assert cols["timestamp"][0] == np.datetime64("2025-01-01T10:00:00")
+
+
+def test_compute_returns():
+    """Test per-bar percent changes are computed from open to close."""
+    cols = {"open": np.array([100.0, 200.0]), "close": np.array([110.0, 190.0])}
+    assert CryptoHelper.compute_returns(cols).tolist() == pytest.approx([10.0, -5.0])
+
+
+def test_bars_to_arrays_empty():
+    """Test converting an empty bar list."""
+    cols = bars_to_arrays([])
+    assert all(len(col) == 0 for col in cols.values())
+
+
+_CACHE_NOW = datetime(2025, 1, 2, 12, 0, 30, tzinfo=timezone.utc)
+
+
+def _freeze_now(monkeypatch, now):
+    """Make the helper module see ``now`` as the current time."""
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz) if tz else now.replace(tzinfo=None)
+
+    monkeypatch.setattr("alpaca.data.crypto_helper.datetime", _FrozenDatetime)
+
+
+def _bars_source(step, now):
+    """Return a get_crypto_bars stand-in with one bar every ``step``."""
+
+    def get_crypto_bars(request):
+        start = request.start.replace(tzinfo=timezone.utc)
+        end = request.end.replace(tzinfo=timezone.utc) if request.end else now
+        timestamp = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        timestamp += -((timestamp - start) // step) * step
+        bars = []
+        while timestamp <= end:
+            bars.append(SimpleNamespace(**{**vars(_BAR), "timestamp": timestamp}))
+            timestamp += step
+        return {request.symbol_or_symbols: bars}
+
+    return get_crypto_bars
+
+
+@pytest.fixture
+def cached_crypto_helper(crypto_helper_with_mocks, tmp_path, monkeypatch):
+    """Return the helper caching to a temp directory with a frozen clock."""
+    _freeze_now(monkeypatch, _CACHE_NOW)
+    crypto_helper_with_mocks.cache_dir = str(tmp_path)
+    monkeypatch.setattr(crypto_helper_with_mocks, "cache_max_entries", 4096)
+    return crypto_helper_with_mocks
+
+
+def test_get_bars_cache_serves_closed_range(cached_crypto_helper, tmp_path):
+    """Test closed historical ranges are fetched once and then read from disk."""
+    client = cached_crypto_helper.client
+    client.get_crypto_bars.side_effect = _bars_source(timedelta(hours=1), _CACHE_NOW)
+
+    start = datetime(2025, 1, 1, 5)
+    end = datetime(2025, 1, 1, 20)
+    first = cached_crypto_helper.get_bars("BTC/USD", "1H", start=start, end=end)
+    second = cached_crypto_helper.get_bars("BTC/USD", "1H", start=start, end=end)
+
+    assert first == second
+    assert [bar.timestamp.hour for bar in first] == list(range(5, 21))
+    # The whole day is cached as one chunk
+    assert client.get_crypto_bars.call_count == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_get_bars_cache_reuses_chunks_for_rolling_window(
+    cached_crypto_helper, tmp_path, monkeypatch
+):
+    """Test a rolling window only requests the bars after the last closed chunk."""
+    client = cached_crypto_helper.client
+    step = timedelta(minutes=1)
+
+    for minute in range(3):
+        now = _CACHE_NOW + timedelta(minutes=minute)
+        _freeze_now(monkeypatch, now)
+        client.get_crypto_bars.side_effect = _bars_source(step, now)
+
+        bars = cached_crypto_helper.get_bars("BTC/USD", "1Min", days_back=1)
+
+        start = (now - timedelta(days=1)).replace(second=0) + step
+        assert bars[0].timestamp == start
+        assert bars[-1].timestamp == now.replace(second=0)
+        assert len(bars) == 24 * 60
+
+    # 23 closed hourly chunks on the first call and the 11:00 chunk once it
+    # settles on the last, plus one live tail request per call
+    assert client.get_crypto_bars.call_count == 24 + 3
+    assert len(list(tmp_path.iterdir())) == 24
+    tail_request = client.get_crypto_bars.call_args[0][0]
+    assert tail_request.start == datetime(2025, 1, 2, 12, 0)
+
+
+def test_get_bars_cache_accepts_mixed_timezones(cached_crypto_helper):
+    """Test naive datetimes are read as UTC alongside aware ones."""
+    client = cached_crypto_helper.client
+    client.get_crypto_bars.side_effect = _bars_source(timedelta(hours=1), _CACHE_NOW)
+
+    bars = cached_crypto_helper.get_bars(
+        "BTC/USD",
+        "1H",
+        start=datetime(2025, 1, 1, 5),
+        end=datetime(2025, 1, 1, 8, tzinfo=timezone.utc),
+    )
+
+    assert [bar.timestamp.hour for bar in bars] == [5, 6, 7, 8]
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:10],
+        lambda data: b'[["2025-01-01T00:00:00+00:00", 1.0]]',
+        lambda data: b"\x80\x04\x95",
+    ],
+    ids=["truncated", "old_fields", "not_json"],
+)
+def test_get_bars_cache_refetches_corrupt_entries(
+    cached_crypto_helper, tmp_path, corrupt
+):
+    """Test unreadable cache files are fetched again instead of raising."""
+    client = cached_crypto_helper.client
+    client.get_crypto_bars.side_effect = _bars_source(timedelta(hours=1), _CACHE_NOW)
+    start = datetime(2025, 1, 1)
+    end = datetime(2025, 1, 1, 23)
+
+    expected = cached_crypto_helper.get_bars("BTC/USD", "1H", start=start, end=end)
+    for path in tmp_path.iterdir():
+        path.write_bytes(corrupt(path.read_bytes()))
+    bars = cached_crypto_helper.get_bars("BTC/USD", "1H", start=start, end=end)
+    cached = cached_crypto_helper.get_bars("BTC/USD", "1H", start=start, end=end)
+
+    assert bars == cached == expected
+    # The bad entry is replaced by the refetch and read back afterwards
+    assert client.get_crypto_bars.call_count == 2
+
+
+def test_get_bars_cache_evicts_least_recently_used(
+    cached_crypto_helper, tmp_path, monkeypatch
+):
+    """Test the cache keeps at most cache_max_entries chunk files."""
+    client = cached_crypto_helper.client
+    client.get_crypto_bars.side_effect = _bars_source(timedelta(minutes=1), _CACHE_NOW)
+    monkeypatch.setattr(cached_crypto_helper, "cache_max_entries", 2)
+
+    cached_crypto_helper.get_bars(
+        "BTC/USD", "1Min", start=datetime(2025, 1, 1), end=datetime(2025, 1, 1, 3)
+    )
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_get_bars_cache_scans_directory_only_when_full(
+    cached_crypto_helper, tmp_path, monkeypatch
+):
+    """Test writing chunks does not rescan the cache directory each time."""
+    client = cached_crypto_helper.client
+    client.get_crypto_bars.side_effect = _bars_source(timedelta(hours=1), _CACHE_NOW)
+    scans = []
+    scandir = os.scandir
+    monkeypatch.setattr(
+        "alpaca.data.crypto_helper.os.scandir",
+        lambda path: scans.append(path) or scandir(path),
+    )
+
+    cached_crypto_helper.get_bars(
+        "BTC/USD", "1H", start=datetime(2024, 12, 1), end=datetime(2024, 12, 31)
+    )
+
+    assert len(list(tmp_path.iterdir())) == 31
+    assert scans == [str(tmp_path)]
+
+
+@pytest.mark.asyncio
+async def test_aget_bars(crypto_helper_with_mocks, mock_barset_with_data):
+    """Test async bars fetches can be gathered concurrently."""
+    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset_with_data
+
+    results = await asyncio.gather(
+        crypto_helper_with_mocks.aget_bars("BTC/USD", timeframe="1H", limit=1),
+        crypto_helper_with_mocks.aget_bars("BTC/USD", timeframe="1D", limit=1),
+    )
+
+    assert [len(bars) for bars in results] == [1, 1]
+    assert crypto_helper_with_mocks.client.get_crypto_bars.call_count == 2
+
+
 def test_get_bars_multi(crypto_helper_with_mocks, mock_crypto_bar):
     """Test getting bars for multiple cryptos."""
     mock_barset = MagicMock()
@@ -325,12 +740,11 @@ def test_get_bars_multi(crypto_helper_with_mocks, mock_crypto_bar):
 # ==================== Historical Trades Tests ====================
 
 
-def test_get_trades(crypto_helper_with_mocks, mock_crypto_trade):
+def test_get_trades(crypto_helper_with_mocks, mock_tradeset_with_data):
     """Test getting historical trades."""
-    mock_tradeset = MagicMock()
-    mock_tradeset.__getitem__.return_value = [mock_crypto_trade]
-    mock_tradeset.__contains__.return_value = True
-    crypto_helper_with_mocks.client.get_crypto_trades.return_value = mock_tradeset
+    crypto_helper_with_mocks.client.get_crypto_trades.return_value = (
+        mock_tradeset_with_data
+    )
 
     trades = crypto_helper_with_mocks.get_trades("BTC/USD", days_back=1)
     assert len(trades) > 0
@@ -338,22 +752,19 @@ def test_get_trades(crypto_helper_with_mocks, mock_crypto_trade):
     assert trades[0].price == 50260.00
 
 
-def test_get_trades_with_limit(crypto_helper_with_mocks, mock_crypto_trade):
+def test_get_trades_with_limit(crypto_helper_with_mocks, mock_tradeset_with_data):
     """Test getting trades with limit parameter."""
-    mock_tradeset = MagicMock()
-    mock_tradeset.__getitem__.return_value = [mock_crypto_trade]
-    mock_tradeset.__contains__.return_value = True
-    crypto_helper_with_mocks.client.get_crypto_trades.return_value = mock_tradeset
+    crypto_helper_with_mocks.client.get_crypto_trades.return_value = (
+        mock_tradeset_with_data
+    )
 
     trades = crypto_helper_with_mocks.get_trades("BTC/USD", limit=100)
     assert len(trades) > 0
 
 
-def test_get_trades_empty(crypto_helper_with_mocks):
+def test_get_trades_empty(crypto_helper_with_mocks, mock_barset_empty):
     """Test getting trades when no data available."""
-    mock_tradeset = MagicMock()
-    mock_tradeset.__contains__.return_value = False
-    crypto_helper_with_mocks.client.get_crypto_trades.return_value = mock_tradeset
+    crypto_helper_with_mocks.client.get_crypto_trades.return_value = mock_barset_empty
 
     trades = crypto_helper_with_mocks.get_trades("INVALID")
     assert trades == []
@@ -400,12 +811,9 @@ def test_get_snapshots_multi(crypto_helper_with_mocks, mock_crypto_snapshot):
 # ==================== Edge Cases ====================
 
 
-def test_get_bars_with_explicit_dates(crypto_helper_with_mocks, mock_crypto_bar):
+def test_get_bars_with_explicit_dates(crypto_helper_with_mocks, mock_barset_with_data):
     """Test getting bars with explicit start/end dates."""
-    mock_barset = MagicMock()
-    mock_barset.__getitem__.return_value = [mock_crypto_bar]
-    mock_barset.__contains__.return_value = True
-    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset
+    crypto_helper_with_mocks.client.get_crypto_bars.return_value = mock_barset_with_data
 
     start = datetime(2025, 1, 1)
     end = datetime(2025, 1, 7)
@@ -422,15 +830,16 @@ def test_get_bars_with_explicit_dates(crypto_helper_with_mocks, mock_crypto_bar)
 
 def test_crypto_bar_without_optional_fields():
     """Test CryptoBarData with missing optional fields."""
-    bar = MagicMock(spec=Bar)
-    bar.timestamp = datetime(2025, 1, 1)
-    bar.open = "50000.00"
-    bar.high = "51000.00"
-    bar.low = "49000.00"
-    bar.close = "50500.00"
-    bar.volume = "10.0"
-    bar.trade_count = None
-    bar.vwap = None
+    bar = SimpleNamespace(
+        timestamp=datetime(2025, 1, 1),
+        open="50000.00",
+        high="51000.00",
+        low="49000.00",
+        close="50500.00",
+        volume="10.0",
+        trade_count=None,
+        vwap=None,
+    )
 
     bar_data = CryptoBarData.from_bar("BTC/USD", bar)
     assert bar_data.trade_count is None
@@ -439,11 +848,10 @@ def test_crypto_bar_without_optional_fields():
 
 def test_crypto_trade_without_taker_side():
     """Test CryptoTradeData without taker_side field."""
-    trade = MagicMock(spec=Trade)
-    trade.timestamp = datetime(2025, 1, 1)
-    trade.price = "50000.00"
-    trade.size = "0.5"
     # No taker_side attribute
+    trade = SimpleNamespace(
+        timestamp=datetime(2025, 1, 1), price="50000.00", size="0.5"
+    )
 
     trade_data = CryptoTradeData.from_trade("BTC/USD", trade)
     assert trade_data.taker_side is None
@@ -97,3 +97,45 @@ def test_get_news(reqmock, news_client: NewsClient):
     assert newsset.df.index.nlevels == 1
 
     assert reqmock.call_count == 2
+
+
+def test_iter_news(reqmock, news_client: NewsClient):
+    symbols = "AAPL"
+    next_page_token = "MTczMDk3MTEwMTAwMDAwMDAwMHw0MTc5OTExNQ=="
+
+    reqmock.get(
+        f"https://data.alpaca.markets/v1beta1/news?symbols={symbols}&limit=3",
+        text=f"""
+{{
+  "news": [
+    {{"id": 1, "headline": "first", "source": "benzinga", "author": "", "content": "", "summary": "",
+      "url": "", "symbols": ["AAPL"], "images": [],
+      "created_at": "2024-11-07T09:16:41Z", "updated_at": "2024-11-07T09:16:41Z"}},
+    {{"id": 2, "headline": "second", "source": "benzinga", "author": "", "content": "", "summary": "",
+      "url": "", "symbols": ["AAPL"], "images": [],
+      "created_at": "2024-11-07T09:16:41Z", "updated_at": "2024-11-07T09:16:41Z"}}
+  ],
+  "next_page_token": "{next_page_token}"
+}}
+        """,
+    )
+    reqmock.get(
+        f"https://data.alpaca.markets/v1beta1/news?symbols={symbols}&page_token={next_page_token}&limit=1",
+        text="""
+{
+  "news": [
+    {"id": 3, "headline": "third", "source": "benzinga", "author": "", "content": "", "summary": "",
+     "url": "", "symbols": ["AAPL"], "images": [],
+     "created_at": "2024-11-07T09:16:41Z", "updated_at": "2024-11-07T09:16:41Z"}
+  ],
+  "next_page_token": "unused"
+}
+        """,
+    )
+
+    articles = news_client.iter_news(NewsRequest(symbols=symbols, limit=3))
+
+    # No request is made until the iterator is consumed
+    assert reqmock.call_count == 0
+    assert [article.id for article in articles] == [1, 2, 3]
+    assert reqmock.call_count == 2
@@ -1064,3 +1064,51 @@ def test_get_option_chain(reqmock, option_client: OptionHistoricalDataClient):
     assert snapshot.implied_volatility == 0.4584478444465036
 
     assert reqmock.called_once
+
+
+def test_iter_option_chain(reqmock, option_client: OptionHistoricalDataClient):
+    symbol = "AAPL"
+    next_page_token = "QUFQTDI0MDUwM1AwMDE2MDAwMA=="
+
+    reqmock.get(
+        f"https://data.alpaca.markets/v1beta1/options/snapshots/{symbol}?limit=1000",
+        text=f"""
+        {{
+            "next_page_token": "{next_page_token}",
+            "snapshots": {{
+                "AAPL240503P00155000": {{
+                    "latestTrade": {{"c": "I", "p": 0.34, "s": 1, "t": "2024-04-25T19:58:16Z", "x": "N"}}
+                }}
+            }}
+        }}
+        """,
+    )
+    reqmock.get(
+        f"https://data.alpaca.markets/v1beta1/options/snapshots/{symbol}?page_token={next_page_token}",
+        text="""
+        {
+            "next_page_token": null,
+            "snapshots": {
+                "AAPL240503P00160000": {
+                    "latestTrade": {"c": "I", "p": 0.51, "s": 2, "t": "2024-04-25T19:59:02Z", "x": "N"}
+                },
+                "AAPL240503P00165000": null
+            }
+        }
+        """,
+    )
+
+    request = OptionChainRequest(underlying_symbol=symbol)
+    contracts = option_client.iter_option_chain(request)
+
+    # No request is made until the iterator is consumed
+    assert reqmock.call_count == 0
+    contracts = list(contracts)
+    assert reqmock.call_count == 2
+
+    assert [symbol for symbol, _ in contracts] == [
+        "AAPL240503P00155000",
+        "AAPL240503P00160000",
+    ]
+    assert all(isinstance(snapshot, OptionsSnapshot) for _, snapshot in contracts)
+    assert contracts[1][1].latest_trade.price == 0.51
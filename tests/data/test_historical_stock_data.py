@@ -76,6 +76,51 @@ def test_get_bars(reqmock, stock_client: StockHistoricalDataClient):
     assert reqmock.called_once
 
 
+def test_iter_bars(reqmock, stock_client: StockHistoricalDataClient):
+    next_page_token = "QUFQTHxEfDIwMjItMDItMDJUMDU6MDA6MDAuMDAwMDAwMDAwWg=="
+
+    reqmock.get(
+        "https://data.alpaca.markets/v2/stocks/bars?symbols=AAPL&limit=3",
+        text=f"""
+{{
+    "bars": {{
+        "AAPL": [
+            {{"t": "2022-02-01T05:00:00Z", "o": 174, "h": 174.84, "l": 172.31,
+              "c": 174.61, "v": 85998033, "n": 732412, "vw": 173.703516}},
+            {{"t": "2022-02-02T05:00:00Z", "o": 174.64, "h": 175.88, "l": 173.33,
+              "c": 175.84, "v": 84817432, "n": 675034, "vw": 174.941288}}
+        ]
+    }},
+    "next_page_token": "{next_page_token}"
+}}
+        """,
+    )
+    reqmock.get(
+        f"https://data.alpaca.markets/v2/stocks/bars?symbols=AAPL&page_token={next_page_token}&limit=1",
+        text="""
+{
+    "bars": {
+        "AAPL": [
+            {"t": "2022-02-03T05:00:00Z", "o": 174.48, "h": 176.24, "l": 172.12,
+             "c": 172.9, "v": 89418074, "n": 689896, "vw": 174.185367}
+        ]
+    },
+    "next_page_token": "unused"
+}
+        """,
+    )
+    request = StockBarsRequest(
+        symbol_or_symbols="AAPL", timeframe=TimeFrame.Day, limit=3
+    )
+
+    bars = stock_client.iter_stock_bars(request)
+
+    # No request is made until the iterator is consumed
+    assert reqmock.call_count == 0
+    assert [bar.close for bar in bars] == [174.61, 175.84, 172.9]
+    assert reqmock.call_count == 2
+
+
 def test_get_bars_desc(reqmock, stock_client: StockHistoricalDataClient):
     symbol = "TSLA"
     timeframe = TimeFrame.Day
@@ -12,53 +12,101 @@ from alpaca.data.models.news import News, NewsSet
 from alpaca.data.news_helper import NewsArticle, NewsHelper
 
 
-@pytest.fixture
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
+_NEWS_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_NEWS_END = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+_NEWS_RAW_DATA = {
+    "news": [
+        {
+            "id": 12345,
+            "headline": "Apple announces new iPhone",
+            "source": "TechNews",
+            "author": "John Smith",
+            "summary": "Apple unveils latest iPhone model",
+            "content": "Full article content here...",
+            "url": "https://example.com/article1",
+            "symbols": ["AAPL"],
+            "created_at": "2024-01-15T10:00:00Z",
+            "updated_at": "2024-01-15T10:30:00Z",
+            "images": [
+                {"size": "large", "url": "https://example.com/img1.jpg"},
+                {"size": "thumb", "url": "https://example.com/thumb1.jpg"},
+            ],
+        },
+        {
+            "id": 12346,
+            "headline": "Tesla reports strong earnings",
+            "source": "FinanceDaily",
+            "author": "Jane Doe",
+            "summary": "Tesla beats earnings estimates",
+            "content": "Tesla's Q4 earnings exceeded expectations...",
+            "url": "https://example.com/article2",
+            "symbols": ["TSLA"],
+            "created_at": "2024-01-15T11:00:00Z",
+            "updated_at": "2024-01-15T11:15:00Z",
+            "images": [],
+        },
+    ]
+}
+
+
+@pytest.fixture(scope="module")
 def mock_news_data():
     """Fixture providing sample news data."""
-    return {
-        "news": [
-            {
-                "id": 12345,
-                "headline": "Apple announces new iPhone",
-                "source": "TechNews",
-                "author": "John Smith",
-                "summary": "Apple unveils latest iPhone model",
-                "content": "Full article content here...",
-                "url": "https://example.com/article1",
-                "symbols": ["AAPL"],
-                "created_at": "2024-01-15T10:00:00Z",
-                "updated_at": "2024-01-15T10:30:00Z",
-                "images": [
-                    {"size": "large", "url": "https://example.com/img1.jpg"},
-                    {"size": "thumb", "url": "https://example.com/thumb1.jpg"},
-                ],
-            },
-            {
-                "id": 12346,
-                "headline": "Tesla reports strong earnings",
-                "source": "FinanceDaily",
-                "author": "Jane Doe",
-                "summary": "Tesla beats earnings estimates",
-                "content": "Tesla's Q4 earnings exceeded expectations...",
-                "url": "https://example.com/article2",
-                "symbols": ["TSLA"],
-                "created_at": "2024-01-15T11:00:00Z",
-                "updated_at": "2024-01-15T11:15:00Z",
-                "images": [],
-            },
-        ]
-    }
+    return _NEWS_RAW_DATA
+
+
+@pytest.fixture(scope="module")
+def _news_objects(mock_news_data):
+    """Parse the sample news data into News objects once per module."""
+    return [News(raw_data=n) for n in mock_news_data["news"]]
 
 
 @pytest.fixture
-def mock_news_set(mock_news_data):
+def mock_news_set(_news_objects):
     """Fixture providing a NewsSet object."""
     news_set = MagicMock(spec=NewsSet)
-    news_set.data = {"news": [News(raw_data=n) for n in mock_news_data["news"]]}
+    news_set.data = {"news": list(_news_objects)}
     news_set.next_page_token = None
     return news_set
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _news_env():
+    """Install test API keys once for every test in this module."""
+    with patch.dict(
+        os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"}
+    ):
+        yield
+
+
+@pytest.fixture
+def _stub_news_client(monkeypatch):
+    """Skip building a real NewsClient for tests that never use it."""
+    monkeypatch.setattr(
+        "alpaca.data.news_helper.NewsClient", lambda **kwargs: MagicMock()
+    )
+
+
+@pytest.fixture(scope="session")
+def _news_helper_session():
+    """Build one NewsHelper for the whole test session."""
+    with patch.dict(
+        os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"}
+    ), patch("alpaca.data.news_helper.NewsClient", lambda **kwargs: MagicMock()):
+        return NewsHelper()
+
+
+@pytest.fixture
+def news_helper_with_mocks(_news_helper_session):
+    """Return the shared NewsHelper with a fresh mocked client."""
+    _news_helper_session._client = MagicMock()
+    return _news_helper_session
+
+
 class TestNewsArticle:
     """Tests for NewsArticle dataclass."""
 
@@ -88,10 +136,10 @@ class TestNewsArticle:
         assert len(article.image_urls) == 0
 
 
+@pytest.mark.usefixtures("_stub_news_client")
 class TestNewsHelperInit:
     """Tests for NewsHelper initialization."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
     def test_init_with_env_vars(self):
         """Test initialization with environment variables."""
         helper = NewsHelper()
@@ -114,10 +162,9 @@ class TestNewsHelperInit:
 class TestGetNews:
     """Tests for get_news method."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_basic(self, mock_news_set):
+    def test_get_news_basic(self, news_helper_with_mocks, mock_news_set):
         """Test basic news retrieval."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         articles = helper.get_news(symbols=["AAPL"], limit=10)
@@ -125,101 +172,68 @@ class TestGetNews:
         assert len(articles) == 2
         assert articles[0].headline == "Apple announces new iPhone"
         assert articles[0].symbols == ["AAPL"]
-        helper._client.get_news.assert_called_once()
-
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_with_days_back(self, mock_news_set):
-        """Test news retrieval with days_back parameter."""
-        helper = NewsHelper()
-        helper._client.get_news = MagicMock(return_value=mock_news_set)
-
-        articles = helper.get_news(symbols=["TSLA"], days_back=7)
-
-        assert len(articles) == 2
-        helper._client.get_news.assert_called_once()
-        call_args = helper._client.get_news.call_args
-        request = call_args.kwargs["request_params"]
-        assert request.symbols == "TSLA"
-
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_with_date_range(self, mock_news_set):
-        """Test news retrieval with specific date range."""
-        helper = NewsHelper()
-        helper._client.get_news = MagicMock(return_value=mock_news_set)
-
-        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end = datetime(2024, 1, 31, tzinfo=timezone.utc)
-        articles = helper.get_news(symbols=["NVDA"], start=start, end=end)
-
-        assert len(articles) == 2
-        call_args = helper._client.get_news.call_args
-        request = call_args.kwargs["request_params"]
-        assert request.start == start
-        assert request.end == end
-
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_multiple_symbols(self, mock_news_set):
-        """Test news retrieval for multiple symbols."""
-        helper = NewsHelper()
-        helper._client.get_news = MagicMock(return_value=mock_news_set)
-
-        articles = helper.get_news(symbols=["AAPL", "TSLA", "MSFT"], limit=50)
-
-        assert len(articles) == 2
-        call_args = helper._client.get_news.call_args
-        request = call_args.kwargs["request_params"]
-        assert request.symbols == "AAPL,TSLA,MSFT"
-
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_with_content_options(self, mock_news_set):
-        """Test news retrieval with content filtering options."""
-        helper = NewsHelper()
+        assert helper._client.get_news.call_count == 1
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param(
+                {"symbols": ["TSLA"], "days_back": 7},
+                {"symbols": "TSLA"},
+                id="days_back",
+            ),
+            pytest.param(
+                {"symbols": ["NVDA"], "start": _NEWS_START, "end": _NEWS_END},
+                {"start": _NEWS_START, "end": _NEWS_END},
+                id="date_range",
+            ),
+            pytest.param(
+                {"symbols": ["AAPL", "TSLA", "MSFT"], "limit": 50},
+                {"symbols": "AAPL,TSLA,MSFT"},
+                id="multiple_symbols",
+            ),
+            pytest.param(
+                {
+                    "symbols": ["AAPL"],
+                    "include_content": False,
+                    "exclude_contentless": True,
+                },
+                {"include_content": False, "exclude_contentless": True},
+                id="content_options",
+            ),
+            pytest.param(
+                {"symbols": ["AAPL"], "sort": "asc"},
+                {"sort": "asc"},
+                id="sort",
+            ),
+            pytest.param(
+                {"days_back": 1, "limit": 20},
+                {"symbols": None},
+                id="no_symbols",
+            ),
+        ],
+    )
+    def test_get_news_request_params(
+        self, news_helper_with_mocks, mock_news_set, kwargs, expected
+    ):
+        """Test get_news translates its arguments into the NewsRequest."""
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
-        helper.get_news(
-            symbols=["AAPL"],
-            include_content=False,
-            exclude_contentless=True,
-        )
-
-        call_args = helper._client.get_news.call_args
-        request = call_args.kwargs["request_params"]
-        assert request.include_content is False
-        assert request.exclude_contentless is True
-
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_with_sort(self, mock_news_set):
-        """Test news retrieval with sort order."""
-        helper = NewsHelper()
-        helper._client.get_news = MagicMock(return_value=mock_news_set)
-
-        helper.get_news(symbols=["AAPL"], sort="asc")
-
-        call_args = helper._client.get_news.call_args
-        request = call_args.kwargs["request_params"]
-        assert request.sort == "asc"
-
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_no_symbols(self, mock_news_set):
-        """Test news retrieval without symbol filter."""
-        helper = NewsHelper()
-        helper._client.get_news = MagicMock(return_value=mock_news_set)
-
-        articles = helper.get_news(days_back=1, limit=20)
+        articles = helper.get_news(**kwargs)
 
         assert len(articles) == 2
-        call_args = helper._client.get_news.call_args
-        request = call_args.kwargs["request_params"]
-        assert request.symbols is None
+        request = helper._client.get_news.call_args.kwargs["request_params"]
+        for attr, value in expected.items():
+            assert getattr(request, attr) == value
 
 
 class TestGetNewsForSymbol:
     """Tests for get_news_for_symbol convenience method."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_news_for_symbol(self, mock_news_set):
+    def test_get_news_for_symbol(self, news_helper_with_mocks, mock_news_set):
         """Test getting news for a single symbol."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         articles = helper.get_news_for_symbol("AAPL", days_back=7)
@@ -234,10 +248,9 @@ class TestGetNewsForSymbol:
 class TestGetLatestNews:
     """Tests for get_latest_news method."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_latest_news_with_symbols(self, mock_news_set):
+    def test_get_latest_news_with_symbols(self, news_helper_with_mocks, mock_news_set):
         """Test getting latest news for specific symbols."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         articles = helper.get_latest_news(symbols=["AAPL", "MSFT"], limit=5)
@@ -249,10 +262,9 @@ class TestGetLatestNews:
         assert request.limit == 5
         assert request.sort == "desc"
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_latest_news_all_symbols(self, mock_news_set):
+    def test_get_latest_news_all_symbols(self, news_helper_with_mocks, mock_news_set):
         """Test getting latest news for all symbols."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         articles = helper.get_latest_news(limit=10)
@@ -266,10 +278,9 @@ class TestGetLatestNews:
 class TestGetBreakingNews:
     """Tests for get_breaking_news method."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_breaking_news(self, mock_news_set):
+    def test_get_breaking_news(self, news_helper_with_mocks, mock_news_set):
         """Test getting breaking news from the last hour."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         articles = helper.get_breaking_news(hours_back=1, limit=10)
@@ -280,10 +291,9 @@ class TestGetBreakingNews:
         assert request.limit == 10
         assert request.exclude_contentless is True
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_breaking_news_with_symbols(self, mock_news_set):
+    def test_get_breaking_news_with_symbols(self, news_helper_with_mocks, mock_news_set):
         """Test getting breaking news for specific symbols."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         helper.get_breaking_news(symbols=["TSLA"], hours_back=2)
@@ -296,10 +306,9 @@ class TestGetBreakingNews:
 class TestSearchNews:
     """Tests for search_news method."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_search_news(self, mock_news_set):
+    def test_search_news(self, news_helper_with_mocks, mock_news_set):
         """Test searching for news articles."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         articles = helper.search_news(["NVDA"], days_back=30, limit=100)
@@ -315,10 +324,9 @@ class TestSearchNews:
 class TestGetMultiSymbolNews:
     """Tests for get_multi_symbol_news method."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_get_multi_symbol_news(self, mock_news_set):
+    def test_get_multi_symbol_news(self, news_helper_with_mocks, mock_news_set):
         """Test getting news for multiple symbols."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         helper._client.get_news = MagicMock(return_value=mock_news_set)
 
         symbols = ["AAPL", "MSFT", "GOOGL", "AMZN"]
@@ -330,14 +338,44 @@ class TestGetMultiSymbolNews:
         assert request.symbols == "AAPL,MSFT,GOOGL,AMZN"
         assert request.limit == 50
 
+    def test_stream_search_news(self, news_helper_with_mocks, _news_objects):
+        """Test streaming search yields NewsArticles lazily."""
+        helper = news_helper_with_mocks
+        helper._client.iter_news = MagicMock(
+            return_value=iter(_news_objects)
+        )
+
+        articles = helper.stream_search_news(["AAPL", "TSLA"], days_back=30, limit=100)
+        helper._client.iter_news.assert_not_called()
+
+        assert [a.headline for a in articles] == [
+            "Apple announces new iPhone",
+            "Tesla reports strong earnings",
+        ]
+        request = helper._client.iter_news.call_args[0][0]
+        assert request.symbols == "AAPL,TSLA"
+        assert request.limit == 100
+
+    @pytest.mark.asyncio
+    async def test_aget_multi_symbol_news(self, news_helper_with_mocks, mock_news_set):
+        """Test async multi-symbol news uses a single request."""
+        helper = news_helper_with_mocks
+        helper._client.get_news = MagicMock(return_value=mock_news_set)
+
+        articles = await helper.aget_multi_symbol_news(["AAPL", "MSFT"], days_back=1)
+
+        assert len(articles) == 2
+        assert helper._client.get_news.call_count == 1
+        request = helper._client.get_news.call_args.kwargs["request_params"]
+        assert request.symbols == "AAPL,MSFT"
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_empty_news_response(self):
+    def test_empty_news_response(self, news_helper_with_mocks):
         """Test handling empty news response."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         empty_news_set = MagicMock(spec=NewsSet)
         empty_news_set.data = {"news": []}
         helper._client.get_news = MagicMock(return_value=empty_news_set)
@@ -346,10 +384,9 @@ class TestEdgeCases:
 
         assert len(articles) == 0
 
-    @patch.dict(os.environ, {"APCA_API_KEY_ID": "test_key", "APCA_API_SECRET_KEY": "test_secret"})
-    def test_news_without_news_key(self):
+    def test_news_without_news_key(self, news_helper_with_mocks):
         """Test handling response without 'news' key."""
-        helper = NewsHelper()
+        helper = news_helper_with_mocks
         news_set = MagicMock(spec=NewsSet)
         news_set.data = {}
         helper._client.get_news = MagicMock(return_value=news_set)
@@ -1,11 +1,24 @@
 """Tests for the OptionHelper simplified API."""
 
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
+from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
+from alpaca.common.rest import get_shared_session
 from alpaca.data import OptionHelper, OptionData
 from alpaca.data.historical.option import OptionHistoricalDataClient
+from alpaca.data.option_helper import (
+    MAX_CONCURRENT_REQUESTS,
+    MAX_SYMBOLS_PER_REQUEST,
+    _parse_timestamp,
+)
 
 
 def test_parse_option_symbol_call():
@@ -48,6 +61,55 @@ def test_parse_option_symbol_invalid():
     assert result["strike"] is None
 
 
+def test_parse_option_symbol_invalid_date():
+    """Test a symbol with an impossible expiration date is treated as invalid."""
+    result = OptionHelper._parse_option_symbol("AAPL251317C00150000")
+
+    assert result["underlying"] == "AAPL251317C00150000"
+    assert result["expiration"] is None
+    assert result["strike"] is None
+
+
+def test_parse_option_symbol_reuses_expiration():
+    """Test contracts sharing an expiration share one parsed datetime."""
+    call = OptionHelper._parse_option_symbol("AAPL250117C00150000")
+    put = OptionHelper._parse_option_symbol("AAPL250117P00145000")
+
+    assert call["expiration"] is put["expiration"]
+
+
+def test_parse_option_symbol_returns_independent_dicts():
+    """Test cached parses still hand each caller its own dict."""
+    first = OptionHelper._parse_option_symbol("AAPL250117C00150000")
+    first["strike"] = 0.0
+
+    second = OptionHelper._parse_option_symbol("AAPL250117C00150000")
+    assert second["strike"] == 150.0
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-11-09T15:30:00Z", datetime(2024, 11, 9, 15, 30, tzinfo=timezone.utc)),
+        (
+            "2024-11-09T15:30:00.123456789Z",
+            datetime(2024, 11, 9, 15, 30, 0, 123456, tzinfo=timezone.utc),
+        ),
+        (
+            "2024-11-09T15:30:00.5Z",
+            datetime(2024, 11, 9, 15, 30, 0, 500000, tzinfo=timezone.utc),
+        ),
+        (
+            "2024-11-09T10:30:00-05:00",
+            datetime(2024, 11, 9, 15, 30, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_parse_timestamp(value, expected):
+    """Test API timestamps parse to UTC datetimes, including the fallback path."""
+    assert _parse_timestamp(value) == expected
+
+
 @pytest.fixture
 def option_helper():
     """Create an OptionHelper instance for testing."""
@@ -61,6 +123,15 @@ def test_option_helper_initialization(option_helper):
     assert isinstance(option_helper._client, OptionHistoricalDataClient)
 
 
+def test_option_helper_pool_fits_concurrent_batches(option_helper):
+    """Test the default session can hold one connection per parallel batch."""
+    session = option_helper._client._session
+    assert session is get_shared_session()
+
+    adapter = session.get_adapter("https://data.alpaca.markets")
+    assert adapter._pool_maxsize >= MAX_CONCURRENT_REQUESTS
+
+
 def test_option_helper_env_vars(monkeypatch):
     """Test OptionHelper reads from environment variables."""
     # Set environment variables
@@ -137,6 +208,9 @@ def test_get_option_single(reqmock, option_helper: OptionHelper):
     assert data.bid_size == 100
     assert data.ask_size == 50
     assert data.last_size == 25
+    assert data.timestamp == datetime(
+        2024, 11, 9, 15, 30, 0, 123456, tzinfo=timezone.utc
+    )
     assert data.volume is None  # Not in snapshot
     assert data.open_interest is None  # Not in snapshot
 
@@ -275,6 +349,64 @@ def test_get_options_multiple(reqmock, option_helper: OptionHelper):
     assert reqmock.called_once
 
 
+def test_get_options_batches_long_symbol_lists(option_helper: OptionHelper):
+    """Test symbol lists over the per-request cap are split into batches."""
+    symbols = [f"SPY250117C{i:08d}" for i in range(MAX_SYMBOLS_PER_REQUEST * 2 + 50)]
+
+    with patch.object(
+        option_helper._client,
+        "get_option_snapshot",
+        side_effect=lambda request: {
+            s: {"impliedVolatility": 0.2} for s in request.symbol_or_symbols
+        },
+    ) as mock_snapshot:
+        data_list = option_helper.get_options(symbols)
+
+    assert [data.symbol for data in data_list] == symbols
+    batch_sizes = sorted(
+        len(c[0][0].symbol_or_symbols) for c in mock_snapshot.call_args_list
+    )
+    assert batch_sizes == [50, MAX_SYMBOLS_PER_REQUEST, MAX_SYMBOLS_PER_REQUEST]
+
+
+def test_get_option_coalesces_concurrent_lookups(option_helper: OptionHelper):
+    """Test concurrent lookups of one symbol share a single request."""
+    symbol = "AAPL250117C00150000"
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_get_options(symbols):
+        started.set()
+        release.wait(timeout=5)
+        return [OptionData(symbol=symbols[0], bid=1.0, ask=1.2)]
+
+    with patch.object(
+        option_helper, "get_options", side_effect=slow_get_options
+    ) as mock_get_options:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(option_helper.get_option, symbol)
+            started.wait(timeout=5)
+            others = [
+                executor.submit(option_helper.get_option, symbol) for _ in range(3)
+            ]
+            time.sleep(0.05)
+            release.set()
+            results = [first.result()] + [f.result() for f in others]
+
+    assert mock_get_options.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert option_helper._inflight == {}
+
+
+def test_get_option_clears_failed_lookup(option_helper: OptionHelper):
+    """Test a failed lookup is cleared so the next call retries."""
+    with patch.object(option_helper, "get_options", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            option_helper.get_option("AAPL250117C00150000")
+
+    assert option_helper._inflight == {}
+
+
 def test_get_options_empty_list(option_helper: OptionHelper):
     """Test getting options with empty list."""
     data_list = option_helper.get_options([])
@@ -316,6 +448,22 @@ def test_get_options_partial_results(reqmock, option_helper: OptionHelper):
     assert data_list[0].symbol == "AAPL250117C00150000"
 
 
+def test_get_options_skips_snapshots_without_data(option_helper: OptionHelper):
+    """Test contracts whose snapshot has no quote, trade or greeks are skipped."""
+    snapshots = {
+        "AAPL250117C00150000": {"latestTrade": {"p": 12.6, "s": 1}},
+        "AAPL250117C00300000": {},
+        "AAPL250117C00310000": None,
+    }
+
+    with patch.object(
+        option_helper._client, "get_option_snapshot", return_value=snapshots
+    ):
+        data_list = option_helper.get_options(list(snapshots))
+
+    assert [data.symbol for data in data_list] == ["AAPL250117C00150000"]
+
+
 def test_get_option_chain(reqmock, option_helper: OptionHelper):
     """Test getting an entire option chain."""
     underlying = "AAPL"
@@ -415,6 +563,145 @@ def test_get_option_chain_no_expiration_filter(reqmock, option_helper: OptionHel
     assert expirations == [datetime(2024, 12, 20), datetime(2025, 1, 17)]
 
 
+def test_get_option_chain_cached(reqmock, option_helper: OptionHelper):
+    """Test repeated chain lookups are served from cache until invalidated."""
+    underlying = "SPY"
+
+    reqmock.get(
+        f"https://data.alpaca.markets/v1beta1/options/snapshots/{underlying}",
+        text="""
+        {
+            "snapshots": {
+                "SPY241220C00450000": {
+                    "latestQuote": {"ap": 5.50, "as": 100, "ax": "N", "bp": 5.45, "bs": 150, "bx": "N", "c": "A", "t": "2024-11-09T15:30:00Z"}
+                }
+            }
+        }
+        """,
+    )
+
+    first = option_helper.get_option_chain(underlying)
+    second = option_helper.get_option_chain(underlying)
+
+    assert first == second
+    assert reqmock.call_count == 1
+
+    option_helper.invalidate_chain(underlying)
+    option_helper.get_option_chain(underlying)
+    assert reqmock.call_count == 2
+
+    # Expired entries are fetched again
+    with patch("alpaca.data.option_helper.time.monotonic", return_value=float("inf")):
+        option_helper.get_option_chain(underlying)
+    assert reqmock.call_count == 3
+
+
+def test_iter_option_chain(reqmock, option_helper: OptionHelper):
+    """Test streaming a chain filters contracts and leaves the cache untouched."""
+    underlying = "SPY"
+
+    reqmock.get(
+        f"https://data.alpaca.markets/v1beta1/options/snapshots/{underlying}",
+        text="""
+        {
+            "snapshots": {
+                "SPY241220C00450000": {
+                    "latestQuote": {"ap": 5.50, "as": 100, "ax": "N", "bp": 5.45, "bs": 150, "bx": "N", "c": "A", "t": "2024-11-09T15:30:00Z"}
+                },
+                "SPY241220P00450000": {},
+                "SPY250117C00450000": {
+                    "latestQuote": {"ap": 7.25, "as": 80, "ax": "N", "bp": 7.20, "bs": 120, "bx": "N", "c": "A", "t": "2024-11-09T15:30:00Z"}
+                }
+            }
+        }
+        """,
+    )
+
+    contracts = option_helper.iter_option_chain(
+        underlying, expiration=datetime(2024, 12, 20)
+    )
+    assert reqmock.call_count == 0
+
+    assert [opt.symbol for opt in contracts] == ["SPY241220C00450000"]
+    assert not option_helper._chain_cache
+
+
+def test_get_option_chain_cache_is_thread_safe(option_helper: OptionHelper):
+    """Test threads can share one helper's chain cache while it is invalidated."""
+    underlyings = ["SPY", "QQQ", "AAPL", "MSFT"]
+
+    def scan(i):
+        underlying = underlyings[i % len(underlyings)]
+        if i % 7 == 0:
+            option_helper.invalidate_chain(underlying)
+        return option_helper.get_option_chain(underlying)
+
+    with patch.object(option_helper, "_fetch_option_chain", return_value=[]):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(scan, range(400)))
+
+    assert results == [[]] * 400
+    assert set(option_helper._chain_cache) <= {(u, None) for u in underlyings}
+
+
+def test_get_option_chain_df(reqmock, option_helper: OptionHelper):
+    """Test getting an option chain as a DataFrame."""
+    underlying = "SPY"
+
+    reqmock.get(
+        f"https://data.alpaca.markets/v1beta1/options/snapshots/{underlying}",
+        text="""
+        {
+            "snapshots": {
+                "SPY250221P00450000": {
+                    "greeks": {"delta": -0.4512, "gamma": 0.0198, "rho": -0.0823, "theta": -0.0598, "vega": 0.2134},
+                    "impliedVolatility": 0.2401,
+                    "latestQuote": {"ap": 5.50, "as": 100, "ax": "N", "bp": 5.20, "bs": 150, "bx": "N", "c": "A", "t": "2024-11-09T15:30:00Z"}
+                },
+                "SPY250221C00450000": {
+                    "latestQuote": {"ap": 7.25, "as": 80, "ax": "N", "bp": 7.20, "bs": 120, "bx": "N", "c": "A", "t": "2024-11-09T15:30:00Z"}
+                }
+            }
+        }
+        """,
+    )
+
+    df = option_helper.get_option_chain_df(underlying)
+
+    assert len(df) == 2
+    assert df.loc["SPY250221P00450000", "option_type"] == "put"
+    assert df.loc["SPY250221P00450000", "strike"] == 450.0
+    assert df["delta"].dtype == float
+    # Columns with no data at all are still numeric, not object
+    assert df["volume"].dtype == float
+    assert df["volume"].isna().all()
+    puts = df[(df["option_type"] == "put") & (df["delta"].abs() > 0.4)]
+    assert list(puts.index) == ["SPY250221P00450000"]
+
+
+def test_analyze_chain(option_helper: OptionHelper):
+    """Test chain analytics are computed per contract with NaN for gaps."""
+    chain = [
+        OptionData(
+            symbol="SPY250221C00450000", strike=450.0, bid=7.20, ask=7.30, delta=0.5
+        ),
+        OptionData(symbol="SPY250221P00500000", strike=500.0),
+    ]
+    with patch.object(option_helper, "get_option_chain", return_value=chain):
+        df = option_helper.get_option_chain_df("SPY")
+
+    stats = OptionHelper.analyze_chain(df, spot=450.0)
+
+    call = stats.loc["SPY250221C00450000"]
+    assert call["moneyness"] == 0.0
+    assert call["spread"] == pytest.approx(0.10)
+    assert call["spread_pct"] == pytest.approx(0.10 / 7.25)
+    assert call["delta_dollars"] == pytest.approx(0.5 * 450.0 * 100)
+    assert stats.loc["SPY250221P00500000", "moneyness"] < 0
+    assert pd.isna(stats.loc["SPY250221P00500000", "spread"])
+    assert "moneyness" not in df.columns
+
+
 def test_get_option_chain_empty(reqmock, option_helper: OptionHelper):
     """Test getting option chain with no results."""
     underlying = "INVALID"
@@ -429,6 +716,21 @@ def test_get_option_chain_empty(reqmock, option_helper: OptionHelper):
     assert chain == []
 
 
+def test_option_data_is_immutable():
+    """Test OptionData can't be modified, so cached chains stay intact."""
+    data = OptionData(symbol="TEST250117C00100000", bid=10.0, ask=10.50)
+
+    with pytest.raises(FrozenInstanceError):
+        data.bid = 11.0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_option_data_uses_slots():
+    """Test OptionData doesn't carry a per-instance __dict__."""
+    data = OptionData(symbol="TEST250117C00100000")
+    assert not hasattr(data, "__dict__")
+
+
 def test_option_data_mid_calculation():
     """Test that mid price is calculated correctly."""
     data = OptionData(
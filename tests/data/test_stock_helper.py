@@ -2,90 +2,111 @@
 Tests for StockHelper simplified stock data API.
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from alpaca.data.models import Bar, BarSet, Quote, QuoteSet, Snapshot, Trade, TradeSet
+from alpaca.data.models import Bar, Quote
 from alpaca.data.stock_helper import (
+    MAX_SYMBOLS_PER_REQUEST,
     BarData,
     QuoteData,
     SnapshotData,
     StockHelper,
     TradeData,
+    bars_to_arrays,
 )
-from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+from alpaca.data.timeframe import TimeFrameUnit
 
 
 # ==================== Fixtures ====================
 
+# The model fixtures are SimpleNamespace stand-ins rather than spec'd
+# MagicMocks: the helpers only read their attributes.
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_bar():
-    """Create a mock Bar object."""
-    bar = MagicMock(spec=Bar)
-    bar.timestamp = datetime(2025, 1, 1, 10, 0, 0)
-    bar.open = "500.00"
-    bar.high = "505.00"
-    bar.low = "499.00"
-    bar.close = "503.00"
-    bar.volume = "1000000"
-    bar.trade_count = "5000"
-    bar.vwap = "502.00"
-    return bar
+    """Create a stand-in Bar object."""
+    return SimpleNamespace(
+        timestamp=datetime(2025, 1, 1, 10, 0, 0),
+        open="500.00",
+        high="505.00",
+        low="499.00",
+        close="503.00",
+        volume="1000000",
+        trade_count="5000",
+        vwap="502.00",
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_quote():
-    """Create a mock Quote object."""
-    quote = MagicMock(spec=Quote)
-    quote.timestamp = datetime(2025, 1, 1, 10, 0, 0)
-    quote.bid_price = "502.50"
-    quote.bid_size = "100"
-    quote.ask_price = "502.75"
-    quote.ask_size = "200"
-    quote.conditions = ["A", "B"]
-    return quote
+    """Create a stand-in Quote object."""
+    return SimpleNamespace(
+        timestamp=datetime(2025, 1, 1, 10, 0, 0),
+        bid_price="502.50",
+        bid_size="100",
+        ask_price="502.75",
+        ask_size="200",
+        conditions=["A", "B"],
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_trade():
-    """Create a mock Trade object."""
-    trade = MagicMock(spec=Trade)
-    trade.timestamp = datetime(2025, 1, 1, 10, 0, 0)
-    trade.price = "502.60"
-    trade.size = "100"
-    trade.conditions = ["@"]
-    trade.exchange = "V"
-    return trade
+    """Create a stand-in Trade object."""
+    return SimpleNamespace(
+        timestamp=datetime(2025, 1, 1, 10, 0, 0),
+        price="502.60",
+        size="100",
+        conditions=["@"],
+        exchange="V",
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_snapshot(mock_bar, mock_quote, mock_trade):
-    """Create a mock Snapshot object."""
-    snapshot = MagicMock(spec=Snapshot)
-    snapshot.latest_bar = mock_bar
-    snapshot.latest_quote = mock_quote
-    snapshot.latest_trade = mock_trade
-    snapshot.prev_daily_bar = mock_bar
-    return snapshot
+    """Create a stand-in Snapshot object."""
+    return SimpleNamespace(
+        latest_bar=mock_bar,
+        latest_quote=mock_quote,
+        latest_trade=mock_trade,
+        prev_daily_bar=mock_bar,
+    )
 
 
-@pytest.fixture
-def stock_helper_with_mocks():
-    """Create StockHelper with mocked client."""
+@pytest.fixture(autouse=True, scope="module")
+def _stock_env():
+    """Install test API keys once for every test in this module."""
     with patch.dict(
         os.environ,
-        {
-            "ALPACA_API_KEY": "test_api_key",
-            "ALPACA_SECRET_KEY": "test_secret_key",
-        },
+        {"ALPACA_API_KEY": "test_api_key", "ALPACA_SECRET_KEY": "test_secret_key"},
     ):
-        helper = StockHelper()
-        helper.client = MagicMock()
-        return helper
+        yield
+
+
+@pytest.fixture(scope="session")
+def _stock_helper_session():
+    """Build one StockHelper for the whole test session."""
+    with patch(
+        "alpaca.data.stock_helper.StockHistoricalDataClient",
+        lambda **kwargs: MagicMock(),
+    ):
+        return StockHelper(api_key="test_api_key", secret_key="test_secret_key")
+
+
+@pytest.fixture
+def stock_helper_with_mocks(_stock_helper_session):
+    """Return the shared StockHelper with a fresh mocked client."""
+    _stock_helper_session.client = MagicMock()
+    return _stock_helper_session
 
 
 # ==================== Initialization Tests ====================
@@ -99,15 +120,8 @@ def test_init_with_explicit_credentials():
 
 def test_init_from_environment():
     """Test initialization from environment variables."""
-    with patch.dict(
-        os.environ,
-        {
-            "ALPACA_API_KEY": "env_key",
-            "ALPACA_SECRET_KEY": "env_secret",
-        },
-    ):
-        helper = StockHelper()
-        assert helper.client is not None
+    helper = StockHelper()
+    assert helper.client is not None
 
 
 def test_init_missing_credentials():
@@ -119,51 +133,47 @@ def test_init_missing_credentials():
             StockHelper()
 
 
-# ==================== Timeframe Parsing Tests ====================
-
-
-def test_parse_timeframe_minutes(stock_helper_with_mocks):
-    """Test parsing minute timeframes."""
-    tf = stock_helper_with_mocks._parse_timeframe("1Min")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Minute
-
-    tf = stock_helper_with_mocks._parse_timeframe("5Min")
-    assert tf.amount == 5
+def test_init_shares_session_between_helpers():
+    """Test that helpers reuse one pooled session by default."""
+    first = StockHelper(api_key="test_key", secret_key="test_secret")
+    second = StockHelper(api_key="test_key", secret_key="test_secret")
+    assert first.client._session is second.client._session
 
 
-def test_parse_timeframe_hours(stock_helper_with_mocks):
-    """Test parsing hour timeframes."""
-    tf = stock_helper_with_mocks._parse_timeframe("1H")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Hour
-
-    tf = stock_helper_with_mocks._parse_timeframe("1Hour")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Hour
-
+# ==================== Timeframe Parsing Tests ====================
 
-def test_parse_timeframe_days(stock_helper_with_mocks):
-    """Test parsing day timeframes."""
-    tf = stock_helper_with_mocks._parse_timeframe("1D")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Day
 
-    tf = stock_helper_with_mocks._parse_timeframe("1Day")
-    assert tf.amount == 1
+@pytest.mark.parametrize(
+    "timeframe,amount,unit",
+    [
+        ("1Min", 1, TimeFrameUnit.Minute),
+        ("5Min", 5, TimeFrameUnit.Minute),
+        ("1H", 1, TimeFrameUnit.Hour),
+        ("1Hour", 1, TimeFrameUnit.Hour),
+        ("1D", 1, TimeFrameUnit.Day),
+        ("1Day", 1, TimeFrameUnit.Day),
+        ("1W", 1, TimeFrameUnit.Week),
+    ],
+)
+def test_parse_timeframe(stock_helper_with_mocks, timeframe, amount, unit):
+    """Test parsing supported timeframe strings."""
+    tf = stock_helper_with_mocks._parse_timeframe(timeframe)
+    assert tf.amount == amount
+    assert tf.unit == unit
 
 
-def test_parse_timeframe_weeks(stock_helper_with_mocks):
-    """Test parsing week timeframes."""
-    tf = stock_helper_with_mocks._parse_timeframe("1W")
-    assert tf.amount == 1
-    assert tf.unit == TimeFrameUnit.Week
+@pytest.mark.parametrize("timeframe", ["invalid", "60Min"])
+def test_parse_timeframe_invalid(stock_helper_with_mocks, timeframe):
+    """Test parsing invalid or out-of-range timeframes raises error."""
+    with pytest.raises(ValueError, match="Invalid timeframe"):
+        stock_helper_with_mocks._parse_timeframe(timeframe)
 
 
-def test_parse_timeframe_invalid(stock_helper_with_mocks):
-    """Test parsing invalid timeframe raises error."""
-    with pytest.raises(ValueError, match="Invalid timeframe"):
-        stock_helper_with_mocks._parse_timeframe("invalid")
+def test_parse_timeframe_reuses_parsed_value(stock_helper_with_mocks):
+    """Test repeated timeframe strings are parsed once."""
+    first = stock_helper_with_mocks._parse_timeframe("15Min")
+    assert stock_helper_with_mocks._parse_timeframe("15Min") is first
+    assert first.value == "15Min"
 
 
 # ==================== Latest Data Tests ====================
@@ -199,6 +209,28 @@ def test_get_latest_quotes_multi(stock_helper_with_mocks, mock_quote):
     assert all(isinstance(q, QuoteData) for q in quotes.values())
 
 
+def test_get_latest_quotes_converts_on_access(stock_helper_with_mocks, mock_quote):
+    """Test only the quotes that are read get converted, once each."""
+    stock_helper_with_mocks.client.get_stock_latest_quote.return_value = {
+        "SPY": mock_quote,
+        "QQQ": mock_quote,
+    }
+
+    with patch.object(
+        QuoteData, "from_quote", wraps=QuoteData.from_quote
+    ) as from_quote:
+        quotes = stock_helper_with_mocks.get_latest_quotes(["SPY", "QQQ"])
+        assert list(quotes) == ["SPY", "QQQ"]
+        from_quote.assert_not_called()
+
+        assert quotes["SPY"] is quotes["SPY"]
+        assert quotes["SPY"].symbol == "SPY"
+        from_quote.assert_called_once()
+
+    with pytest.raises(KeyError):
+        quotes["IWM"]
+
+
 def test_get_latest_bar(stock_helper_with_mocks, mock_bar):
     """Test get_latest_bar."""
     stock_helper_with_mocks.client.get_stock_latest_bar.return_value = {
@@ -244,6 +276,49 @@ def test_get_bars(stock_helper_with_mocks, mock_bar):
     assert bars[0].symbol == "SPY"
 
 
+def test_get_bars_arrays(stock_helper_with_mocks, mock_bar):
+    """Test bars are returned as contiguous numpy columns."""
+    mock_response = MagicMock()
+    mock_response.data = {"SPY": [mock_bar, mock_bar]}
+    stock_helper_with_mocks.client.get_stock_bars.return_value = mock_response
+
+    cols = stock_helper_with_mocks.get_bars_arrays("SPY", timeframe="1H", days_back=1)
+
+    assert cols["close"].dtype == np.float64
+    assert cols["close"].tolist() == [503.0, 503.0]
+    assert cols["trade_count"].tolist() == [5000.0, 5000.0]
+    assert cols["timestamp"][0] == np.datetime64("2025-01-01T10:00:00")
+
+
+def test_bars_to_arrays_missing_values(mock_bar):
+    """Test missing trade counts and VWAPs become NaN."""
+    bar = BarData.from_bar("SPY", mock_bar)
+    bar.trade_count = None
+    bar.vwap = None
+
+    cols = bars_to_arrays([bar])
+
+    assert cols["open"].tolist() == [500.0]
+    assert np.isnan(cols["trade_count"][0])
+    assert np.isnan(cols["vwap"][0])
+
+
+def test_iter_bars(stock_helper_with_mocks, mock_bar):
+    """Test iter_bars yields BarData lazily from the client iterator."""
+    stock_helper_with_mocks.client.iter_stock_bars.return_value = iter(
+        [mock_bar, mock_bar, mock_bar]
+    )
+
+    bars = stock_helper_with_mocks.iter_bars("SPY", timeframe="1Min", days_back=1)
+
+    stock_helper_with_mocks.client.iter_stock_bars.assert_not_called()
+    bars = list(bars)
+    assert len(bars) == 3
+    assert all(isinstance(b, BarData) for b in bars)
+    request = stock_helper_with_mocks.client.iter_stock_bars.call_args[0][0]
+    assert request.timeframe.unit == TimeFrameUnit.Minute
+
+
 def test_get_bars_with_dates(stock_helper_with_mocks, mock_bar):
     """Test get_bars with specific start/end dates."""
     mock_response = MagicMock()
@@ -343,6 +418,47 @@ def test_get_snapshots_multi(stock_helper_with_mocks, mock_snapshot):
     assert all(isinstance(s, SnapshotData) for s in snapshots.values())
 
 
+def test_get_snapshots_batches_long_symbol_lists(
+    stock_helper_with_mocks, mock_snapshot
+):
+    """Test symbol lists over the per-request cap are split into batches."""
+    symbols = [f"SYM{i}" for i in range(MAX_SYMBOLS_PER_REQUEST * 2 + 50)]
+    stock_helper_with_mocks.client.get_stock_snapshot.side_effect = lambda request: {
+        symbol: mock_snapshot for symbol in request.symbol_or_symbols
+    }
+
+    snapshots = stock_helper_with_mocks.get_snapshots(symbols)
+
+    assert list(snapshots) == symbols
+    batch_sizes = sorted(
+        len(c[0][0].symbol_or_symbols)
+        for c in stock_helper_with_mocks.client.get_stock_snapshot.call_args_list
+    )
+    assert batch_sizes == [50, MAX_SYMBOLS_PER_REQUEST, MAX_SYMBOLS_PER_REQUEST]
+
+
+# ==================== Async Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_async_fetches_gather(stock_helper_with_mocks, mock_bar, mock_snapshot):
+    """Test async variants can be gathered concurrently."""
+    mock_response = MagicMock()
+    mock_response.data = {"SPY": [mock_bar, mock_bar]}
+    stock_helper_with_mocks.client.get_stock_bars.return_value = mock_response
+    stock_helper_with_mocks.client.get_stock_snapshot.return_value = {
+        "SPY": mock_snapshot,
+    }
+
+    bars, snapshots = await asyncio.gather(
+        stock_helper_with_mocks.aget_bars("SPY", timeframe="1H", days_back=1),
+        stock_helper_with_mocks.aget_snapshots(["SPY"]),
+    )
+
+    assert len(bars) == 2
+    assert isinstance(snapshots["SPY"], SnapshotData)
+
+
 # ==================== Dataclass Tests ====================
 
 
@@ -360,6 +476,13 @@ def test_bar_data_from_bar(mock_bar):
     assert bar_data.vwap == 502.00
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_bar_data_uses_slots(mock_bar):
+    """Test bar dataclasses don't carry a per-instance __dict__."""
+    bar = BarData.from_bar("SPY", mock_bar)
+    assert not hasattr(bar, "__dict__")
+
+
 def test_quote_data_from_quote(mock_quote):
     """Test QuoteData.from_quote."""
     quote_data = QuoteData.from_quote("SPY", mock_quote)
@@ -4,8 +4,10 @@ Tests for AccountHelper simplified account management API.
 
 import os
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from alpaca.trading.account_helper import (
@@ -19,49 +21,52 @@ from alpaca.trading.models import PortfolioHistory, TradeAccount
 
 # ==================== Fixtures ====================
 
+# The model fixtures are SimpleNamespace stand-ins rather than spec'd
+# MagicMocks: the helpers only read their attributes.
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_trade_account():
-    """Create a mock TradeAccount object."""
-    account = MagicMock(spec=TradeAccount)
-    account.account_number = "123456789"
-    account.status = AccountStatus.ACTIVE
-    account.cash = "50000.00"
-    account.buying_power = "100000.00"
-    account.portfolio_value = "75000.00"
-    account.equity = "75000.00"
-    account.long_market_value = "25000.00"
-    account.short_market_value = "0.00"
-    account.initial_margin = "10000.00"
-    account.maintenance_margin = "5000.00"
-    account.last_equity = "74000.00"
-    account.multiplier = "2"
-    account.pattern_day_trader = False
-    account.daytrade_count = 2
-    account.daytrading_buying_power = "100000.00"
-    account.regt_buying_power = "50000.00"
-    account.trading_blocked = False
-    account.account_blocked = False
-    account.created_at = datetime(2024, 1, 1, 10, 0, 0)
-    return account
+    """Create a stand-in TradeAccount object."""
+    return SimpleNamespace(
+        account_number="123456789",
+        status=AccountStatus.ACTIVE,
+        cash="50000.00",
+        buying_power="100000.00",
+        portfolio_value="75000.00",
+        equity="75000.00",
+        long_market_value="25000.00",
+        short_market_value="0.00",
+        initial_margin="10000.00",
+        maintenance_margin="5000.00",
+        last_equity="74000.00",
+        multiplier="2",
+        pattern_day_trader=False,
+        daytrade_count=2,
+        daytrading_buying_power="100000.00",
+        regt_buying_power="50000.00",
+        trading_blocked=False,
+        account_blocked=False,
+        created_at=datetime(2024, 1, 1, 10, 0, 0),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_portfolio_history():
-    """Create a mock PortfolioHistory object."""
-    history = MagicMock(spec=PortfolioHistory)
-    history.timestamp = [1704110400, 1704196800, 1704283200]  # 3 days
-    history.equity = [70000.0, 72000.0, 75000.0]
-    history.profit_loss = [0.0, 2000.0, 5000.0]
-    history.profit_loss_pct = [0.0, 0.0286, 0.0714]
-    history.base_value = 70000.0
-    history.timeframe = "1D"
-    return history
+    """Create a stand-in PortfolioHistory object."""
+    return SimpleNamespace(
+        timestamp=[1704110400, 1704196800, 1704283200],  # 3 days
+        equity=[70000.0, 72000.0, 75000.0],
+        profit_loss=[0.0, 2000.0, 5000.0],
+        profit_loss_pct=[0.0, 0.0286, 0.0714],
+        base_value=70000.0,
+        timeframe="1D",
+    )
 
 
-@pytest.fixture
-def account_helper_with_mocks():
-    """Create AccountHelper with mocked client."""
+@pytest.fixture(autouse=True, scope="module")
+def _account_env():
+    """Install test API keys once for every test in this module."""
     with patch.dict(
         os.environ,
         {
@@ -70,9 +75,26 @@ def account_helper_with_mocks():
             "ALPACA_PAPER": "true",
         },
     ):
-        helper = AccountHelper()
-        helper.client = MagicMock()
-        return helper
+        yield
+
+
+@pytest.fixture(scope="session")
+def _account_helper_session():
+    """Build one AccountHelper for the whole test session."""
+    with patch(
+        "alpaca.trading.account_helper.TradingClient", lambda **kwargs: MagicMock()
+    ):
+        return AccountHelper(
+            api_key="test_api_key", secret_key="test_secret_key", paper=True
+        )
+
+
+@pytest.fixture
+def account_helper_with_mocks(_account_helper_session):
+    """Return the shared AccountHelper with a fresh mocked client and no cache."""
+    _account_helper_session.client = MagicMock()
+    _account_helper_session.invalidate_account()
+    return _account_helper_session
 
 
 # ==================== Initialization Tests ====================
@@ -92,46 +114,24 @@ def test_init_with_explicit_credentials():
 
 def test_init_from_environment():
     """Test initialization from environment variables."""
-    with patch.dict(
-        os.environ,
-        {
-            "ALPACA_API_KEY": "env_key",
-            "ALPACA_SECRET_KEY": "env_secret",
-            "ALPACA_PAPER": "true",
-        },
-    ):
-        helper = AccountHelper()
-        assert helper.api_key == "env_key"
-        assert helper.secret_key == "env_secret"
-        assert helper.paper is True
+    helper = AccountHelper()
+    assert helper.api_key == "test_api_key"
+    assert helper.secret_key == "test_secret_key"
+    assert helper.paper is True
 
 
-def test_init_paper_defaults_true():
+def test_init_paper_defaults_true(monkeypatch):
     """Test that paper trading defaults to True."""
-    with patch.dict(
-        os.environ,
-        {
-            "ALPACA_API_KEY": "key",
-            "ALPACA_SECRET_KEY": "secret",
-        },
-        clear=True,
-    ):
-        helper = AccountHelper()
-        assert helper.paper is True
+    monkeypatch.delenv("ALPACA_PAPER")
+    helper = AccountHelper()
+    assert helper.paper is True
 
 
-def test_init_paper_from_env_false():
+def test_init_paper_from_env_false(monkeypatch):
     """Test paper trading from environment variable false."""
-    with patch.dict(
-        os.environ,
-        {
-            "ALPACA_API_KEY": "key",
-            "ALPACA_SECRET_KEY": "secret",
-            "ALPACA_PAPER": "false",
-        },
-    ):
-        helper = AccountHelper()
-        assert helper.paper is False
+    monkeypatch.setenv("ALPACA_PAPER", "false")
+    helper = AccountHelper()
+    assert helper.paper is False
 
 
 def test_init_missing_credentials():
@@ -197,28 +197,34 @@ def test_get_equity(account_helper_with_mocks, mock_trade_account):
 # ==================== PDT Tests ====================
 
 
-def test_is_pattern_day_trader_false(account_helper_with_mocks, mock_trade_account):
+def test_is_pattern_day_trader_false(
+    account_helper_with_mocks, mock_trade_account, monkeypatch
+):
     """Test PDT status when not a pattern day trader."""
-    mock_trade_account.pattern_day_trader = False
+    monkeypatch.setattr(mock_trade_account, "pattern_day_trader", False)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     is_pdt = account_helper_with_mocks.is_pattern_day_trader()
     assert is_pdt is False
 
 
-def test_is_pattern_day_trader_true(account_helper_with_mocks, mock_trade_account):
+def test_is_pattern_day_trader_true(
+    account_helper_with_mocks, mock_trade_account, monkeypatch
+):
     """Test PDT status when flagged as pattern day trader."""
-    mock_trade_account.pattern_day_trader = True
+    monkeypatch.setattr(mock_trade_account, "pattern_day_trader", True)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     is_pdt = account_helper_with_mocks.is_pattern_day_trader()
     assert is_pdt is True
 
 
-def test_get_day_trades_remaining(account_helper_with_mocks, mock_trade_account):
+def test_get_day_trades_remaining(
+    account_helper_with_mocks, mock_trade_account, monkeypatch
+):
     """Test getting remaining day trades."""
-    mock_trade_account.pattern_day_trader = False
-    mock_trade_account.daytrade_count = 2
+    monkeypatch.setattr(mock_trade_account, "pattern_day_trader", False)
+    monkeypatch.setattr(mock_trade_account, "daytrade_count", 2)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     remaining = account_helper_with_mocks.get_day_trades_remaining()
@@ -226,11 +232,11 @@ def test_get_day_trades_remaining(account_helper_with_mocks, mock_trade_account)
 
 
 def test_get_day_trades_remaining_zero_for_pdt(
-    account_helper_with_mocks, mock_trade_account
+    account_helper_with_mocks, mock_trade_account, monkeypatch
 ):
     """Test that PDT accounts get 0 remaining day trades."""
-    mock_trade_account.pattern_day_trader = True
-    mock_trade_account.daytrade_count = 5
+    monkeypatch.setattr(mock_trade_account, "pattern_day_trader", True)
+    monkeypatch.setattr(mock_trade_account, "daytrade_count", 5)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     remaining = account_helper_with_mocks.get_day_trades_remaining()
@@ -238,11 +244,11 @@ def test_get_day_trades_remaining_zero_for_pdt(
 
 
 def test_get_day_trades_remaining_all_available(
-    account_helper_with_mocks, mock_trade_account
+    account_helper_with_mocks, mock_trade_account, monkeypatch
 ):
     """Test remaining day trades when none used."""
-    mock_trade_account.pattern_day_trader = False
-    mock_trade_account.daytrade_count = 0
+    monkeypatch.setattr(mock_trade_account, "pattern_day_trader", False)
+    monkeypatch.setattr(mock_trade_account, "daytrade_count", 0)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     remaining = account_helper_with_mocks.get_day_trades_remaining()
@@ -261,36 +267,78 @@ def test_get_multiplier(account_helper_with_mocks, mock_trade_account):
     assert isinstance(mult, float)
 
 
-def test_is_blocked_false(account_helper_with_mocks, mock_trade_account):
+def test_is_blocked_false(
+    account_helper_with_mocks, mock_trade_account, monkeypatch
+):
     """Test account is not blocked."""
-    mock_trade_account.account_blocked = False
-    mock_trade_account.trading_blocked = False
+    monkeypatch.setattr(mock_trade_account, "account_blocked", False)
+    monkeypatch.setattr(mock_trade_account, "trading_blocked", False)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     blocked = account_helper_with_mocks.is_blocked()
     assert blocked is False
 
 
-def test_is_blocked_account(account_helper_with_mocks, mock_trade_account):
+def test_is_blocked_account(
+    account_helper_with_mocks, mock_trade_account, monkeypatch
+):
     """Test account is blocked."""
-    mock_trade_account.account_blocked = True
-    mock_trade_account.trading_blocked = False
+    monkeypatch.setattr(mock_trade_account, "account_blocked", True)
+    monkeypatch.setattr(mock_trade_account, "trading_blocked", False)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     blocked = account_helper_with_mocks.is_blocked()
     assert blocked is True
 
 
-def test_is_blocked_trading(account_helper_with_mocks, mock_trade_account):
+def test_is_blocked_trading(
+    account_helper_with_mocks, mock_trade_account, monkeypatch
+):
     """Test trading is blocked."""
-    mock_trade_account.account_blocked = False
-    mock_trade_account.trading_blocked = True
+    monkeypatch.setattr(mock_trade_account, "account_blocked", False)
+    monkeypatch.setattr(mock_trade_account, "trading_blocked", True)
     account_helper_with_mocks.client.get_account.return_value = mock_trade_account
 
     blocked = account_helper_with_mocks.is_blocked()
     assert blocked is True
 
 
+def test_account_getters_share_one_fetch(
+    account_helper_with_mocks, mock_trade_account
+):
+    """Test getters called together reuse one account fetch until invalidated."""
+    account_helper_with_mocks.client.get_account.return_value = mock_trade_account
+
+    account_helper_with_mocks.get_cash()
+    account_helper_with_mocks.get_buying_power()
+    account_helper_with_mocks.is_pattern_day_trader()
+    assert account_helper_with_mocks.client.get_account.call_count == 1
+
+    account_helper_with_mocks.invalidate_account()
+    account_helper_with_mocks.get_cash()
+    assert account_helper_with_mocks.client.get_account.call_count == 2
+
+    # Expired entries are fetched again
+    with patch(
+        "alpaca.trading._cache.time.monotonic", return_value=float("inf")
+    ):
+        account_helper_with_mocks.get_equity()
+    assert account_helper_with_mocks.client.get_account.call_count == 3
+
+
+def test_account_cache_disabled(mock_trade_account):
+    """Test a zero TTL fetches the account on every call."""
+    helper = AccountHelper(
+        api_key="test_key", secret_key="test_secret", account_cache_ttl=0
+    )
+    helper.client = MagicMock()
+    helper.client.get_account.return_value = mock_trade_account
+
+    helper.get_cash()
+    helper.get_cash()
+    assert helper.client.get_account.call_count == 2
+
+
 # ==================== Portfolio History Tests ====================
 
 
@@ -410,6 +458,35 @@ def test_portfolio_history_handles_none_pct():
     assert history_data.profit_loss_pct[1] == 0.0286
 
 
+def test_portfolio_history_returns(mock_portfolio_history):
+    """Test per-point returns are computed from equity."""
+    history_data = PortfolioHistoryData.from_portfolio_history(
+        mock_portfolio_history
+    )
+
+    returns = history_data.returns()
+
+    assert returns.tolist() == pytest.approx([2000.0 / 70000.0, 3000.0 / 72000.0])
+
+
+def test_portfolio_history_max_drawdown():
+    """Test max drawdown is measured from the running peak."""
+    history = PortfolioHistoryData(
+        timestamps=[],
+        equity=[0.0, 100.0, 120.0, None, 90.0, 110.0],
+        profit_loss=[],
+        profit_loss_pct=[],
+        base_value=100.0,
+    )
+
+    assert history.max_drawdown() == pytest.approx(-0.25)
+    assert np.isnan(history.returns()[0])
+
+    rising = PortfolioHistoryData([], [100.0, 110.0], [], [], 100.0)
+    assert rising.max_drawdown() == 0.0
+    assert PortfolioHistoryData([], [], [], [], 0.0).max_drawdown() == 0.0
+
+
 # ==================== Edge Cases ====================
 
 
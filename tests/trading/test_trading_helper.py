@@ -3,14 +3,19 @@ Tests for TradingHelper simplified trading API.
 """
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from uuid import UUID
 
 import pytest
+from requests import Session
 
 from alpaca.trading.enums import (
+    AccountStatus,
     OrderClass,
     OrderSide,
     OrderStatus,
@@ -19,120 +24,157 @@ from alpaca.trading.enums import (
     QueryOrderStatus,
     TimeInForce,
 )
-from alpaca.trading.models import Order, Position, TradeAccount
+from alpaca.trading.models import TradeAccount
 from alpaca.trading.trading_helper import OrderInfo, PositionInfo, TradingHelper
 
+_ASSET_ID = UUID("12345678-1234-1234-1234-123456789012")
+_ORDER_ID = UUID("87654321-4321-4321-4321-210987654321")
+
 
 # ==================== Fixtures ====================
 
+# Position and Order fixtures are SimpleNamespace stand-ins rather than
+# spec'd MagicMocks: the helpers only read their attributes.
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_position():
-    """Create a mock Position object."""
-    position = MagicMock(spec=Position)
-    position.symbol = "SPY"
-    position.qty = "10"
-    position.market_value = "5000.00"
-    position.avg_entry_price = "500.00"
-    position.current_price = "500.00"
-    position.unrealized_pl = "0.00"
-    position.unrealized_plpc = "0.00"
-    position.side = PositionSide.LONG
-    position.cost_basis = "5000.00"
-    position.asset_id = UUID("12345678-1234-1234-1234-123456789012")
-    return position
+    """Create a stand-in Position object."""
+    return SimpleNamespace(
+        symbol="SPY",
+        qty="10",
+        market_value="5000.00",
+        avg_entry_price="500.00",
+        current_price="500.00",
+        unrealized_pl="0.00",
+        unrealized_plpc="0.00",
+        side=PositionSide.LONG,
+        cost_basis="5000.00",
+        asset_id=_ASSET_ID,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_order():
-    """Create a mock Order object."""
-    order = MagicMock(spec=Order)
-    order.id = UUID("87654321-4321-4321-4321-210987654321")
-    order.symbol = "SPY"
-    order.qty = "10"
-    order.notional = None
-    order.side = OrderSide.BUY
-    order.type = OrderType.MARKET
-    order.status = OrderStatus.NEW
-    order.filled_qty = "0"
-    order.filled_avg_price = None
-    order.limit_price = None
-    order.stop_price = None
-    order.submitted_at = datetime(2025, 1, 1, 10, 0, 0)
-    order.filled_at = None
-    order.order_class = None
-    return order
+    """Create a stand-in Order object."""
+    return SimpleNamespace(
+        id=_ORDER_ID,
+        symbol="SPY",
+        qty="10",
+        notional=None,
+        side=OrderSide.BUY,
+        type=OrderType.MARKET,
+        status=OrderStatus.NEW,
+        filled_qty="0",
+        filled_avg_price=None,
+        limit_price=None,
+        stop_price=None,
+        submitted_at=datetime(2025, 1, 1, 10, 0, 0),
+        filled_at=None,
+        order_class=None,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_account():
-    """Create a mock TradeAccount object."""
-    account = MagicMock(spec=TradeAccount)
+    """Create a mock TradeAccount object.
+
+    Kept as a spec'd Mock: TradingHelper checks isinstance(account,
+    TradeAccount) before reading balances.
+    """
+    account = Mock(spec=TradeAccount)
+    account.account_number = "123456789"
+    account.status = AccountStatus.ACTIVE
     account.buying_power = "100000.00"
     account.cash = "50000.00"
     account.portfolio_value = "150000.00"
+    account.equity = "150000.00"
+    account.long_market_value = "100000.00"
+    account.short_market_value = "0.00"
+    account.initial_margin = "0.00"
+    account.maintenance_margin = "0.00"
+    account.last_equity = "149000.00"
+    account.multiplier = "2"
+    account.pattern_day_trader = False
+    account.daytrade_count = 0
+    account.daytrading_buying_power = "100000.00"
+    account.regt_buying_power = "100000.00"
+    account.trading_blocked = False
+    account.account_blocked = False
+    account.created_at = datetime(2024, 1, 1, 10, 0, 0)
     return account
 
 
-@pytest.fixture
-def trading_helper_with_mocks():
-    """Create TradingHelper with mocked client."""
-    with patch.dict(
-        os.environ,
-        {
-            "ALPACA_API_KEY": "test_api_key",
-            "ALPACA_SECRET_KEY": "test_secret_key",
-            "ALPACA_PAPER": "true",
-        },
+@pytest.fixture(scope="session")
+def _trading_helper_session():
+    """Build one TradingHelper for the whole test session."""
+    with patch(
+        "alpaca.trading.trading_helper.TradingClient", lambda **kwargs: Mock()
     ):
-        helper = TradingHelper()
-        helper.client = MagicMock()
-        return helper
+        return TradingHelper(
+            api_key="test_api_key", secret_key="test_secret_key", paper=True
+        )
+
+
+@pytest.fixture
+def trading_helper_with_mocks(_trading_helper_session):
+    """Return the shared TradingHelper with a fresh mocked client and no cache."""
+    _trading_helper_session.client = Mock()
+    _trading_helper_session.invalidate_account()
+    return _trading_helper_session
 
 
 # ==================== Initialization Tests ====================
 
 
-def test_init_with_explicit_credentials():
-    """Test initialization with explicit credentials."""
+@pytest.mark.parametrize(
+    "env,kwargs,expected_paper,raises",
+    [
+        (
+            {},
+            {"api_key": "test_key", "secret_key": "test_secret", "paper": True},
+            True,
+            None,
+        ),
+        (
+            {
+                "ALPACA_API_KEY": "env_key",
+                "ALPACA_SECRET_KEY": "env_secret",
+                "ALPACA_PAPER": "false",
+            },
+            {},
+            False,
+            None,
+        ),
+        (
+            {"ALPACA_API_KEY": "test_key", "ALPACA_SECRET_KEY": "test_secret"},
+            {},
+            True,
+            None,
+        ),
+        ({}, {}, None, "API key and secret key must be provided"),
+    ],
+    ids=["explicit", "environment", "paper_default", "missing_credentials"],
+)
+def test_init(env, kwargs, expected_paper, raises):
+    """Test initialization from arguments and environment variables."""
+    with patch.dict(os.environ, env, clear=True):
+        if raises:
+            with pytest.raises(ValueError, match=raises):
+                TradingHelper(**kwargs)
+        else:
+            helper = TradingHelper(**kwargs)
+            assert helper.is_paper is expected_paper
+            assert helper.client is not None
+
+
+def test_init_uses_provided_session():
+    """Test that a caller-supplied session is used for requests."""
+    session = Session()
     helper = TradingHelper(
-        api_key="test_key", secret_key="test_secret", paper=True
+        api_key="test_key", secret_key="test_secret", session=session
     )
-    assert helper.is_paper is True
-    assert helper.client is not None
-
-
-def test_init_from_environment():
-    """Test initialization from environment variables."""
-    with patch.dict(
-        os.environ,
-        {
-            "ALPACA_API_KEY": "env_key",
-            "ALPACA_SECRET_KEY": "env_secret",
-            "ALPACA_PAPER": "false",
-        },
-    ):
-        helper = TradingHelper()
-        assert helper.is_paper is False
-
-
-def test_init_paper_defaults_true():
-    """Test that paper mode defaults to True if not specified."""
-    with patch.dict(
-        os.environ,
-        {"ALPACA_API_KEY": "test_key", "ALPACA_SECRET_KEY": "test_secret"},
-        clear=True,
-    ):
-        helper = TradingHelper()
-        assert helper.is_paper is True
-
-
-def test_init_missing_credentials():
-    """Test initialization fails without credentials."""
-    with patch.dict(os.environ, {}, clear=True):
-        with pytest.raises(ValueError, match="API key and secret key must be provided"):
-            TradingHelper()
-
+    assert helper.client._session is session
 
 # ==================== Market Order Tests ====================
 
@@ -168,9 +210,9 @@ def test_buy_market_requires_qty_or_notional(trading_helper_with_mocks):
         trading_helper_with_mocks.buy_market("SPY", qty=10, notional=1000)
 
 
-def test_sell_market(trading_helper_with_mocks, mock_order):
+def test_sell_market(trading_helper_with_mocks, mock_order, monkeypatch):
     """Test sell_market."""
-    mock_order.side = OrderSide.SELL
+    monkeypatch.setattr(mock_order, "side", OrderSide.SELL)
     trading_helper_with_mocks.client.submit_order.return_value = mock_order
 
     order_info = trading_helper_with_mocks.sell_market("SPY", qty=5)
@@ -182,76 +224,73 @@ def test_sell_market(trading_helper_with_mocks, mock_order):
 # ==================== Limit Order Tests ====================
 
 
-def test_buy_limit(trading_helper_with_mocks, mock_order):
-    """Test buy_limit."""
-    mock_order.type = OrderType.LIMIT
-    mock_order.limit_price = "450.00"
+@pytest.mark.parametrize(
+    "method,side,limit_price",
+    [
+        ("buy_limit", OrderSide.BUY, 450.00),
+        ("sell_limit", OrderSide.SELL, 550.00),
+    ],
+)
+def test_limit_orders(
+    trading_helper_with_mocks, mock_order, monkeypatch, method, side, limit_price
+):
+    """Test buy_limit and sell_limit."""
+    monkeypatch.setattr(mock_order, "side", side)
+    monkeypatch.setattr(mock_order, "type", OrderType.LIMIT)
+    monkeypatch.setattr(mock_order, "limit_price", str(limit_price))
     trading_helper_with_mocks.client.submit_order.return_value = mock_order
 
-    order_info = trading_helper_with_mocks.buy_limit(
-        "SPY", qty=10, limit_price=450.00
+    order_info = getattr(trading_helper_with_mocks, method)(
+        "SPY", qty=10, limit_price=limit_price
     )
 
+    assert order_info.side == side.value
     assert order_info.type == "limit"
-    assert order_info.limit_price == 450.00
+    assert order_info.limit_price == limit_price
     trading_helper_with_mocks.client.submit_order.assert_called_once()
 
 
-def test_sell_limit(trading_helper_with_mocks, mock_order):
-    """Test sell_limit."""
-    mock_order.side = OrderSide.SELL
-    mock_order.type = OrderType.LIMIT
-    mock_order.limit_price = "550.00"
-    trading_helper_with_mocks.client.submit_order.return_value = mock_order
-
-    order_info = trading_helper_with_mocks.sell_limit(
-        "SPY", qty=10, limit_price=550.00
-    )
-
-    assert order_info.side == "sell"
-    assert order_info.limit_price == 550.00
-
-
 # ==================== Bracket Order Tests ====================
 
 
-def test_buy_with_bracket_both_stops(trading_helper_with_mocks, mock_order):
-    """Test buy_with_bracket with both stop loss and take profit."""
-    mock_order.order_class = OrderClass.BRACKET
+@pytest.mark.parametrize(
+    "method,kwargs,side",
+    [
+        (
+            "buy_with_bracket",
+            {"stop_loss": 450.00, "take_profit": 550.00},
+            OrderSide.BUY,
+        ),
+        ("buy_with_bracket", {"stop_loss": 450.00}, OrderSide.BUY),
+        ("buy_with_bracket", {"take_profit": 550.00}, OrderSide.BUY),
+        (
+            "buy_with_bracket",
+            {"stop_loss": 450.00, "stop_loss_limit": 445.00},
+            OrderSide.BUY,
+        ),
+        (
+            "sell_with_bracket",
+            {"stop_loss": 550.00, "take_profit": 450.00},
+            OrderSide.SELL,
+        ),
+    ],
+    ids=["both_stops", "stop_loss_only", "take_profit_only", "stop_limit", "sell"],
+)
+def test_bracket_orders(
+    trading_helper_with_mocks, mock_order, monkeypatch, method, kwargs, side
+):
+    """Test buy_with_bracket and sell_with_bracket submit bracket orders."""
+    monkeypatch.setattr(mock_order, "side", side)
+    monkeypatch.setattr(mock_order, "order_class", OrderClass.BRACKET)
     trading_helper_with_mocks.client.submit_order.return_value = mock_order
 
-    order_info = trading_helper_with_mocks.buy_with_bracket(
-        "SPY", qty=10, stop_loss=450.00, take_profit=550.00
-    )
+    order_info = getattr(trading_helper_with_mocks, method)("SPY", qty=10, **kwargs)
 
+    assert order_info.side == side.value
     assert order_info.order_class == "bracket"
     trading_helper_with_mocks.client.submit_order.assert_called_once()
 
 
-def test_buy_with_bracket_stop_loss_only(trading_helper_with_mocks, mock_order):
-    """Test buy_with_bracket with only stop loss."""
-    mock_order.order_class = OrderClass.BRACKET
-    trading_helper_with_mocks.client.submit_order.return_value = mock_order
-
-    order_info = trading_helper_with_mocks.buy_with_bracket(
-        "SPY", qty=10, stop_loss=450.00
-    )
-
-    assert order_info.order_class == "bracket"
-
-
-def test_buy_with_bracket_take_profit_only(trading_helper_with_mocks, mock_order):
-    """Test buy_with_bracket with only take profit."""
-    mock_order.order_class = OrderClass.BRACKET
-    trading_helper_with_mocks.client.submit_order.return_value = mock_order
-
-    order_info = trading_helper_with_mocks.buy_with_bracket(
-        "SPY", qty=10, take_profit=550.00
-    )
-
-    assert order_info.order_class == "bracket"
-
-
 def test_buy_with_bracket_requires_at_least_one(trading_helper_with_mocks):
     """Test buy_with_bracket requires at least one stop."""
     with pytest.raises(
@@ -260,18 +299,6 @@ def test_buy_with_bracket_requires_at_least_one(trading_helper_with_mocks):
         trading_helper_with_mocks.buy_with_bracket("SPY", qty=10)
 
 
-def test_buy_with_bracket_stop_limit(trading_helper_with_mocks, mock_order):
-    """Test buy_with_bracket with stop-limit order."""
-    mock_order.order_class = OrderClass.BRACKET
-    trading_helper_with_mocks.client.submit_order.return_value = mock_order
-
-    order_info = trading_helper_with_mocks.buy_with_bracket(
-        "SPY", qty=10, stop_loss=450.00, stop_loss_limit=445.00
-    )
-
-    assert order_info.order_class == "bracket"
-
-
 def test_buy_with_bracket_stop_limit_requires_stop(trading_helper_with_mocks):
     """Test stop_loss_limit requires stop_loss."""
     with pytest.raises(ValueError, match="stop_loss is required"):
@@ -280,20 +307,6 @@ def test_buy_with_bracket_stop_limit_requires_stop(trading_helper_with_mocks):
         )
 
 
-def test_sell_with_bracket(trading_helper_with_mocks, mock_order):
-    """Test sell_with_bracket."""
-    mock_order.side = OrderSide.SELL
-    mock_order.order_class = OrderClass.BRACKET
-    trading_helper_with_mocks.client.submit_order.return_value = mock_order
-
-    order_info = trading_helper_with_mocks.sell_with_bracket(
-        "SPY", qty=10, stop_loss=550.00, take_profit=450.00
-    )
-
-    assert order_info.side == "sell"
-    assert order_info.order_class == "bracket"
-
-
 # ==================== Position Tests ====================
 
 
@@ -322,32 +335,31 @@ def test_get_all_positions(trading_helper_with_mocks, mock_position):
     assert all(isinstance(p, PositionInfo) for p in positions)
 
 
-def test_close_position_all(trading_helper_with_mocks, mock_order):
-    """Test close_position (all shares)."""
-    trading_helper_with_mocks.client.close_position.return_value = mock_order
-
-    order_info = trading_helper_with_mocks.close_position("SPY")
-
-    assert order_info.symbol == "SPY"
-    trading_helper_with_mocks.client.close_position.assert_called_once_with("SPY")
-
-
-def test_close_position_qty(trading_helper_with_mocks, mock_order):
-    """Test close_position with specific quantity."""
-    trading_helper_with_mocks.client.close_position.return_value = mock_order
-
-    order_info = trading_helper_with_mocks.close_position("SPY", qty=5)
-
-    assert order_info.symbol == "SPY"
-
-
-def test_close_position_percentage(trading_helper_with_mocks, mock_order):
-    """Test close_position with percentage."""
+@pytest.mark.parametrize(
+    "kwargs,close_options",
+    [
+        ({}, None),
+        ({"qty": 5}, {"qty": "5", "percentage": None}),
+        ({"percentage": 50}, {"qty": None, "percentage": "50"}),
+    ],
+    ids=["all", "qty", "percentage"],
+)
+def test_close_position(trading_helper_with_mocks, mock_order, kwargs, close_options):
+    """Test close_position for all shares, a quantity or a percentage."""
     trading_helper_with_mocks.client.close_position.return_value = mock_order
 
-    order_info = trading_helper_with_mocks.close_position("SPY", percentage=50)
+    order_info = trading_helper_with_mocks.close_position("SPY", **kwargs)
 
     assert order_info.symbol == "SPY"
+    trading_helper_with_mocks.client.close_position.assert_called_once()
+    call_args = trading_helper_with_mocks.client.close_position.call_args[0]
+    assert call_args[0] == "SPY"
+    if close_options is None:
+        assert len(call_args) == 1
+    else:
+        request = call_args[1]
+        assert request.qty == close_options["qty"]
+        assert request.percentage == close_options["percentage"]
 
 
 def test_close_position_cannot_specify_both(trading_helper_with_mocks):
@@ -361,7 +373,7 @@ def test_close_position_cannot_specify_both(trading_helper_with_mocks):
 
 def test_get_order(trading_helper_with_mocks, mock_order):
     """Test get_order."""
-    order_id = UUID("87654321-4321-4321-4321-210987654321")
+    order_id = _ORDER_ID
     trading_helper_with_mocks.client.get_order_by_id.return_value = mock_order
 
     order_info = trading_helper_with_mocks.get_order(order_id)
@@ -392,11 +404,26 @@ def test_get_orders_with_filters(trading_helper_with_mocks, mock_order):
     )
 
     assert len(orders) == 1
+    request = trading_helper_with_mocks.client.get_orders.call_args[0][0]
+    assert request.status == QueryOrderStatus.ALL
+    assert request.symbols == ["SPY"]
+    assert request.limit == 10
+
+
+def test_get_orders_reuses_request(trading_helper_with_mocks):
+    """Test repeated get_orders calls reuse the same request object."""
+    trading_helper_with_mocks.client.get_orders.return_value = []
+
+    trading_helper_with_mocks.get_orders(symbols=["SPY", "QQQ"])
+    trading_helper_with_mocks.get_orders(symbols=["SPY", "QQQ"])
+
+    first, second = trading_helper_with_mocks.client.get_orders.call_args_list
+    assert first[0][0] is second[0][0]
 
 
 def test_cancel_order(trading_helper_with_mocks):
     """Test cancel_order."""
-    order_id = UUID("87654321-4321-4321-4321-210987654321")
+    order_id = _ORDER_ID
 
     trading_helper_with_mocks.cancel_order(order_id)
 
@@ -442,6 +469,77 @@ def test_get_portfolio_value(trading_helper_with_mocks, mock_account):
     assert value == 150000.00
 
 
+def test_get_account(trading_helper_with_mocks, mock_account):
+    """Test get_account returns simplified account info."""
+    trading_helper_with_mocks.client.get_account.return_value = mock_account
+
+    account = trading_helper_with_mocks.get_account()
+
+    assert account.cash == 50000.00
+    assert account.buying_power == 100000.00
+    assert account.portfolio_value == 150000.00
+
+
+def test_account_getters_share_one_request(trading_helper_with_mocks, mock_account):
+    """Test account getters reuse a single cached account fetch."""
+    trading_helper_with_mocks.client.get_account.return_value = mock_account
+
+    trading_helper_with_mocks.get_cash()
+    trading_helper_with_mocks.get_buying_power()
+    trading_helper_with_mocks.get_portfolio_value()
+    trading_helper_with_mocks.get_account()
+
+    trading_helper_with_mocks.client.get_account.assert_called_once()
+
+
+def test_account_cache_expires(trading_helper_with_mocks, mock_account):
+    """Test account data is fetched again after the TTL passes."""
+    trading_helper_with_mocks.client.get_account.return_value = mock_account
+
+    with patch("alpaca.trading._cache.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        trading_helper_with_mocks.get_cash()
+        ttl = trading_helper_with_mocks._account_cache.ttl
+        monotonic.return_value = 100.0 + ttl + 1
+        trading_helper_with_mocks.get_cash()
+
+    assert trading_helper_with_mocks.client.get_account.call_count == 2
+
+
+def test_concurrent_account_lookups_coalesce(trading_helper_with_mocks, mock_account):
+    """Test concurrent account lookups share a single request."""
+    def slow_get_account():
+        time.sleep(0.05)
+        return mock_account
+
+    trading_helper_with_mocks.client.get_account.side_effect = slow_get_account
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(trading_helper_with_mocks.get_cash),
+            executor.submit(trading_helper_with_mocks.get_buying_power),
+            executor.submit(trading_helper_with_mocks.get_portfolio_value),
+        ]
+        results = [f.result() for f in futures]
+
+    assert results == [50000.00, 100000.00, 150000.00]
+    trading_helper_with_mocks.client.get_account.assert_called_once()
+
+
+def test_account_cache_dropped_after_order(
+    trading_helper_with_mocks, mock_account, mock_order
+):
+    """Test submitting an order drops the cached account."""
+    trading_helper_with_mocks.client.get_account.return_value = mock_account
+    trading_helper_with_mocks.client.submit_order.return_value = mock_order
+
+    trading_helper_with_mocks.get_buying_power()
+    trading_helper_with_mocks.buy_market("SPY", qty=1)
+    trading_helper_with_mocks.get_buying_power()
+
+    assert trading_helper_with_mocks.client.get_account.call_count == 2
+
+
 # ==================== Dataclass Tests ====================
 
 
@@ -455,19 +553,15 @@ def test_position_info_from_position(mock_position):
     assert position_info.side == "long"
 
 
-def test_position_info_handles_none_values():
+def test_position_info_handles_none_values(mock_position):
     """Test PositionInfo handles None values gracefully."""
-    position = MagicMock(spec=Position)
-    position.symbol = "SPY"
-    position.qty = None
-    position.market_value = None
-    position.avg_entry_price = None
-    position.current_price = None
-    position.unrealized_pl = None
-    position.unrealized_plpc = None
-    position.side = None
-    position.cost_basis = None
-    position.asset_id = UUID("12345678-1234-1234-1234-123456789012")
+    # Everything but the symbol and asset id is missing
+    position = SimpleNamespace(
+        **{
+            field: (value if field in ("symbol", "asset_id") else None)
+            for field, value in vars(mock_position).items()
+        }
+    )
 
     position_info = PositionInfo.from_position(position)
 
@@ -487,23 +581,15 @@ def test_order_info_from_order(mock_order):
     assert order_info.status == "new"
 
 
-def test_order_info_handles_none_values():
+def test_order_info_handles_none_values(mock_order):
     """Test OrderInfo handles None values gracefully."""
-    order = MagicMock(spec=Order)
-    order.id = UUID("87654321-4321-4321-4321-210987654321")
-    order.symbol = None
-    order.qty = None
-    order.notional = None
-    order.side = None
-    order.type = None
-    order.status = None
-    order.filled_qty = None
-    order.filled_avg_price = None
-    order.limit_price = None
-    order.stop_price = None
-    order.submitted_at = datetime(2025, 1, 1, 10, 0, 0)
-    order.filled_at = None
-    order.order_class = None
+    # Everything but the id and submission time is missing
+    order = SimpleNamespace(
+        **{
+            field: (value if field in ("id", "submitted_at") else None)
+            for field, value in vars(mock_order).items()
+        }
+    )
 
     order_info = OrderInfo.from_order(order)
 